@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from typing import Dict, Optional
 
+import numpy as np
 import pandas as pd
 
 try:
@@ -9,6 +13,12 @@ try:
 except Exception:  # noqa: BLE001
     gpd = None  # type: ignore
 
+try:
+    import polars as pl  # type: ignore
+except Exception:  # noqa: BLE001
+    pl = None  # type: ignore
+
+import shapely
 from shapely.geometry import Polygon
 import h3
 
@@ -16,6 +26,73 @@ import h3
 from pathlib import Path
 from utils.io_helpers import read_config
 
+
+# pandas aggregation names -> polars expression methods
+_POLARS_AGGS = {
+    "mean": "mean",
+    "sum": "sum",
+    "min": "min",
+    "max": "max",
+    "count": "count",
+    "median": "median",
+    "std": "std",
+    "var": "var",
+    "first": "first",
+    "last": "last",
+    "nunique": "n_unique",
+}
+# pandas skips missing values for these; polars would pick or count the nulls
+_POLARS_SKIPNA_AGGS = {"first", "last", "nunique"}
+
+# Distinct positions needed before H3 indexing is spread over worker processes,
+# and the smallest chunk handed to one worker (keeps process start-up amortized)
+_PARALLEL_MIN_POSITIONS = 200_000
+_MIN_CHUNK_POSITIONS = 50_000
+
+
+def _latlng_cells(lat: np.ndarray, lon: np.ndarray, resolution: int) -> np.ndarray:
+    latlng_to_cell = h3.latlng_to_cell if hasattr(h3, "latlng_to_cell") else h3.geo_to_h3
+    return np.array([latlng_to_cell(a, b, resolution) for a, b in zip(lat.tolist(), lon.tolist())], dtype=object)
+
+
+def _latlng_cells_parallel(lat: np.ndarray, lon: np.ndarray, resolution: int) -> np.ndarray:
+    """H3 cells for many positions, split across processes (h3-py holds the GIL per call)."""
+    n_chunks = min(os.cpu_count() or 1, len(lat) // _MIN_CHUNK_POSITIONS)
+    if len(lat) < _PARALLEL_MIN_POSITIONS or n_chunks < 2:
+        return _latlng_cells(lat, lon, resolution)
+    with ProcessPoolExecutor(max_workers=n_chunks) as ex:
+        parts = ex.map(_latlng_cells, np.array_split(lat, n_chunks), np.array_split(lon, n_chunks), [resolution] * n_chunks)
+        return np.concatenate(list(parts))
+
+
+@lru_cache(maxsize=None)
+def _hex_boundary_polygon(hex_id: str) -> Polygon:
+    # Support both h3-py v4 (cell_to_boundary) and legacy (h3_to_geo_boundary)
+    if hasattr(h3, "cell_to_boundary"):
+        boundary = h3.cell_to_boundary(hex_id)
+    else:
+        boundary = h3.h3_to_geo_boundary(hex_id)
+    # h3 returns (lat, lon); shapely expects (lon, lat)
+    coords = [(lon, lat) for lat, lon in boundary] + [(boundary[0][1], boundary[0][0])]
+    return Polygon(coords)
+
+
+def _hex_polygons(hex_ids: np.ndarray) -> np.ndarray:
+    """Build one polygon per hex id with a single vectorized Shapely call.
+
+    Cells have 5-10 boundary vertices, so rings are assembled from a flat coordinate
+    array plus per-vertex ring indices rather than a fixed (n, 6, 2) block.
+    """
+    if len(hex_ids) == 0:
+        return np.array([], dtype=object)
+    cell_to_boundary = h3.cell_to_boundary if hasattr(h3, "cell_to_boundary") else h3.h3_to_geo_boundary
+    boundaries = [cell_to_boundary(h) for h in hex_ids]
+    # h3 returns (lat, lon); shapely expects (lon, lat)
+    coords = np.array([pt for boundary in boundaries for pt in boundary], dtype=np.float64)[:, ::-1]
+    indices = np.repeat(np.arange(len(boundaries)), [len(b) for b in boundaries])
+    return shapely.polygons(shapely.linearrings(coords, indices=indices))
+
+
 class SpatialAggregator:
     def __init__(self, lat_col: Optional[str] = None, lon_col: Optional[str] = None, config_path: str | Path = "config/settings.yaml"):
         # Load config for CRS/column selection
@@ -31,7 +108,25 @@ class SpatialAggregator:
         self.wgs84_lon_col = columns.get("input_lon", "longitude")
 
     def assign_hex_ids(self, data: pd.DataFrame, resolution: int) -> pd.DataFrame:
-        df = data.copy()
+        # Shallow copy: the caller's frame is left untouched but column buffers are shared
+        df = data.copy(deep=False)
+        df["h3_hex"] = self._hex_categorical(df, resolution)
+        return df
+
+    def aggregate_to_hex(self, data: pd.DataFrame, resolution: int, agg_func: Dict[str, str], backend: str = "pandas") -> pd.DataFrame:
+        """Same result as assign_hex_ids followed by aggregate_by_hex, in one pass.
+
+        The hex key is handed to groupby directly, so no frame carrying an extra
+        column is built and only the aggregated columns are touched.
+        """
+        key = pd.Series(self._hex_categorical(data, resolution), index=data.index, name="h3_hex")
+        if backend == "polars":
+            return self._aggregate_by_hex_polars(data[list(agg_func)].assign(h3_hex=key), agg_func)
+        agg_df = data[list(agg_func)].groupby(key, observed=True).agg(agg_func).reset_index()
+        agg_df["h3_hex"] = agg_df["h3_hex"].astype(object)
+        return agg_df
+
+    def _hex_categorical(self, df: pd.DataFrame, resolution: int) -> pd.Categorical:
         # If using SWEREF99, transform to WGS84 for H3 assignment
         if self.sweref_mode and self.wgs84_lat_col in df.columns and self.wgs84_lon_col in df.columns:
             lat_col = self.wgs84_lat_col
@@ -39,44 +134,80 @@ class SpatialAggregator:
         else:
             lat_col = self.lat_col
             lon_col = self.lon_col
-        use_latlng_to_cell = hasattr(h3, "latlng_to_cell")
-        df["h3_hex"] = [
-            (
-                (h3.latlng_to_cell(lat, lon, resolution) if use_latlng_to_cell else h3.geo_to_h3(lat, lon, resolution))
-                if pd.notna(lat) and pd.notna(lon)
-                else None
-            )
-            for lat, lon in zip(df[lat_col], df[lon_col])
-        ]
-        return df
+        lat = pd.to_numeric(df[lat_col], errors="coerce").to_numpy(dtype=np.float64)
+        lon = pd.to_numeric(df[lon_col], errors="coerce").to_numpy(dtype=np.float64)
+        valid = ~(np.isnan(lat) | np.isnan(lon))
+        # h3-py has no batched cell lookup, so index each distinct position only once;
+        # interpolated tracks repeat the same coordinates for many acoustic rows.
+        # Packing (lat, lon) into one complex value lets a hash-based factorize find the
+        # distinct positions in O(n) instead of sorting the rows as np.unique(axis=0) does.
+        inverse, coords = pd.factorize(lat[valid] + 1j * lon[valid])
+        cells = _latlng_cells_parallel(coords.real, coords.imag, resolution)
+        # Store as a categorical with sorted categories: grouping then runs on integer codes
+        # (no string hashing) and yields hexes in the same sorted order as before.
+        categories = np.unique(cells) if len(cells) else np.array([], dtype=object)
+        codes = np.full(len(df), -1, dtype=np.int64)
+        codes[valid] = np.searchsorted(categories, cells)[inverse]
+        return pd.Categorical.from_codes(codes, categories=categories)
 
-    def aggregate_by_hex(self, data: pd.DataFrame, agg_func: Dict[str, str]) -> pd.DataFrame:
+    def aggregate_by_hex(self, data: pd.DataFrame, agg_func: Dict[str, str], backend: str = "pandas") -> pd.DataFrame:
         if "h3_hex" not in data.columns:
             raise ValueError("Data must contain 'h3_hex' column. Call assign_hex_ids first.")
-        agg_df = data.dropna(subset=["h3_hex"]).groupby("h3_hex").agg(agg_func).reset_index()
+        if backend == "polars":
+            return self._aggregate_by_hex_polars(data, agg_func)
+        # groupby drops missing keys itself, so no filtered copy of the frame is needed
+        agg_df = data.groupby("h3_hex", observed=True).agg(agg_func).reset_index()
+        if isinstance(agg_df["h3_hex"].dtype, pd.CategoricalDtype):
+            agg_df["h3_hex"] = agg_df["h3_hex"].astype(object)
         return agg_df
 
+    def _aggregate_by_hex_polars(self, data: pd.DataFrame, agg_func: Dict[str, str]) -> pd.DataFrame:
+        """Multi-threaded polars group-by; same output layout as the pandas path."""
+        if pl is None:
+            raise ImportError("polars is required for backend='polars'")
+        exprs = []
+        for col, func in agg_func.items():
+            method = _POLARS_AGGS.get(func)
+            if method is None:
+                raise ValueError(f"Unsupported aggregation for polars backend: {func}")
+            c = pl.col(col)
+            if func in _POLARS_SKIPNA_AGGS:
+                c = c.drop_nulls()
+            expr = getattr(c, method)()
+            if func in {"count", "nunique"}:
+                expr = expr.cast(pl.Int64)
+            exprs.append(expr.alias(col))
+        # Only hand the key and aggregated columns to polars
+        frame = pl.from_pandas(data[["h3_hex", *agg_func]])
+        agg_df = (
+            frame.lazy()
+            .with_columns(pl.col("h3_hex").cast(pl.String))
+            .drop_nulls("h3_hex")
+            .group_by("h3_hex")
+            .agg(exprs)
+            .sort("h3_hex")
+            .collect(engine="streaming")
+        )
+        return agg_df.to_pandas()
+
     def _hex_to_polygon(self, hex_id: str) -> Polygon:
-        # Support both h3-py v3 (cell_to_boundary) and legacy (h3_to_geo_boundary)
-        if hasattr(h3, "cell_to_boundary"):
-            boundary = h3.cell_to_boundary(hex_id)
-        else:
-            boundary = h3.h3_to_geo_boundary(hex_id)
-        # h3 returns (lat, lon); shapely expects (lon, lat)
-        coords = [(lon, lat) for lat, lon in boundary] + [(boundary[0][1], boundary[0][0])]
-        return Polygon(coords)
+        # Boundaries are cached per cell; shapely geometries are immutable so sharing is safe
+        return _hex_boundary_polygon(hex_id)
 
     def to_geodataframe(self, hex_data: pd.DataFrame) -> pd.DataFrame:
-        polys = [self._hex_to_polygon(h) for h in hex_data["h3_hex"]]
+        # Build each distinct cell's polygon once, then map back onto the rows
+        uniq = pd.unique(hex_data["h3_hex"])
+        poly_map = dict(zip(uniq, _hex_polygons(uniq)))
+        polys = hex_data["h3_hex"].map(poly_map).to_list()
         if gpd is not None:
             # Always use WGS84 for geometry
-            return gpd.GeoDataFrame(hex_data.copy(), geometry=polys, crs="EPSG:4326")
+            return gpd.GeoDataFrame(hex_data.copy(deep=False), geometry=polys, crs="EPSG:4326")
         # Fallback: return WKT in a pandas DataFrame
-        out = hex_data.copy()
+        out = hex_data.copy(deep=False)
         out["geometry_wkt"] = [p.wkt for p in polys]
         return out
 
     def get_hex_statistics(self, hex_data: pd.DataFrame) -> pd.DataFrame:
-        stats = hex_data.copy()
+        stats = hex_data.copy(deep=False)
         stats["sample_size"] = stats.get("count", pd.Series([None] * len(stats)))
         return stats
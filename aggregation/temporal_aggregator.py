@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from typing import Dict
+from typing import Dict, Optional
 
+import numpy as np
 import pandas as pd
 
 
@@ -9,18 +10,106 @@ class TemporalAggregator:
     def __init__(self, timestamp_col: str = "timestamp"):
         self.timestamp_col = timestamp_col
 
-    def aggregate_by_time(self, data: pd.DataFrame, interval: str, agg_func: Dict[str, str]) -> pd.DataFrame:
-        df = data.copy()
+    def _with_datetime(self, data: pd.DataFrame) -> pd.DataFrame:
+        # Already-parsed columns are used as-is; nothing is copied or re-parsed
+        if pd.api.types.is_datetime64_any_dtype(data[self.timestamp_col]):
+            return data
+        # Shallow copy so the parsed column never leaks back into the caller's frame
+        df = data.copy(deep=False)
         df[self.timestamp_col] = pd.to_datetime(df[self.timestamp_col])
-        df.set_index(self.timestamp_col, inplace=True)
-        agg_df = df.resample(interval).agg(agg_func)
-        agg_df.reset_index(inplace=True)
-        return agg_df
+        return df
+
+    def aggregate_by_time(self, data: pd.DataFrame, interval: str, agg_func: Dict[str, str]) -> pd.DataFrame:
+        df = self._with_datetime(data)
+        binned = self._mean_by_fixed_bins(df, interval, agg_func)
+        if binned is not None:
+            return binned
+        # Group on the column directly instead of a set_index/resample/reset_index round-trip
+        return df.groupby(pd.Grouper(key=self.timestamp_col, freq=interval)).agg(agg_func).reset_index()
+
+    def is_aggregated(self, data: pd.DataFrame, interval: str) -> bool:
+        """True if ``data`` already has exactly one row per ``interval`` bin, as aggregate_by_time returns.
+
+        Re-aggregating such a frame at the same interval reproduces it unchanged.
+        """
+        try:
+            offset = pd.tseries.frequencies.to_offset(interval)
+        except (TypeError, ValueError):
+            return False
+        ts_col = data[self.timestamp_col]
+        if not isinstance(offset, pd.offsets.Tick) or ts_col.dtype != np.dtype("datetime64[ns]") or ts_col.empty:
+            return False
+        ts = ts_col.to_numpy().view(np.int64)
+        if ts[0] == np.iinfo(np.int64).min:
+            return False
+        width = offset.nanos
+        day = pd.Timestamp(int(ts[0])).normalize().value
+        # Labels sit on the midnight-anchored grid and every bin in between is present
+        return (int(ts[0]) - day) % width == 0 and bool((np.diff(ts) == width).all())
+
+    def _mean_by_fixed_bins(self, df: pd.DataFrame, interval: str, agg_func: Dict[str, str]) -> Optional[pd.DataFrame]:
+        """Means over fixed-width bins via NumPy segment sums, or None when the groupby path is needed.
+
+        Covers the common plot/aggregate case (only "mean" on plain numeric columns, a
+        fixed frequency, naive ns timestamps) and reproduces pandas' bin edges: bins are
+        anchored at midnight of the first day, closed and labelled on the left, and every
+        bin between the first and last observation is returned.
+        """
+        try:
+            offset = pd.tseries.frequencies.to_offset(interval)
+        except (TypeError, ValueError):
+            return None
+        if not isinstance(offset, pd.offsets.Tick) or set(agg_func.values()) != {"mean"}:
+            return None
+        ts_col = df[self.timestamp_col]
+        if ts_col.dtype != np.dtype("datetime64[ns]"):
+            return None
+        if any(c == self.timestamp_col or df[c].dtype.kind not in "if" for c in agg_func):
+            return None
+        ts = ts_col.to_numpy().view(np.int64)
+        valid = ts != np.iinfo(np.int64).min
+        all_valid = bool(valid.all())
+        t = ts if all_valid else ts[valid]
+        if t.size == 0:
+            return None
+        width = offset.nanos
+        t_min = int(t.min())
+        day = pd.Timestamp(t_min).normalize().value
+        first = day + (t_min - day) // width * width
+        n_bins = (int(t.max()) - first) // width + 1
+        edges = first + np.arange(n_bins, dtype=np.int64) * width
+        if t.size < 2 or bool((t[1:] >= t[:-1]).all()):
+            # Sorted timestamps: each bin is a contiguous run, so sums are segment reductions
+            starts = np.searchsorted(t, edges)
+            sizes = np.diff(starts, append=t.size)
+            starts = np.minimum(starts, t.size - 1)
+
+            def reduce(values: np.ndarray) -> np.ndarray:
+                # reduceat yields the start element for empty runs; those bins have size 0
+                return np.where(sizes > 0, np.add.reduceat(values, starts), 0)
+        else:
+            bins = (t - first) // width
+
+            def reduce(values: np.ndarray) -> np.ndarray:
+                return np.bincount(bins, weights=values, minlength=n_bins)
+
+        out = {self.timestamp_col: edges.view("datetime64[ns]")}
+        counts_all = None
+        for col in agg_func:
+            values = df[col].to_numpy(dtype=np.float64, copy=False)
+            if not all_valid:
+                values = values[valid]
+            present = ~np.isnan(values)
+            if present.all():
+                if counts_all is None:
+                    counts_all = reduce(np.ones(t.size))
+                sums, counts = reduce(values), counts_all
+            else:
+                sums, counts = reduce(np.where(present, values, 0.0)), reduce(present.astype(np.float64))
+            with np.errstate(invalid="ignore", divide="ignore"):
+                out[col] = np.where(counts > 0, sums / counts, np.nan)
+        return pd.DataFrame(out)
 
     def apply_rolling_window(self, data: pd.DataFrame, window: str, agg: str = "mean") -> pd.DataFrame:
-        df = data.copy()
-        df[self.timestamp_col] = pd.to_datetime(df[self.timestamp_col])
-        df.set_index(self.timestamp_col, inplace=True)
-        rolled = getattr(df.rolling(window), agg)()
-        rolled.reset_index(inplace=True)
-        return rolled
+        df = self._with_datetime(data)
+        return getattr(df.rolling(window, on=self.timestamp_col), agg)()
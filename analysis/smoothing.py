@@ -12,6 +12,40 @@ try:
 except Exception:  # noqa: BLE001
     lowess = None  # type: ignore
 
+try:
+    import fastlowess  # type: ignore
+except Exception:  # noqa: BLE001
+    fastlowess = None  # type: ignore
+
+
+def _lowess_sorted(y_sorted: np.ndarray, x_sorted: np.ndarray, frac: float) -> np.ndarray:
+    """LOWESS on NaN-free inputs already sorted by x; prefers fastlowess when installed.
+
+    Uses Cleveland's delta shortcut with delta = 1% of the x range: local fits are only
+    computed at points spaced at least delta apart and linearly interpolated in between.
+    fastlowess is configured to match statsmodels (no boundary padding) so both
+    backends produce the same curve.
+    """
+    delta = 0.01 * float(x_sorted[-1] - x_sorted[0])
+    if fastlowess is not None:
+        model = fastlowess.Lowess(fraction=frac, iterations=3, delta=delta, boundary_policy="noboundary")
+        return np.asarray(model.fit(x_sorted, y_sorted).y, dtype=float)
+    return lowess(y_sorted, x_sorted, frac=frac, delta=delta, return_sorted=False)
+
+
+def _fill_nans_linear(y: np.ndarray) -> np.ndarray:
+    """Fill NaNs by linear interpolation over position in a single pass.
+
+    Leading/trailing NaNs take the nearest valid value (np.interp clamps at the ends),
+    which matches interpolate() followed by bfill/ffill.
+    """
+    y = np.asarray(y, dtype=float)
+    valid = ~np.isnan(y)
+    if valid.all():
+        return y
+    positions = np.arange(len(y))
+    return np.interp(positions, positions[valid], y[valid])
+
 
 class DataSmoother:
     def apply_lowess(self, data: pd.Series, frac: float = 0.1) -> pd.Series:
@@ -22,8 +56,8 @@ class DataSmoother:
         - Otherwise, fall back to positional index.
         Inputs are sorted by x before smoothing, then restored to original order.
         """
-        if lowess is None:
-            raise ImportError("statsmodels is required for LOWESS smoothing")
+        if lowess is None and fastlowess is None:
+            raise ImportError("statsmodels or fastlowess is required for LOWESS smoothing")
 
         y = data.to_numpy()
         idx = data.index
@@ -55,7 +89,7 @@ class DataSmoother:
         y_sorted = y_masked[order]
 
         # Apply LOWESS; returns y-estimates aligned to input order
-        sm_sorted = lowess(y_sorted, x_sorted, frac=frac, return_sorted=False)
+        sm_sorted = _lowess_sorted(y_sorted, x_sorted, frac)
 
         # Restore to original masked order
         sm_unsorted = np.empty_like(y_masked, dtype=float)
@@ -73,8 +107,8 @@ class DataSmoother:
         - Sorts by x before smoothing; restores to original index order.
         Returns a Series aligned to y.index (with NaNs where x/y invalid).
         """
-        if lowess is None:
-            raise ImportError("statsmodels is required for LOWESS smoothing")
+        if lowess is None and fastlowess is None:
+            raise ImportError("statsmodels or fastlowess is required for LOWESS smoothing")
         x_num = pd.to_numeric(x, errors="coerce")
         y_arr = pd.to_numeric(y, errors="coerce")
         mask = (~x_num.isna()) & (~y_arr.isna())
@@ -85,7 +119,7 @@ class DataSmoother:
         order = np.argsort(xv)
         xs = xv[order]
         ys = yv[order]
-        sm_sorted = lowess(ys, xs, frac=frac, return_sorted=False)
+        sm_sorted = _lowess_sorted(ys, xs, frac)
         sm_unsorted = np.empty_like(yv, dtype=float)
         sm_unsorted[order] = sm_sorted
         out = np.full(len(y_arr), np.nan, dtype=float)
@@ -99,13 +133,22 @@ class DataSmoother:
         w = min(window if window % 2 == 1 else window + 1, non_nan - (non_nan + 1) % 2)
         if w < 3:
             return data.copy()
-        # Fill nans via interpolation for filtering
-        s = pd.Series(y).interpolate().fillna(method="bfill").fillna(method="ffill").to_numpy()
-        sm = savgol_filter(s, window_length=w, polyorder=polyorder)
+        sm = savgol_filter(_fill_nans_linear(y), window_length=w, polyorder=polyorder)
         return pd.Series(sm, index=data.index)
 
     def apply_rolling_average(self, data: pd.Series, window: str) -> pd.Series:
-        return data.rolling(window).mean()
+        """Rolling mean; time-indexed Series take pandas' fixed-offset Cython path.
+
+        Offset windows need a monotonic index, so unsorted input is smoothed in sorted
+        order and the result is put back in the original row order.
+        """
+        if data.index.is_monotonic_increasing:
+            return data.rolling(window).mean()
+        order = np.argsort(data.index.to_numpy(), kind="stable")
+        rolled = data.iloc[order].rolling(window).mean().to_numpy()
+        out = np.empty_like(rolled)
+        out[order] = rolled
+        return pd.Series(out, index=data.index, name=data.name)
 
     def fit_spline(self, x: pd.Series, y: pd.Series, smoothing: float | None = None) -> Callable[[np.ndarray], np.ndarray]:
         mask = ~y.isna()
@@ -6,118 +6,249 @@ from typing import List
 import numpy as np
 import pandas as pd
 
+try:
+    import polars as pl  # type: ignore
+except Exception:  # noqa: BLE001
+    pl = None  # type: ignore
+
+
+_STATS_BY_TIME_COLUMNS = [
+    "timestamp", "variable", "count", "mean", "std", "min",
+    "p05", "p25", "median", "p75", "p95", "max", "missing",
+]
+
+
+def _format_stats(values: pd.Series) -> pd.Series:
+    return values.map("{:.3f}".format)
+
+
+def _format_stats_line(stats: pd.DataFrame) -> pd.Series:
+    """Render the ``count=... missing=...`` line for every row of a stats frame at once."""
+    return (
+        "count=" + stats["count"].astype(str)
+        + " mean=" + _format_stats(stats["mean"]) + " std=" + _format_stats(stats["std"])
+        + " min=" + _format_stats(stats["min"]) + " p05=" + _format_stats(stats["p05"])
+        + " p25=" + _format_stats(stats["p25"]) + " median=" + _format_stats(stats["median"])
+        + " p75=" + _format_stats(stats["p75"]) + " p95=" + _format_stats(stats["p95"])
+        + " max=" + _format_stats(stats["max"]) + " missing=" + stats["missing"].astype(str)
+    )
+
 
 class StatisticsCalculator:
-    def calculate_descriptive_stats(self, data: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    def calculate_descriptive_stats(self, data: pd.DataFrame, columns: List[str], backend: str = "pandas") -> pd.DataFrame:
+        """One row per column with count, mean, std, min, p05-p95, max and missing.
+
+        With backend="polars" every statistic of every column is computed in a single
+        multi-threaded select over the requested columns.
+        """
+        if backend == "polars":
+            return self._descriptive_stats_polars(data, columns)
         desc = {}
         for col in columns:
-            s = pd.to_numeric(data[col], errors="coerce").dropna()
-            if s.empty:
+            a = pd.to_numeric(data[col], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+            a = a[~np.isnan(a)]
+            if a.size == 0:
                 continue
-            q = s.quantile([0.05, 0.25, 0.5, 0.75, 0.95])
+            p05, p25, p50, p75, p95 = np.percentile(a, [5, 25, 50, 75, 95])
             desc[col] = {
-                "count": int(s.count()),
-                "mean": float(s.mean()),
-                "std": float(s.std(ddof=1)) if s.count() > 1 else np.nan,
-                "min": float(s.min()),
-                "p05": float(q.loc[0.05]),
-                "p25": float(q.loc[0.25]),
-                "median": float(q.loc[0.5]),
-                "p75": float(q.loc[0.75]),
-                "p95": float(q.loc[0.95]),
-                "max": float(s.max()),
+                "count": int(a.size),
+                "mean": float(a.mean()),
+                "std": float(a.std(ddof=1)) if a.size > 1 else np.nan,
+                "min": float(a.min()),
+                "p05": float(p05),
+                "p25": float(p25),
+                "median": float(p50),
+                "p75": float(p75),
+                "p95": float(p95),
+                "max": float(a.max()),
                 "missing": int(data[col].isna().sum()),
             }
         return pd.DataFrame(desc).T.reset_index().rename(columns={"index": "variable"})
 
+    def _descriptive_stats_polars(self, data: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+        if pl is None:
+            raise ImportError("polars is required for backend='polars'")
+        cols = list(dict.fromkeys(columns))
+        values = data[cols].apply(pd.to_numeric, errors="coerce")
+        exprs = []
+        for i, col in enumerate(cols):
+            c = pl.col(col)
+            exprs += [
+                c.count().alias(f"{i}_count"),
+                c.mean().alias(f"{i}_mean"),
+                c.std().alias(f"{i}_std"),
+                c.min().alias(f"{i}_min"),
+                c.quantile(0.05, "linear").alias(f"{i}_p05"),
+                c.quantile(0.25, "linear").alias(f"{i}_p25"),
+                c.median().alias(f"{i}_median"),
+                c.quantile(0.75, "linear").alias(f"{i}_p75"),
+                c.quantile(0.95, "linear").alias(f"{i}_p95"),
+                c.max().alias(f"{i}_max"),
+            ]
+        row = pl.from_pandas(values, nan_to_null=True).lazy().select(exprs).collect().row(0, named=True)
+        missing = data[cols].isna().sum()
+        stats_cols = _STATS_BY_TIME_COLUMNS[2:-1]
+        desc = {}
+        for i, col in enumerate(cols):
+            # Columns without numeric values are skipped, as in the pandas path
+            if not row[f"{i}_count"]:
+                continue
+            desc[col] = {name: row[f"{i}_{name}"] for name in stats_cols}
+            desc[col]["missing"] = int(missing[col])
+        return pd.DataFrame(desc).T.reset_index().rename(columns={"index": "variable"})
+
     def save_stats_to_file(self, stats: pd.DataFrame, output_path: Path) -> None:
+        """Save stats as readable text plus a Parquet table next to it."""
         output_path.parent.mkdir(parents=True, exist_ok=True)
+        # Columnar copy for downstream analysis; keeps dtypes, unlike the text report
+        stats.to_parquet(output_path.with_suffix(".parquet"), index=False)
         lines = ["Descriptive Statistics", "======================", ""]
-        for _, row in stats.iterrows():
-            lines.append(f"Variable: {row['variable']}")
-            lines.append(
-                (
-                    f"count={row['count']} mean={row['mean']:.3f} std={row['std']:.3f} "
-                    f"min={row['min']:.3f} p05={row['p05']:.3f} p25={row['p25']:.3f} "
-                    f"median={row['median']:.3f} p75={row['p75']:.3f} p95={row['p95']:.3f} max={row['max']:.3f} "
-                    f"missing={row['missing']}"
-                )
-            )
-            lines.append("")
+        # No column had numeric values: the frame has no statistic columns, write the header only
+        if not stats.empty:
+            # One formatted block per variable, built column-wise instead of per-row iterrows
+            blocks = "Variable: " + stats["variable"].astype(str) + "\n" + _format_stats_line(stats) + "\n"
+            lines.extend(blocks.tolist())
         output_path.write_text("\n".join(lines), encoding="utf-8")
 
     def detect_outliers(self, data: pd.DataFrame, column: str, method: str = "iqr", z_thresh: float = 3.0) -> pd.DataFrame:
-        s = pd.to_numeric(data[column], errors="coerce")
-        mask = pd.Series([False] * len(s), index=s.index)
-        if method == "iqr":
-            q1, q3 = s.quantile([0.25, 0.75])
-            iqr = q3 - q1
-            lower, upper = q1 - 1.5 * iqr, q3 + 1.5 * iqr
-            mask = (s < lower) | (s > upper)
-        elif method == "zscore":
-            z = (s - s.mean()) / s.std(ddof=0)
-            mask = z.abs() > z_thresh
-        elif method in {"modified_zscore", "modified-zscore", "mzscore"}:
-            median = s.median()
-            mad = (s - median).abs().median()
-            if mad and not np.isnan(mad):
-                modified_z = 0.6745 * (s - median) / mad
-                mask = modified_z.abs() > z_thresh
-        return data.assign(outlier=mask)
-
-    def calculate_stats_by_time(self, data: pd.DataFrame, interval: str, columns: List[str], timestamp_col: str = "timestamp") -> pd.DataFrame:
+        a = pd.to_numeric(data[column], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+        mask = np.zeros(a.shape, dtype=bool)
+        if np.isnan(a).all():
+            return self._with_outlier_column(data, mask)
+        # NaN comparisons evaluate to False, so missing values are never flagged
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if method == "iqr":
+                q1, q3 = np.nanpercentile(a, [25, 75])
+                iqr = q3 - q1
+                mask = (a < q1 - 1.5 * iqr) | (a > q3 + 1.5 * iqr)
+            elif method == "zscore":
+                z = (a - np.nanmean(a)) / np.nanstd(a)
+                mask = np.abs(z) > z_thresh
+            elif method in {"modified_zscore", "modified-zscore", "mzscore"}:
+                dev = np.abs(a - np.nanmedian(a))
+                mad = np.nanmedian(dev)
+                if mad and not np.isnan(mad):
+                    mask = 0.6745 * dev / mad > z_thresh
+        return self._with_outlier_column(data, mask)
+
+    @staticmethod
+    def _with_outlier_column(data: pd.DataFrame, mask: np.ndarray) -> pd.DataFrame:
+        # Shallow copy shares the existing column buffers; only the flag column is new
+        out = data.copy(deep=False)
+        out["outlier"] = mask
+        return out
+
+    def calculate_stats_by_time(
+        self,
+        data: pd.DataFrame,
+        interval: str,
+        columns: List[str],
+        timestamp_col: str = "timestamp",
+        backend: str = "pandas",
+    ) -> pd.DataFrame:
         """Calculate descriptive statistics for each time bin.
-        
+
         Returns a long-format DataFrame with columns:
         timestamp, variable, count, mean, std, min, p05, p25, median, p75, p95, max, missing
-        
+
         Each row represents statistics for one variable in one time bin.
+        With backend="polars" the binning runs on polars' multi-threaded group_by_dynamic;
+        calendar intervals such as "MS" or "W-SUN" have no fixed width and use pandas.
         """
         if timestamp_col not in data.columns:
             raise ValueError(f"Timestamp column '{timestamp_col}' not found in data")
-        
-        df = data.copy()
+
         # Ensure timestamp is datetime
-        if not pd.api.types.is_datetime64_any_dtype(df[timestamp_col]):
-            df[timestamp_col] = pd.to_datetime(df[timestamp_col], errors="coerce")
-        
-        # Set timestamp as index for resampling
-        df = df.set_index(timestamp_col)
-        
-        # Collect stats for each time bin
-        results = []
-        
-        for col in columns:
-            if col not in df.columns:
-                continue
-            
-            # Resample by interval and apply stats to each group
-            resampled = df[col].resample(interval)
-            
-            for timestamp, group in resampled:
-                s = pd.to_numeric(group, errors="coerce").dropna()
-                if s.empty:
-                    continue
-                
-                q = s.quantile([0.05, 0.25, 0.5, 0.75, 0.95])
-                
-                results.append({
-                    "timestamp": timestamp,
+        timestamps = data[timestamp_col]
+        if not pd.api.types.is_datetime64_any_dtype(timestamps):
+            timestamps = pd.to_datetime(timestamps, errors="coerce")
+
+        cols = [col for col in columns if col in data.columns and col != timestamp_col]
+        if not cols:
+            return pd.DataFrame(columns=_STATS_BY_TIME_COLUMNS)
+
+        # Coerce once, then compute every statistic for all bins and columns in one groupby.
+        # Only the requested columns are materialized; the time index is attached to those.
+        raw = data[cols]
+        time_index = pd.DatetimeIndex(timestamps)
+        values = raw.apply(pd.to_numeric, errors="coerce").set_axis(time_index)
+        if backend == "polars" and isinstance(pd.tseries.frequencies.to_offset(interval), pd.offsets.Tick):
+            return self._stats_by_time_polars(values, raw.isna().set_axis(time_index), interval)
+        grouper = pd.Grouper(freq=interval)
+        grouped = values.groupby(grouper)
+        base = grouped.agg(["count", "mean", "std", "min", "max"])
+        qs = grouped.quantile([0.05, 0.25, 0.5, 0.75, 0.95]).unstack(level=-1)
+        missing = raw.isna().set_axis(time_index).groupby(grouper).sum()
+
+        frames = []
+        for col in cols:
+            frame = pd.DataFrame(
+                {
+                    "timestamp": base.index,
                     "variable": col,
-                    "count": int(s.count()),
-                    "mean": float(s.mean()),
-                    "std": float(s.std(ddof=1)) if s.count() > 1 else np.nan,
-                    "min": float(s.min()),
-                    "p05": float(q.loc[0.05]),
-                    "p25": float(q.loc[0.25]),
-                    "median": float(q.loc[0.5]),
-                    "p75": float(q.loc[0.75]),
-                    "p95": float(q.loc[0.95]),
-                    "max": float(s.max()),
-                    "missing": int(group.isna().sum()),
-                })
-        
-        return pd.DataFrame(results)
+                    "count": base[(col, "count")].to_numpy(dtype=np.int64),
+                    "mean": base[(col, "mean")].to_numpy(),
+                    "std": base[(col, "std")].to_numpy(),
+                    "min": base[(col, "min")].to_numpy(),
+                    "p05": qs[(col, 0.05)].to_numpy(),
+                    "p25": qs[(col, 0.25)].to_numpy(),
+                    "median": qs[(col, 0.5)].to_numpy(),
+                    "p75": qs[(col, 0.75)].to_numpy(),
+                    "p95": qs[(col, 0.95)].to_numpy(),
+                    "max": base[(col, "max")].to_numpy(),
+                    "missing": missing[col].to_numpy(dtype=np.int64),
+                }
+            )
+            # Skip bins without any numeric values
+            frames.append(frame.loc[frame["count"] > 0])
+
+        return pd.concat(frames, ignore_index=True)
+
+    def _stats_by_time_polars(self, values: pd.DataFrame, missing: pd.DataFrame, interval: str) -> pd.DataFrame:
+        if pl is None:
+            raise ImportError("polars is required for backend='polars'")
+        every_ns = pd.tseries.frequencies.to_offset(interval).nanos
+        cols = list(values.columns)
+        frame = pd.concat([values, missing.add_suffix("__missing")], axis=1).rename_axis("timestamp").reset_index()
+        frame = frame.loc[frame["timestamp"].notna()]
+        if frame.empty:
+            return pd.DataFrame(columns=_STATS_BY_TIME_COLUMNS)
+        # Align windows to midnight of the first day, matching pandas' resample origin
+        offset_ns = frame["timestamp"].min().normalize().value % every_ns
+        exprs = []
+        for i, col in enumerate(cols):
+            c = pl.col(col)
+            exprs += [
+                c.count().cast(pl.Int64).alias(f"{i}_count"),
+                c.mean().alias(f"{i}_mean"),
+                c.std().alias(f"{i}_std"),
+                c.min().alias(f"{i}_min"),
+                c.quantile(0.05, "linear").alias(f"{i}_p05"),
+                c.quantile(0.25, "linear").alias(f"{i}_p25"),
+                c.median().alias(f"{i}_median"),
+                c.quantile(0.75, "linear").alias(f"{i}_p75"),
+                c.quantile(0.95, "linear").alias(f"{i}_p95"),
+                c.max().alias(f"{i}_max"),
+                pl.col(f"{col}__missing").sum().cast(pl.Int64).alias(f"{i}_missing"),
+            ]
+        binned = (
+            pl.from_pandas(frame, nan_to_null=True)
+            .lazy()
+            .sort("timestamp")
+            .group_by_dynamic("timestamp", every=f"{every_ns}ns", offset=f"{offset_ns}ns")
+            .agg(exprs)
+            .collect()
+            .to_pandas()
+        )
+        stats_cols = _STATS_BY_TIME_COLUMNS[2:]
+        frames = []
+        for i, col in enumerate(cols):
+            frame = binned[["timestamp", *[f"{i}_{name}" for name in stats_cols]]]
+            frame = frame.set_axis(["timestamp", *stats_cols], axis=1)
+            frame.insert(1, "variable", col)
+            # Skip bins without any numeric values
+            frames.append(frame.loc[frame["count"] > 0])
+        return pd.concat(frames, ignore_index=True)
 
     def save_stats_by_time_to_file(self, stats: pd.DataFrame, output_path: Path) -> None:
         """Save time-aggregated stats in both CSV and readable text format."""
@@ -129,19 +260,21 @@ class StatisticsCalculator:
         
         # Also save as readable text
         lines = ["Descriptive Statistics by Time", "==============================", ""]
+        if stats.empty:
+            # Nothing to format (and possibly no statistic columns); write the header only
+            output_path.write_text("\n".join(lines), encoding="utf-8")
+            return
         
-        # Group by timestamp for readability
-        for timestamp, group in stats.groupby("timestamp"):
-            lines.append(f"Time: {timestamp}")
-            lines.append("-" * 50)
-            for _, row in group.iterrows():
-                lines.append(f"  Variable: {row['variable']}")
-                lines.append(
-                    f"    count={row['count']} mean={row['mean']:.3f} std={row['std']:.3f} "
-                    f"min={row['min']:.3f} p05={row['p05']:.3f} p25={row['p25']:.3f} "
-                    f"median={row['median']:.3f} p75={row['p75']:.3f} p95={row['p95']:.3f} "
-                    f"max={row['max']:.3f} missing={row['missing']}"
-                )
-            lines.append("")
+        # Group by timestamp for readability; rows keep their order within each time bin
+        ordered = stats.loc[stats["timestamp"].notna()].sort_values("timestamp", kind="stable")
+        ts = ordered["timestamp"]
+        first = (ts != ts.shift()).to_numpy()
+        last = (ts != ts.shift(-1)).to_numpy()
+        blocks = "  Variable: " + ordered["variable"].astype(str) + "\n    " + _format_stats_line(ordered)
+        # Only bin boundaries need per-item work: the header on the first row, a blank line after the last
+        header = pd.Series("", index=ordered.index)
+        header[first] = ["Time: " + str(t) + "\n" + "-" * 50 + "\n" for t in ts[first]]
+        blocks = header + blocks + np.where(last, "\n", "")
+        lines.extend(blocks.tolist())
         
         output_path.write_text("\n".join(lines), encoding="utf-8")
@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import json
 import logging
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from utils.io_helpers import ensure_directory
 
@@ -24,34 +27,50 @@ class CacheManager:
     def _meta_path(self, cache_key: str) -> Path:
         return self.cache_dir / f"{cache_key}.json"
 
-    def save_to_cache(self, data: pd.DataFrame, cache_key: str) -> None:
+    def save_to_cache(self, data: pd.DataFrame, cache_key: str, row_group_size: int = 1_000_000) -> None:
         path = self._cache_path(cache_key)
         meta = self._meta_path(cache_key)
-        data.to_parquet(path, index=False)
-        meta.write_text(json.dumps({"saved_at": datetime.utcnow().isoformat()}), encoding="utf-8")
+        table = pa.Table.from_pandas(data, preserve_index=False)
+        # Stream row groups into a temp file, then rename so readers never see a partial cache
+        tmp_path = path.with_suffix(".parquet.tmp")
+        with pq.ParquetWriter(tmp_path, table.schema, compression="zstd", compression_level=3) as writer:
+            for batch in table.to_batches(max_chunksize=row_group_size):
+                writer.write_batch(batch)
+        tmp_path.replace(path)
+        meta.write_text(
+            json.dumps({"saved_at": datetime.utcnow().isoformat(), "mtime": path.stat().st_mtime}),
+            encoding="utf-8",
+        )
         logger.info("Saved cache: %s", path)
 
-    def load_from_cache(self, cache_key: str) -> Optional[pd.DataFrame]:
+    def load_from_cache(
+        self,
+        cache_key: str,
+        columns: Optional[List[str]] = None,
+        arrow_dtypes: bool = False,
+    ) -> Optional[pd.DataFrame]:
+        """Load a cached frame, reading only `columns` when given.
+
+        With `arrow_dtypes=True` columns stay backed by the Arrow buffers instead of
+        being converted to NumPy dtypes.
+        """
         path = self._cache_path(cache_key)
         if path.exists():
             logger.info("Loading from cache: %s", path)
-            return pd.read_parquet(path)
+            kwargs = {"dtype_backend": "pyarrow"} if arrow_dtypes else {}
+            return pd.read_parquet(path, engine="pyarrow", columns=columns, **kwargs)
         return None
 
     def clear_cache(self, older_than: Optional[timedelta] = None) -> None:
-        for p in self.cache_dir.glob("*.parquet"):
-            if older_than is None:
-                p.unlink(missing_ok=True)
-                meta = p.with_suffix(".json")
-                meta.unlink(missing_ok=True)
-            else:
-                meta = p.with_suffix(".json")
-                if meta.exists():
-                    try:
-                        info = json.loads(meta.read_text(encoding="utf-8"))
-                        saved_at = datetime.fromisoformat(info.get("saved_at"))
-                        if datetime.utcnow() - saved_at > older_than:
-                            p.unlink(missing_ok=True)
-                            meta.unlink(missing_ok=True)
-                    except Exception:  # noqa: BLE001
-                        continue
+        # Age comes from the parquet file's mtime; the JSON sidecar is kept for external readers.
+        # Temp files left behind by interrupted writes are removed as well.
+        cutoff = time.time() - older_than.total_seconds() if older_than is not None else None
+        for p in [*self.cache_dir.glob("*.parquet"), *self.cache_dir.glob("*.parquet.tmp")]:
+            try:
+                if cutoff is not None and p.stat().st_mtime >= cutoff:
+                    continue
+            except OSError:
+                continue
+            p.unlink(missing_ok=True)
+            if p.suffix == ".parquet":
+                p.with_suffix(".json").unlink(missing_ok=True)
@@ -1,16 +1,58 @@
 from __future__ import annotations
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 import dask.dataframe as dd
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 from rich.progress import track
 
+try:
+    import polars as pl  # type: ignore
+except Exception:  # noqa: BLE001
+    pl = None  # type: ignore
+
+try:
+    import psutil  # type: ignore
+except Exception:  # noqa: BLE001
+    psutil = None  # type: ignore
+
 logger = logging.getLogger(__name__)
 
 
+def _read_workers(n_files: int, parallel: bool = True) -> int:
+    if not parallel:
+        return 1
+    return max(1, min(n_files, os.cpu_count() or 1))
+
+
+def _auto_blocksize() -> int | str:
+    """Dask partition size of roughly available RAM / cores / 10, clamped to 16-64 MB."""
+    if psutil is None:
+        return "64MB"
+    per_core = psutil.virtual_memory().available // (10 * max(1, psutil.cpu_count() or 1))
+    return int(max(16 << 20, min(64 << 20, per_core)))
+
+
+def _arrow_column_types(dtype: Optional[Dict[str, str]]) -> Optional[Dict[str, pa.DataType]]:
+    """Translate a pandas dtype mapping to Arrow column types, or None if any entry has no Arrow equivalent."""
+    if not dtype:
+        return {}
+    types = {}
+    for col, dt in dtype.items():
+        try:
+            types[col] = pa.from_numpy_dtype(np.dtype(dt))
+        except (TypeError, pa.ArrowNotImplementedError):
+            return None
+    return types
+
+
 class AcousticsDataLoader:
     def __init__(self, column_map: Optional[Dict[str, str]] = None, timestamp_col: str = "timestamp"):
         self.column_map = column_map or {}
@@ -29,7 +71,9 @@ class AcousticsDataLoader:
         dtype: Optional[Dict[str, str]] = None,
         parse_dates: Optional[List[str]] = None,
         assume_missing: bool = True,
-        blocksize: str | None = "64MB",
+        blocksize: int | str | None = "auto",
+        engine: str = "pyarrow",
+        parallel: bool = True,
     ) -> dd.DataFrame | pd.DataFrame:
         if not file_paths:
             raise ValueError("No input files provided")
@@ -56,6 +100,8 @@ class AcousticsDataLoader:
 
         if lazy:
             logger.info("Loading %d CSV files with Dask", len(file_paths))
+            if blocksize == "auto":
+                blocksize = _auto_blocksize()
             ddf = dd.read_csv(
                 [str(p) for p in file_paths],
                 dtype=dtype,
@@ -63,27 +109,120 @@ class AcousticsDataLoader:
                 assume_missing=assume_missing,
                 blocksize=blocksize,
                 sep=sep,
+                engine="pyarrow",
             )
             # Normalize column names to lowercase first, then apply mapping like {"time": "timestamp"}
             ddf = ddf.rename(columns={c: c.lower().strip() for c in ddf.columns})
             if self.column_map:
                 ddf = ddf.rename(columns=self.column_map)
-            # Ensure timestamp column is datetime if present
-            if "timestamp" in ddf.columns:
+            # Ensure timestamp column is datetime if present; Arrow already parses ISO timestamps
+            if "timestamp" in ddf.columns and not pd.api.types.is_datetime64_any_dtype(ddf["timestamp"].dtype):
                 ddf["timestamp"] = dd.to_datetime(ddf["timestamp"], errors="coerce")
             return ddf
         else:
-            logger.info("Loading %d CSV files eagerly with Pandas", len(file_paths))
-            parts = []
-            for p in track(file_paths, description="Reading CSVs"):
-                df = pd.read_csv(p, dtype=dtype, parse_dates=parse_dates, sep=sep)
-                # Normalize columns and apply mapping
-                df.columns = [c.lower().strip() for c in df.columns]
-                if self.column_map:
-                    df.rename(columns=self.column_map, inplace=True)
-                parts.append(df)
-            df_all = pd.concat(parts, ignore_index=True)
-            # If timestamp exists, ensure datetime dtype
-            if "timestamp" in df_all.columns:
+            column_types = _arrow_column_types(dtype)
+            if engine == "polars":
+                if pl is None:
+                    raise ImportError("polars is required for engine='polars'")
+                df_all = self._read_csv_polars(file_paths, sep, dtype)
+            elif column_types is not None:
+                try:
+                    df_all = self._read_csv_arrow(file_paths, sep, column_types, parallel)
+                except pa.ArrowException as e:
+                    # Arrow infers types from the first block; fall back when later rows disagree
+                    logger.warning("PyArrow CSV read failed (%s); falling back to Pandas", e)
+                    df_all = self._read_csv_pandas(file_paths, dtype, parse_dates, sep, parallel)
+            else:
+                df_all = self._read_csv_pandas(file_paths, dtype, parse_dates, sep, parallel)
+            # If timestamp exists, ensure datetime dtype (Arrow-parsed columns already are)
+            if "timestamp" in df_all.columns and not pd.api.types.is_datetime64_any_dtype(df_all["timestamp"]):
                 df_all["timestamp"] = pd.to_datetime(df_all["timestamp"], errors="coerce")
             return df_all
+
+    def iter_csv_chunks(
+        self,
+        file_paths: List[Path],
+        columns: Optional[List[str]] = None,
+        chunksize: int = 1_000_000,
+    ) -> Iterator[pd.DataFrame]:
+        """Yield the files as frames of at most ``chunksize`` rows, for passes that never hold all rows.
+
+        ``columns`` are normalized names (e.g. 'timestamp'); only those are parsed.
+        """
+        for p in file_paths:
+            sep = "\t" if p.suffix.lower() in {".tsv", ".txt"} else ","
+            header = list(pd.read_csv(p, nrows=0, sep=sep).columns)
+            names = dict(zip(header, self._normalize_columns(header)))
+            usecols = [c for c, n in names.items() if n in columns] if columns is not None else None
+            for chunk in pd.read_csv(p, sep=sep, usecols=usecols, chunksize=chunksize):
+                chunk = chunk.rename(columns=names)
+                if "timestamp" in chunk.columns and not pd.api.types.is_datetime64_any_dtype(chunk["timestamp"]):
+                    chunk["timestamp"] = pd.to_datetime(chunk["timestamp"], errors="coerce")
+                yield chunk
+
+    def _normalize_columns(self, columns: List[str]) -> List[str]:
+        # Normalize column names to lowercase, then apply mapping like {"time": "timestamp"}
+        names = [c.lower().strip() for c in columns]
+        return [self.column_map.get(c, c) for c in names]
+
+    def _read_csv_arrow(
+        self,
+        file_paths: List[Path],
+        sep: str,
+        column_types: Optional[Dict[str, pa.DataType]] = None,
+        parallel: bool = True,
+    ) -> pd.DataFrame:
+        logger.info("Loading %d CSV files eagerly with PyArrow", len(file_paths))
+        parse_options = pa_csv.ParseOptions(delimiter=sep)
+        # ISO 8601 timestamps (incl. fractional seconds) are parsed to timestamp[ns] inside Arrow
+        convert_options = pa_csv.ConvertOptions(column_types=column_types or {}, timestamp_parsers=[pa_csv.ISO8601])
+
+        def read_one(p: Path) -> pa.Table:
+            table = pa_csv.read_csv(p, parse_options=parse_options, convert_options=convert_options)
+            # Renaming in Arrow only touches the schema, not the column buffers
+            return table.rename_columns(self._normalize_columns(table.column_names))
+
+        # Parsing releases the GIL, so files are read concurrently; map() keeps input order
+        with ThreadPoolExecutor(max_workers=_read_workers(len(file_paths), parallel)) as ex:
+            tables = list(track(ex.map(read_one, file_paths), total=len(file_paths), description="Reading CSVs"))
+        table_all = pa.concat_tables(tables, promote_options="permissive")
+        del tables
+        # Columns become separate blocks and Arrow buffers are released as they are converted,
+        # so peak memory stays near one copy of the data instead of two
+        return table_all.to_pandas(coerce_temporal_nanoseconds=True, split_blocks=True, self_destruct=True)
+
+    def _read_csv_polars(self, file_paths: List[Path], sep: str, dtype: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+        logger.info("Loading %d CSV files eagerly with Polars", len(file_paths))
+        frames = []
+        for p in file_paths:
+            lf = pl.scan_csv(p, separator=sep, try_parse_dates=True)
+            names = lf.collect_schema().names()
+            frames.append(lf.rename(dict(zip(names, self._normalize_columns(names)))))
+        # One lazy query over all files: parsing and concatenation run on polars' thread pool
+        lf_all = pl.concat(frames, how="diagonal_relaxed")
+        # Keep nanosecond timestamps like the other readers so downstream int64 views line up
+        lf_all = lf_all.with_columns(pl.col(pl.Datetime).dt.cast_time_unit("ns"))
+        df = lf_all.collect(engine="streaming").to_pandas()
+        if dtype:
+            df = df.astype({c: t for c, t in dtype.items() if c in df.columns})
+        return df
+
+    def _read_csv_pandas(
+        self,
+        file_paths: List[Path],
+        dtype: Optional[Dict[str, str]],
+        parse_dates: List[str],
+        sep: str,
+        parallel: bool = True,
+    ) -> pd.DataFrame:
+        logger.info("Loading %d CSV files eagerly with Pandas", len(file_paths))
+
+        def read_one(p: Path) -> pd.DataFrame:
+            df = pd.read_csv(p, dtype=dtype, parse_dates=parse_dates, sep=sep)
+            df.columns = self._normalize_columns(list(df.columns))
+            return df
+
+        # The C parser releases the GIL, so files are read concurrently; map() keeps input order
+        with ThreadPoolExecutor(max_workers=_read_workers(len(file_paths), parallel)) as ex:
+            parts = list(track(ex.map(read_one, file_paths), total=len(file_paths), description="Reading CSVs"))
+        return pd.concat(parts, ignore_index=True)
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import logging
-from typing import Optional
+import weakref
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 
+import dask.dataframe as dd
+import numpy as np
 import pandas as pd
 
 # For coordinate transformation
@@ -13,6 +17,78 @@ from utils.io_helpers import read_config
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=32)
+def _get_transformer(input_crs: str, output_crs: str) -> pyproj.Transformer:
+    # Shared across PositionMerger instances; transform() is thread-safe
+    return pyproj.Transformer.from_crs(input_crs, output_crs, always_xy=True)
+
+
+def _to_datetime(values: pd.Series) -> pd.Series:
+    """Parse a time column, leaving datetime64 columns untouched."""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    try:
+        # An explicit ISO format skips pandas' per-element format inference
+        return pd.to_datetime(values, format="ISO8601", cache=True)
+    except (ValueError, TypeError):
+        return pd.to_datetime(values, cache=True)
+
+
+def _asof_indexer(a_ts: np.ndarray, p_ts: np.ndarray, tol_ns: int, direction: str) -> np.ndarray:
+    """Row positions in ``p_ts`` matched to each ``a_ts`` as ``pd.merge_asof`` would, or -1.
+
+    Both inputs are sorted int64 nanosecond timestamps.
+    """
+    if direction not in {"backward", "forward", "nearest"}:
+        raise ValueError(f"direction invalid: {direction}")
+    m = len(p_ts)
+    if m == 0:
+        return np.full(len(a_ts), -1, dtype=np.intp)
+    # Last position at or before each timestamp, and first position at or after it
+    back = np.searchsorted(p_ts, a_ts, side="right") - 1
+    fwd = np.searchsorted(p_ts, a_ts, side="left")
+    has_back = back >= 0
+    has_fwd = fwd < m
+    back_dist = np.where(has_back, a_ts - p_ts[np.clip(back, 0, m - 1)], np.iinfo(np.int64).max)
+    fwd_dist = np.where(has_fwd, p_ts[np.clip(fwd, 0, m - 1)] - a_ts, np.iinfo(np.int64).max)
+    if direction == "backward":
+        idx, dist = np.where(has_back, back, -1), back_dist
+    elif direction == "forward":
+        idx, dist = np.where(has_fwd, fwd, -1), fwd_dist
+    else:
+        # Ties go to the earlier position, as in pandas
+        use_fwd = fwd_dist < back_dist
+        idx = np.where(use_fwd, fwd, np.where(has_back, back, -1))
+        dist = np.where(use_fwd, fwd_dist, back_dist)
+    return np.where(dist <= tol_ns, idx, -1)
+
+
+def _interpolate_time(t_ns: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Linear-in-time fill of NaNs, as ``interpolate(method="time")`` does.
+
+    Leading NaNs are kept and trailing NaNs take the last known value.
+    """
+    known = ~np.isnan(values)
+    if known.all() or not known.any():
+        return values
+    out = values.copy()
+    fill = ~known
+    fill[: np.argmax(known)] = False
+    out[fill] = np.interp(t_ns[fill], t_ns[known], values[known])
+    return out
+
+
+def _nearest_indexer(p_ts: np.ndarray, t_ts: np.ndarray) -> np.ndarray:
+    """Row positions in the sorted, non-empty ``p_ts`` nearest to each ``t_ts``.
+
+    Ties go to the later position, matching ``Index.reindex(method="nearest")``.
+    """
+    right = np.minimum(np.searchsorted(p_ts, t_ts, side="left"), len(p_ts) - 1)
+    left = np.maximum(np.searchsorted(p_ts, t_ts, side="right") - 1, 0)
+    use_left = np.abs(t_ts - p_ts[left]) < np.abs(p_ts[right] - t_ts)
+    return np.where(use_left, left, right)
+
+
 class PositionMerger:
     def __init__(
         self,
@@ -21,6 +97,7 @@ class PositionMerger:
         lat_col: str = "latitude",
         lon_col: str = "longitude",
         config_path: str | Path = "config/settings.yaml",
+        enable_transform: bool = True,
     ):
         self.acoustic_time_col = acoustic_time_col
         self.position_time_col = position_time_col
@@ -32,7 +109,8 @@ class PositionMerger:
         coords_cfg = config.get("coordinates", {})
         self.input_crs = coords_cfg.get("input_crs", "EPSG:4326")
         self.output_crs = coords_cfg.get("output_crs", "EPSG:3006")
-        self.transform_on_load = coords_cfg.get("transform_on_load", True)
+        # enable_transform=False skips projected coordinates regardless of the config
+        self.transform_on_load = enable_transform and coords_cfg.get("transform_on_load", True)
         columns = coords_cfg.get("columns", {})
         self.input_lon_col = columns.get("input_lon", "longitude")
         self.input_lat_col = columns.get("input_lat", "latitude")
@@ -43,20 +121,70 @@ class PositionMerger:
         self.original_lat_suffix = columns.get("original_lat_suffix", "_wgs84")
 
         # Prepare transformer
-        self._transformer = pyproj.Transformer.from_crs(self.input_crs, self.output_crs, always_xy=True)
+        self._transformer = _get_transformer(self.input_crs, self.output_crs)
+        # Sorted [time, lat, lon] slices keyed by id() of the positions frame they were built from
+        self._prepared_pos_cache: Dict[int, Tuple[weakref.ref, pd.DataFrame]] = {}
+
+    def __getstate__(self) -> dict:
+        # Weakrefs cannot be pickled (e.g. when shipped to Dask workers); the cache refills on demand
+        state = self.__dict__.copy()
+        state["_prepared_pos_cache"] = {}
+        return state
+
+    def _prepare_positions(self, position_data: pd.DataFrame) -> pd.DataFrame:
+        """Return the time-sorted [time, lat, lon] slice of ``position_data``, built once per frame."""
+        key = id(position_data)
+        cached = self._prepared_pos_cache.get(key)
+        # The weakref guards against a new frame reusing the id of a collected one
+        if cached is not None and cached[0]() is position_data and len(cached[1]) == len(position_data):
+            return cached[1]
+        p = position_data[[self.position_time_col, self.lat_col, self.lon_col]]
+        p = p.assign(**{self.position_time_col: _to_datetime(p[self.position_time_col])})
+        if not p[self.position_time_col].is_monotonic_increasing:
+            p = p.sort_values(self.position_time_col, kind="stable")
+        self._prepared_pos_cache = {
+            k: v for k, v in self._prepared_pos_cache.items() if v[0]() is not None
+        }
+        self._prepared_pos_cache[key] = (weakref.ref(position_data), p)
+        return p
+
+    def _prepare_acoustic(self, acoustic_data: pd.DataFrame) -> pd.DataFrame:
+        """Return ``acoustic_data`` with a datetime time column, sorted by it; the input is never mutated."""
+        a = acoustic_data
+        if not pd.api.types.is_datetime64_any_dtype(a[self.acoustic_time_col]):
+            a = a.assign(**{self.acoustic_time_col: _to_datetime(a[self.acoustic_time_col])})
+        # Already-sorted input (the common case) is passed on without a copy
+        if not a[self.acoustic_time_col].is_monotonic_increasing:
+            a = a.sort_values(self.acoustic_time_col, kind="stable")
+        return a
+
+    def _matched_mask(self, df: pd.DataFrame) -> np.ndarray:
+        lat = df[self.lat_col].to_numpy(dtype=np.float64, na_value=np.nan)
+        lon = df[self.lon_col].to_numpy(dtype=np.float64, na_value=np.nan)
+        # One pass, one output buffer: no intermediate boolean Series
+        mask = np.isnan(lat)
+        np.logical_or(mask, np.isnan(lon), out=mask)
+        return np.logical_not(mask, out=mask)
 
     def _add_transformed_coords(self, df: pd.DataFrame) -> pd.DataFrame:
         if not self.transform_on_load:
             return df
         lon = df[self.input_lon_col]
         lat = df[self.input_lat_col]
-        easting, northing = self._transformer.transform(lon.values, lat.values)
-        df[self.output_easting_col] = easting
-        df[self.output_northing_col] = northing
+        # PROJ transforms contiguous float64 buffers in place of an internal conversion copy
+        lon_arr = np.ascontiguousarray(lon.to_numpy(dtype=np.float64, na_value=np.nan))
+        lat_arr = np.ascontiguousarray(lat.to_numpy(dtype=np.float64, na_value=np.nan))
+        easting, northing = self._transformer.transform(lon_arr, lat_arr)
+        new_cols = {self.output_easting_col: easting, self.output_northing_col: northing}
         if self.keep_original:
             # Optionally keep original lat/lon with suffix
-            df[self.input_lon_col + self.original_lon_suffix] = lon
-            df[self.input_lat_col + self.original_lat_suffix] = lat
+            new_cols[self.input_lon_col + self.original_lon_suffix] = lon.to_numpy()
+            new_cols[self.input_lat_col + self.original_lat_suffix] = lat.to_numpy()
+        if df.columns.intersection(list(new_cols)).empty:
+            # Append all new columns in one block instead of one insert per column
+            return pd.concat([df, pd.DataFrame(new_cols, index=df.index)], axis=1)
+        for col, values in new_cols.items():
+            df[col] = values
         return df
 
     def merge_positions(
@@ -66,37 +194,77 @@ class PositionMerger:
         tolerance: str = "5s",
         direction: str = "nearest",
     ) -> pd.DataFrame:
-        a = acoustic_data.copy()
-        p = position_data.copy()
-        a[self.acoustic_time_col] = pd.to_datetime(a[self.acoustic_time_col])
-        p[self.position_time_col] = pd.to_datetime(p[self.position_time_col])
-        a.sort_values(self.acoustic_time_col, inplace=True)
-        p.sort_values(self.position_time_col, inplace=True)
-
-        merged = pd.merge_asof(
-            a,
-            p[[self.position_time_col, self.lat_col, self.lon_col]],
-            left_on=self.acoustic_time_col,
-            right_on=self.position_time_col,
-            tolerance=pd.Timedelta(tolerance),
-            direction=direction,
-        )
+        a = self._prepare_acoustic(acoustic_data)
+        p = self._prepare_positions(position_data)
+
+        a_time = a[self.acoustic_time_col]
+        p_time = p[self.position_time_col]
+        if (
+            a_time.dtype.kind == "M" and p_time.dtype.kind == "M"
+            and not a_time.hasnans and not p_time.hasnans
+            and self.lat_col not in a.columns and self.lon_col not in a.columns
+        ):
+            # Both keys are sorted, so a searchsorted indexer plus one gather replaces merge_asof
+            idx = _asof_indexer(
+                a_time.to_numpy(dtype="datetime64[ns]").view("i8"),
+                p_time.to_numpy(dtype="datetime64[ns]").view("i8"),
+                pd.Timedelta(tolerance).value,
+                direction,
+            )
+            matched = idx >= 0
+            merged = a.reset_index(drop=True)
+            for col in (self.lat_col, self.lon_col):
+                values = p[col].to_numpy()
+                out = np.full(len(idx), np.nan, dtype=np.result_type(values.dtype, np.float64))
+                out[matched] = values[idx[matched]]
+                merged[col] = out
+        else:
+            # Null keys, timezone-aware keys or clashing column names: defer to pandas
+            merged = pd.merge_asof(
+                a,
+                p,
+                left_on=self.acoustic_time_col,
+                right_on=self.position_time_col,
+                tolerance=pd.Timedelta(tolerance),
+                direction=direction,
+            )
         # Only drop the right-side time column if it's distinct from the acoustic time column
         if self.position_time_col != self.acoustic_time_col and self.position_time_col in merged.columns:
             merged.drop(columns=[self.position_time_col], inplace=True)
-        merged["position_matched"] = (~merged[self.lat_col].isna()) & (~merged[self.lon_col].isna())
-        match_rate = merged["position_matched"].mean() * 100
+        matched = self._matched_mask(merged)
+        merged["position_matched"] = matched
+        match_rate = matched.mean() * 100 if matched.size else np.nan
         logger.info("Position match rate: %.2f%%", match_rate)
         # Add transformed coordinates if enabled
         merged = self._add_transformed_coords(merged)
         return merged
 
+    def merge_positions_dask(
+        self,
+        acoustic_data: dd.DataFrame,
+        position_data: pd.DataFrame,
+        tolerance: str = "5s",
+        direction: str = "nearest",
+    ) -> dd.DataFrame:
+        """Lazily merge positions into a Dask acoustic frame, one partition at a time.
+
+        The prepared positions are broadcast to every partition, so each row sees the full
+        track and partition boundaries need no overlap. Rows are time-sorted within each
+        partition; the result has unknown divisions.
+        """
+        p = self._prepare_positions(position_data)
+        meta = self.merge_positions(acoustic_data._meta, p, tolerance=tolerance, direction=direction)
+        merged = acoustic_data.map_partitions(
+            self.merge_positions, p, tolerance=tolerance, direction=direction, meta=meta
+        )
+        return merged.clear_divisions()
+
     def interpolate_positions(self, data: pd.DataFrame, method: str = "linear", limit: Optional[int] = None) -> pd.DataFrame:
-        df = data.copy()
-        df.sort_values(self.acoustic_time_col, inplace=True)
-        for col in (self.lat_col, self.lon_col):
-            df[col] = df[col].interpolate(method=method, limit=limit)
-        return df
+        df = data
+        if not df[self.acoustic_time_col].is_monotonic_increasing:
+            df = df.sort_values(self.acoustic_time_col, kind="stable")
+        # assign() makes the only copy; the caller's frame is left untouched
+        return df.assign(**{col: df[col].interpolate(method=method, limit=limit) for col in (self.lat_col, self.lon_col)})
 
     def merge_positions_interpolated(
         self,
@@ -109,33 +277,37 @@ class PositionMerger:
         the nearest previous and next position points. Falls back to nearest when
         only one side is available.
         """
-        a = acoustic_data.copy()
-        p = position_data.copy()
-        a[self.acoustic_time_col] = pd.to_datetime(a[self.acoustic_time_col])
-        p[self.position_time_col] = pd.to_datetime(p[self.position_time_col])
-        a.sort_values(self.acoustic_time_col, inplace=True)
-        p.sort_values(self.position_time_col, inplace=True)
-
-        # Build a union time index of acoustic and position timestamps
-        base = a[[self.acoustic_time_col]].drop_duplicates().set_index(self.acoustic_time_col)
-        pos_idx = p.set_index(self.position_time_col)[[self.lat_col, self.lon_col]].sort_index()
-        union_index = base.index.union(pos_idx.index).unique().sort_values()
-        timeline = pd.DataFrame(index=union_index)
-        # Place known positions on the timeline
-        timeline = timeline.join(pos_idx, how="left")
-        # Time-based interpolation across the union timeline
-        timeline[[self.lat_col, self.lon_col]] = timeline[[self.lat_col, self.lon_col]].interpolate(method="time")
-        # Extract interpolated positions at acoustic timestamps
-        interp_at_acoustic = timeline.loc[base.index]
-        # Fallback: nearest position if interpolation left gaps (e.g., outside ends)
-        if interp_at_acoustic[self.lat_col].isna().any() or interp_at_acoustic[self.lon_col].isna().any():
-            nearest = pos_idx.reindex(base.index, method="nearest")
-            interp_at_acoustic[self.lat_col] = interp_at_acoustic[self.lat_col].fillna(nearest[self.lat_col])
-            interp_at_acoustic[self.lon_col] = interp_at_acoustic[self.lon_col].fillna(nearest[self.lon_col])
-
-        out = a.merge(interp_at_acoustic.reset_index(), on=self.acoustic_time_col, how="left")
-        out["position_matched"] = (~out[self.lat_col].isna()) & (~out[self.lon_col].isna())
-        match_rate = out["position_matched"].mean() * 100
+        a = self._prepare_acoustic(acoustic_data)
+        p = self._prepare_positions(position_data)
+
+        # Work on the int64 ns buffers; both frames are already sorted by time
+        a_ns = a[self.acoustic_time_col].to_numpy(dtype="datetime64[ns]").view("i8")
+        p_ns = p[self.position_time_col].to_numpy(dtype="datetime64[ns]").view("i8")
+        base_ns, inverse = np.unique(a_ns, return_inverse=True)
+        # Union timeline of acoustic and position timestamps, with known positions placed on it
+        t_ns = np.union1d(base_ns, p_ns)
+        at_pos = np.searchsorted(t_ns, p_ns)
+        at_base = np.searchsorted(t_ns, base_ns)
+        interp_at_acoustic: Dict[str, np.ndarray] = {}
+        for col in (self.lat_col, self.lon_col):
+            pos_values = p[col].to_numpy(dtype=np.float64)
+            timeline = np.full(len(t_ns), np.nan)
+            timeline[at_pos] = pos_values
+            # Time-based interpolation across the union timeline, then extracted at acoustic timestamps
+            values = _interpolate_time(t_ns, timeline)[at_base]
+            # Fallback: nearest position if interpolation left gaps (e.g., outside ends)
+            gaps = np.isnan(values)
+            if gaps.any() and len(p_ns):
+                values[gaps] = pos_values[_nearest_indexer(p_ns, base_ns[gaps])]
+            interp_at_acoustic[col] = values
+
+        # Each acoustic row maps to its unique timestamp through the inverse index; no join needed
+        out = a.reset_index(drop=True)
+        for col, values in interp_at_acoustic.items():
+            out[col] = values[inverse]
+        matched = self._matched_mask(out)
+        out["position_matched"] = matched
+        match_rate = matched.mean() * 100 if matched.size else np.nan
         logger.info("Position interpolation match rate: %.2f%%", match_rate)
         # Add transformed coordinates if enabled
         out = self._add_transformed_coords(out)
@@ -1,11 +1,149 @@
 from __future__ import annotations
 
 import re
+import string
 from dataclasses import dataclass
-from typing import Any, Dict, Tuple
+from functools import lru_cache
+from typing import Any, Callable, Dict, Tuple
 
+# Patterns used on every parse are compiled once at import. Those with letters in them run
+# case-sensitively on the lowercased command; values are sliced back out of the original.
+_RE_KV = re.compile(r"(\w+)=(\S+)")
+_RE_LOAD = re.compile(r"(pattern|positions|dir)=(\S+)")
+_RE_INTERVAL = re.compile(r"(\d+min|\d+h|\d+d)")
+_RE_RES = re.compile(r"res=(\d+)")
+_RE_COLUMNS = re.compile(r"columns=([\w,]+)")
+_RE_BOXPLOT_VS = re.compile(r"boxplot\s+(\w+)\s+vs\s+(\w+)")
+_RE_SCATTER_VS = re.compile(r"scatter\s+(\w+)\s+vs\s+(\w+)")
+_RE_WORD = re.compile(r"\w+")
+_RE_CREATE_VAR = re.compile(r"(?:create\s+var\s+|calc\s+)(\w+)=(.+)")
+_RE_CREATE_FROM = re.compile(r"create\s+(\w+)\s+from\s+(\w+)")
+_RE_LIST_COLUMNS = re.compile(r"^(\s*(show|list)\s+)?columns\b")
+# Keywords the cascade looks for anywhere in a command, one alternation per set
+_RE_KW_BOXPLOT = re.compile(r" boxplot")
+_RE_KW_PLOT = re.compile(r"plot")
+_RE_KW_PLOT_AGG = re.compile(r"plot|aggregate")
+_RE_KW_PLOT_AGG_MAP = re.compile(r"plot|aggregate|map|hex")
+_RE_KW_MAP = re.compile(r"map|hex")
+# Everything the cascade can react to: keywords anywhere, and prefixes. Input with neither is help.
+_RE_KW_ANY = re.compile(r"plot|aggregate|map|hex|statistics")
+_CASCADE_PREFIXES = ("scatter", "set ", "alias ", "define ", "load", "analysis", "create", "calc", "stats", "columns", "show", "list")
+# Date and transform parameters are read from ``key=value`` / ``key:value`` tokens in one pass
+_RE_TOKEN = re.compile(r"\S+")
+# A date value may be quoted and contain spaces, so it is matched from the token's '=' onwards
+_RE_DATE_VALUE = re.compile(r"[\"']?([0-9\-\s:t+]+)[\"']?")
+_DATE_KEYS = ("start_date", "end_date")
+_RE_PARAM_TOKEN = re.compile(r"(\w+)([=:])(.+)")
+_RE_BOOL_VALUE = re.compile(r"true|false|yes|no|1|0")
+_RE_NUM_VALUE = re.compile(r"[0-9.+-]+")
+_RE_OUTLIER_VALUE = re.compile(r"zscore|iqr|percentile|modified[_-]?zscore|mzscore")
+_RE_ANY_VALUE = re.compile(r".+")
+_TRANSFORM_ALIASES = {"neg": "negative", "logx": "xlog", "outliers": "outlier_method", "outlier": "outlier_method"}
+# Accepted value prefix for each (key, separator); the first accepted token per slot wins
+_TRANSFORM_SLOTS: Dict[Tuple[str, str], re.Pattern[str]] = {
+    ("log", "="): _RE_BOOL_VALUE,
+    ("log", ":"): _RE_ANY_VALUE,
+    ("logy", "="): _RE_BOOL_VALUE,
+    ("logy", ":"): _RE_ANY_VALUE,
+    ("negative", "="): _RE_BOOL_VALUE,
+    ("negative", ":"): _RE_ANY_VALUE,
+    ("xlog", "="): _RE_BOOL_VALUE,
+    ("xlog", ":"): _RE_ANY_VALUE,
+    ("min", "="): _RE_NUM_VALUE,
+    ("min", ":"): _RE_NUM_VALUE,
+    ("max", "="): _RE_NUM_VALUE,
+    ("max", ":"): _RE_NUM_VALUE,
+    ("xmin", "="): _RE_NUM_VALUE,
+    ("xmin", ":"): _RE_NUM_VALUE,
+    ("xmax", "="): _RE_NUM_VALUE,
+    ("xmax", ":"): _RE_NUM_VALUE,
+    ("z_thresh", "="): _RE_NUM_VALUE,
+    ("z_thresh", ":"): _RE_NUM_VALUE,
+    ("outlier_method", "="): _RE_OUTLIER_VALUE,
+    ("outlier_method", ":"): _RE_ANY_VALUE,
+}
+# Boolean params and the slots they are read from, highest priority first ('logy' is an alias for y log)
+_TRANSFORM_BOOLS = (
+    ("log", (("log", "="), ("log", ":"), ("logy", "="), ("logy", ":"))),
+    ("negative", (("negative", "="), ("negative", ":"))),
+    ("xlog", (("xlog", "="), ("xlog", ":"))),
+)
+_TRANSFORM_FLOATS = ("min", "max", "xmin", "xmax", "z_thresh")
+# Plain decimal numbers as written in commands (already lowercased)
+_RE_FLOAT = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)(?:e[+-]?\d+)?")
+_OUTLIER_METHODS = frozenset({"zscore", "iqr", "percentile", "modified_zscore", "modified-zscore", "mzscore"})
+# Truthy transform flags; anything else given for log/neg/xlog means False
+_TRANSFORM_TRUE = frozenset({"true", "yes", "1"})
+# Accepted show=/save= values; others leave the flag unset
+_TRUE = frozenset({"1", "true", "yes", "y"})
+_FALSE = frozenset({"0", "false", "no", "n"})
 
-@dataclass
+
+# ``key=[a,b]`` / ``key=a,b`` pattern per range key for _find_range, built at import so no
+# per-key pattern is ever compiled or looked up in re's cache while parsing; the group
+# that matched tells the two forms apart
+_RANGE_RES: Dict[str, re.Pattern[str]] = {
+    k: re.compile(rf"{k}=(?:\[([^\]]+)\]|(\S+))") for k in ("east_lim", "xlim", "north_lim", "ylim")
+}
+
+
+# Commands that need no parsing at all, answered from a lookup on the lowercased input
+_TRIVIAL: Dict[str, Dict[str, Any]] = {
+    "exit": {"task": "exit"},
+    "quit": {"task": "exit"},
+    "help": {"task": "help"},
+    "?": {"task": "help"},
+    "columns": {"task": "list_columns"},
+    "list columns": {"task": "list_columns"},
+    "show columns": {"task": "list_columns"},
+    "clear cache": {"task": "clear_cache"},
+    "sync": {"task": "sync"},
+}
+
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+def _lower(raw: str) -> str:
+    """Lowercase ASCII letters only, so offsets in the result are valid in ``raw``."""
+    return raw.lower() if raw.isascii() else raw.translate(_ASCII_LOWER)
+
+
+def _shorthand_arg(raw: str, verb: str, whole_token: bool = False) -> str | None:
+    """Column named right after a leading verb ('plot depth'), from a plain split.
+
+    Like ``<verb>\\s+(\\w+)``: the leading word characters of the second token, or with
+    ``whole_token`` only a token made entirely of word characters.
+    """
+    parts = raw.split(None, 2)
+    if len(parts) < 2 or parts[0].lower() != verb:
+        return None
+    tok = parts[1]
+    # \w is letters, digits and underscore; most tokens are a bare column name
+    if tok.replace("_", "a").isalnum():
+        return tok
+    if whole_token:
+        return None
+    m = _RE_WORD.match(tok)
+    return m.group(0) if m else None
+
+
+def _orig(raw: str, m: re.Match[str], group: int = 1) -> str:
+    """Original-case text of a group matched on the lowercased command."""
+    start, end = m.span(group)
+    return raw[start:end]
+
+
+def _to_float(text: str) -> float | None:
+    """``float(text)`` for plain decimal numbers; None instead of raising on anything else."""
+    return float(text) if _RE_FLOAT.fullmatch(text) else None
+
+
+def _copy_command(cmd: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a cached command, including its list/dict values, so callers may mutate it."""
+    return {k: v.copy() if isinstance(v, (list, dict)) else v for k, v in cmd.items()}
+
+
+@dataclass(slots=True, frozen=True)
 class ParseResult:
     ok: bool
     command: Dict[str, Any]
@@ -25,214 +163,11 @@ class CommandInterpreter:
 
     def parse_command(self, user_input: str) -> Dict[str, Any]:
         raw = user_input.strip()
-        s = raw.lower()
-        # Boxplot command
-        if s.startswith("boxplot") or " boxplot" in s:
-            # y: required, x/group: optional
-            y = self._find_param(raw, ["y"])  # required unless using shorthand
-            x = self._find_param(raw, ["x", "group"])  # optional
-            # Support 'boxplot y vs x' syntax
-            vs_match = re.search(r"boxplot\s+(\w+)\s+vs\s+(\w+)", raw, re.IGNORECASE)
-            if vs_match:
-                y = vs_match.group(1)
-                x = vs_match.group(2)
-            # Shorthand: boxplot <column>
-            if not y:
-                m = re.match(r"boxplot\s+(\w+)", raw, flags=re.IGNORECASE)
-                if m:
-                    y = m.group(1)
-            params: Dict[str, Any] = {"task": "plot_boxplot", "y": y}
-            if x:
-                params["x"] = x
-            # Extract temporal aggregation interval (e.g., 5min, 10min, 1h)
-            interval = self._find_interval(raw)
-            if interval:
-                params["interval"] = interval
-            # Common params: dates and transforms
-            params.update(self._extract_date_params(raw))
-            params.update(self._extract_transform_params(raw))
-            # Optional x-axis binning for continuous data: xbins (equal-width) or xqbins (quantile bins)
-            xbins = self._find_param(raw, ["xbins", "x_bins"])  # supports xbins= or xbins:
-            xqbins = self._find_param(raw, ["xqbins", "x_quantile_bins", "quantile_bins"])  # optional
-            if xbins is not None:
-                params["xbins"] = xbins
-            if xqbins is not None:
-                params["xqbins"] = xqbins
-            # Optional show/save/out
-            params["show"] = self._find_bool(raw, ["show"])  # may be None
-            params["save"] = self._find_bool(raw, ["save"])  # may be None
-            params["out"] = self._find_param(raw, ["out", "file", "path"])  # may be None
-            return params
-        # Scatter plotting can be invoked directly via 'scatter ...'
-        if s.startswith("scatter"):
-            interval = self._find_interval(s)
-            y = self._find_param(raw, ["y", "column", "value", "backscatter"])  # optional
-            x = self._find_param(raw, ["x"])  # optional
-            # Support 'scatter y vs x' syntax
-            vs_match = re.search(r"scatter\s+(\w+)\s+vs\s+(\w+)", raw, re.IGNORECASE)
-            if vs_match:
-                y = vs_match.group(1)
-                x = vs_match.group(2)
-            # Support 'scatter <y>' shorthand
-            if not y:
-                simple = re.match(r"scatter\s+(\w+)", raw, flags=re.IGNORECASE)
-                if simple:
-                    y = simple.group(1)
-            if not x:
-                x = "timestamp"
-            # Parse smooth mode: supports true/false/loess
-            smooth = self._find_param(raw, ["smooth"])  # optional, may be bool or string
-            # Optional LOWESS fraction (0-1), e.g., frac=0.1 or lowess_frac=0.2
-            lowess_frac = self._find_param(raw, ["frac", "lowess_frac"])  # optional
-            show = self._find_bool(raw, ["show"])      # optional
-            save = self._find_bool(raw, ["save"])      # optional
-            out = self._find_param(raw, ["out", "file", "path"])  # optional
-            base = {
-                "task": "scatter_plot",
-                "y": y,
-                "x": x,
-                "interval": interval,
-                "smooth": smooth,
-                "lowess_frac": lowess_frac,
-                "show": show,
-                "save": save,
-                "out": out,
-            }
-            # Add date/transform params
-            base.update(self._extract_date_params(raw))
-            base.update(self._extract_transform_params(raw))
-            return base
-        # Settings
-        if s.startswith("set "):
-            # set key=value
-            m = re.findall(r"(\w+)=([^\s]+)", raw, flags=re.IGNORECASE)
-            return {"task": "set", "params": {k.lower(): v for k, v in m}}
-
-        # Define CLI variable aliases: alias name=column [name=column ...]
-        if s.startswith("alias ") or s.startswith("define "):
-            pairs = re.findall(r"(\w+)=([^\s]+)", raw, flags=re.IGNORECASE)
-            return {"task": "alias", "aliases": {k.lower(): v for k, v in pairs}}
-
-        if s.startswith("load"):
-            pairs = re.findall(r"(pattern|positions|dir)=([^\s]+)", raw, flags=re.IGNORECASE)
-            params = {k.lower(): v for k, v in pairs}
-            return {"task": "load", "params": params}
-
-        if s.startswith("analysis"):
-            key = self._find_param(raw, ["key", "param", "name"])
-            if not key:
-                remainder = raw[len("analysis"):].strip()
-                key = remainder if remainder else None
-            return {"task": "analysis_params", "key": key}
-
-        if "plot" in s or s.startswith("plot"):
-            interval = self._find_interval(s)
-            y = self._find_param(raw, ["y", "column", "value", "backscatter"]) or "backscatter"
-            x = self._find_param(raw, ["x"])
-            # Support 'scatter y vs x' syntax
-            if not x and "scatter" in s:
-                vs_match = re.search(r'scatter\s+(\w+)\s+vs\s+(\w+)', raw, re.IGNORECASE)
-                if vs_match:
-                    y = vs_match.group(1)
-                    x = vs_match.group(2)
-            if not x:
-                x = "timestamp"
-            # Allow shorthand 'plot <column>' when no y=... parameter is given
-            if y == "backscatter":
-                simple_match = re.match(r"plot\s+(\w+)(?=\s|$)", raw, flags=re.IGNORECASE)
-                if simple_match:
-                    y = simple_match.group(1)
-            # Parse smooth mode as bool or string
-            smooth = self._find_param(raw, ["smooth"])  # optional
-            # Optional LOWESS fraction (0-1)
-            lowess_frac = self._find_param(raw, ["frac", "lowess_frac"])  # optional
-            show = self._find_bool(raw, ["show"])      # optional
-            save = self._find_bool(raw, ["save"])      # optional
-            out = self._find_param(raw, ["out", "file", "path"])  # optional
-            base = {"y": y, "x": x, "interval": interval, "smooth": smooth, "lowess_frac": lowess_frac, "show": show, "save": save, "out": out}
-            base.update(self._extract_date_params(raw))
-            base.update(self._extract_transform_params(raw))
-            if "scatter" in s:
-                return {"task": "scatter_plot", **base}
-            return {"task": "time_series_plot", **base}
-
-        if "aggregate" in s and ("time" in s or re.search(r"\d+min|\d+h|\d+d", s)):
-            interval = self._find_interval(s) or "5min"
-            y = self._find_param(raw, ["y", "column", "value"])  # optional
-            cmd: Dict[str, Any] = {"task": "aggregate_time", "interval": interval}
-            if y:
-                cmd["y"] = y
-            return cmd
-
-        if "map" in s or "hex" in s:
-            y = self._find_param(raw, ["y", "value", "column", "backscatter"]) or "backscatter"
-            res = self._find_int(s, r"res=(\d+)") or 8
-            backend = None
-            if "matplotlib" in s or "mpl" in s:
-                backend = "matplotlib"
-            elif "folium" in s or "html" in s:
-                backend = "folium"
-            coastline_path = self._find_param(raw, ["coastline", "coast", "shapefile", "geojson"])
-            east_lim = self._find_range(raw, ["east_lim", "xlim"])  # optional
-            north_lim = self._find_range(raw, ["north_lim", "ylim"])  # optional
-            base = {"task": "hex_map", "y": y, "resolution": res, "backend": backend, "coastline_path": coastline_path, "east_lim": east_lim, "north_lim": north_lim}
-            base.update(self._extract_date_params(raw))
-            base.update(self._extract_transform_params(raw))
-            return base
-
-        # Create calculated variable: "create var hour=timestamp.dt.hour" or "calc depth_m=depth/1000"
-        if s.startswith("create") or s.startswith("calc"):
-            # Pattern 1: "create var <name>=<expression>" or "calc <name>=<expression>"
-            m = re.search(r"(?:create\s+var\s+|calc\s+)(\w+)=(.+)", raw, flags=re.IGNORECASE)
-            if m:
-                name = m.group(1).strip()
-                expression = m.group(2).strip()
-                return {"task": "create_variable", "name": name, "expression": expression}
-            
-            # Pattern 2: "create hour from timestamp" (temporal extraction shorthand)
-            m2 = re.search(r"create\s+(\w+)\s+from\s+(\w+)", raw, flags=re.IGNORECASE)
-            if m2:
-                attr_name = m2.group(1).strip().lower()
-                col_name = m2.group(2).strip()
-                # Map common temporal attributes
-                temporal_attrs = {
-                    "hour": "hour", "day": "day", "month": "month", "year": "year",
-                    "dayofweek": "dayofweek", "weekday": "dayofweek",
-                    "dayofyear": "dayofyear", "week": "isocalendar().week",
-                    "quarter": "quarter", "date": "date"
-                }
-                if attr_name in temporal_attrs:
-                    expression = f"{col_name}.dt.{temporal_attrs[attr_name]}"
-                    return {"task": "create_variable", "name": attr_name, "expression": expression}
-
-        # list available columns (especially for plotting)
-        if re.match(r"^(\s*(show|list)\s+)?columns\b", s) and "=" not in s:
-            return {"task": "list_columns"}
-
-        # Statistics: check for time-aggregated stats first
-        if s.startswith("stats") or "statistics" in s:
-            # Check for "by time" or time interval pattern
-            interval = self._find_interval(s)
-            if interval or " by time" in s or "by_time" in s:
-                # Time-aggregated stats
-                cols = self._find_list(raw, r"columns=([\w,]+)") or ["backscatter"]
-                base = {"task": "compute_stats_by_time", "columns": cols, "interval": interval or "5min"}
-                base.update(self._extract_date_params(raw))
-                base.update(self._extract_transform_params(raw))
-                return base
-            else:
-                # Regular stats (no time aggregation)
-                cols = self._find_list(raw, r"columns=([\w,]+)") or ["backscatter"]
-                return {"task": "compute_stats", "columns": cols}
-
-        if s in {"exit", "quit"}:
-            return {"task": "exit"}
-
-        if s in {"help", "?"}:
-            return {"task": "help"}
-
-        # default: show help (no implicit plotting)
-        return {"task": "help"}
+        hit = _TRIVIAL.get(raw.lower())
+        if hit is not None:
+            return dict(hit)
+        # Parsing is pure, so repeated commands (REPL history, scripts) come from the cache
+        return _copy_command(_parse_command(raw))
 
     def validate_command(self, command: Dict[str, Any]) -> Tuple[bool, str | None]:
         task = command.get("task")
@@ -244,206 +179,424 @@ class CommandInterpreter:
                 return False, "Missing y for boxplot"
         if task == "aggregate_time" and not command.get("interval"):
             return False, "Missing interval"
-        if task == "hex_map" and not command.get("y"):
+        if task in {"hex_map", "hex_map_stream"} and not command.get("y"):
             return False, "Missing value column for map"
         return True, None
 
-    def _find_interval(self, s: str) -> str | None:
-        m = re.search(r"(\d+min|\d+h|\d+d)", s)
-        return m.group(1) if m else None
-
-    def _find_param(self, raw: str, keys: list[str]) -> str | None:
-        """Find a parameter value for any of the given keys.
-
-        Supports both "key=value" and "key:value" syntaxes commonly used in the CLI.
-        Returns the first match found, case-insensitive.
-        """
-        for k in keys:
-            pattern = rf"(?<![\w]){re.escape(k)}=([^\s]+)"
-            m = re.search(pattern, raw, flags=re.IGNORECASE)
-            if m:
-                return m.group(1)
-            pattern_colon = rf"(?<![\w]){re.escape(k)}:([^\s]+)"
-            m2 = re.search(pattern_colon, raw, flags=re.IGNORECASE)
-            if m2:
-                return m2.group(1)
-        return None
 
-    def _find_int(self, s: str, pattern: str) -> int | None:
-        m = re.search(pattern, s)
-        return int(m.group(1)) if m else None
+@lru_cache(maxsize=256)
+def _parse_command(raw: str) -> Dict[str, Any]:
+    s = _lower(raw)
+    # Commands led by their verb are dispatched directly, unless a keyword the cascade
+    # checks earlier (e.g. a later 'boxplot' or 'plot') is present
+    head, sep, _ = s.partition(" ")
+    entry = _HEAD_DISPATCH.get(head)
+    if entry is not None and (head not in _VERBS_WITH_ARGS or sep):
+        handler, blockers = entry
+        if blockers is None or not blockers.search(s):
+            cmd = handler(raw, s)
+            if cmd is not None:
+                return cmd
+    # Garbage and unknown verbs would run the whole cascade only to end up at help
+    if not s.startswith(_CASCADE_PREFIXES) and not _RE_KW_ANY.search(s):
+        return {"task": "help"}
+    return _parse_by_keywords(raw, s)
 
-    def _find_list(self, raw: str, pattern: str) -> list[str] | None:
-        m = re.search(pattern, raw, flags=re.IGNORECASE)
-        if not m:
-            return None
-        return [t.strip() for t in m.group(1).split(",") if t.strip()]
-
-    def _find_bool(self, raw: str, keys: list[str]) -> bool | None:
-        for k in keys:
-            m = re.search(rf"{k}=([^\s]+)", raw, flags=re.IGNORECASE)
-            if m:
-                val = m.group(1).strip().lower()
-                if val in {"1", "true", "yes", "y"}:
-                    return True
-                if val in {"0", "false", "no", "n"}:
-                    return False
-        return None
 
-    def _find_range(self, raw: str, keys: list[str]) -> list[float] | None:
-        """Parse a numeric range of two values, e.g., east_lim=[12,20] or east_lim=12,20."""
-        for k in keys:
-            # Try bracketed form [a,b]
-            m = re.search(rf"{k}=\[([^\]]+)\]", raw, flags=re.IGNORECASE)
-            if m:
-                parts = [p.strip() for p in m.group(1).split(',') if p.strip()]
-                try:
-                    vals = [float(p) for p in parts]
-                    if len(vals) == 2:
-                        return vals
-                except ValueError:
-                    continue
-            # Try simple comma-separated form a,b
-            m2 = re.search(rf"{k}=([^\s]+)", raw, flags=re.IGNORECASE)
-            if m2:
-                text = m2.group(1)
-                parts = [p.strip() for p in text.split(',') if p.strip()]
-                try:
-                    vals = [float(p) for p in parts]
-                    if len(vals) == 2:
-                        return vals
-                except ValueError:
-                    continue
+def _parse_by_keywords(raw: str, s: str) -> Dict[str, Any]:
+    # Boxplot command
+    if s.startswith("boxplot") or " boxplot" in s:
+        return _parse_boxplot(raw, s)
+    # Scatter plotting can be invoked directly via 'scatter ...'
+    if s.startswith("scatter"):
+        return _parse_scatter(raw, s)
+    # Settings
+    if s.startswith("set "):
+        return _parse_set(raw, s)
+
+    # Define CLI variable aliases: alias name=column [name=column ...]
+    if s.startswith(("alias ", "define ")):
+        return _parse_alias(raw, s)
+
+    if s.startswith("load"):
+        return _parse_load(raw, s)
+
+    if s.startswith("analysis"):
+        return _parse_analysis(raw, s)
+
+    if "plot" in s:
+        return _parse_plot(raw, s)
+
+    if "aggregate" in s:
+        cmd = _parse_aggregate(raw, s)
+        if cmd is not None:
+            return cmd
+
+    if _RE_KW_MAP.search(s):
+        return _parse_map(raw, s)
+
+    # Create calculated variable: "create var hour=timestamp.dt.hour" or "calc depth_m=depth/1000"
+    if s.startswith(("create", "calc")):
+        cmd = _parse_create(raw, s)
+        if cmd is not None:
+            return cmd
+
+    # list available columns (especially for plotting)
+    if _RE_LIST_COLUMNS.match(s) and "=" not in s:
+        return {"task": "list_columns"}
+
+    # Statistics: check for time-aggregated stats first
+    if s.startswith("stats") or "statistics" in s:
+        return _parse_stats(raw, s)
+
+    if s in {"exit", "quit"}:
+        return {"task": "exit"}
+
+    if s in {"help", "?"}:
+        return {"task": "help"}
+
+    # default: show help (no implicit plotting)
+    return {"task": "help"}
+
+
+def _parse_boxplot(raw: str, s: str) -> Dict[str, Any]:
+    p = _collect_params(raw)
+    # y: required, x/group: optional
+    y = _find_param(p, ["y"])  # required unless using shorthand
+    x = _find_param(p, ["x", "group"])  # optional
+    # Support 'boxplot y vs x' syntax
+    vs_match = _RE_BOXPLOT_VS.search(s)
+    if vs_match:
+        y = _orig(raw, vs_match, 1)
+        x = _orig(raw, vs_match, 2)
+    # Shorthand: boxplot <column>
+    if not y:
+        y = _shorthand_arg(raw, "boxplot")
+    params: Dict[str, Any] = {"task": "plot_boxplot", "y": y}
+    if x:
+        params["x"] = x
+    # Extract temporal aggregation interval (e.g., 5min, 10min, 1h)
+    interval = _find_interval(raw)
+    if interval:
+        params["interval"] = interval
+    # Common params: dates and transforms
+    _extract_common_params(raw, s, params)
+    # Optional x-axis binning for continuous data: xbins (equal-width) or xqbins (quantile bins)
+    xbins = _find_param(p, ["xbins", "x_bins"])  # supports xbins= or xbins:
+    xqbins = _find_param(p, ["xqbins", "x_quantile_bins", "quantile_bins"])  # optional
+    if xbins is not None:
+        params["xbins"] = xbins
+    if xqbins is not None:
+        params["xqbins"] = xqbins
+    # Optional show/save/out
+    params["show"] = _find_bool(p, ["show"])  # may be None
+    params["save"] = _find_bool(p, ["save"])  # may be None
+    params["out"] = _find_param(p, ["out", "file", "path"])  # may be None
+    return params
+
+
+def _parse_scatter(raw: str, s: str) -> Dict[str, Any]:
+    p = _collect_params(raw)
+    interval = _find_interval(s)
+    y = _find_param(p, ["y", "column", "value", "backscatter"])  # optional
+    x = _find_param(p, ["x"])  # optional
+    # Support 'scatter y vs x' syntax
+    vs_match = _RE_SCATTER_VS.search(s)
+    if vs_match:
+        y = _orig(raw, vs_match, 1)
+        x = _orig(raw, vs_match, 2)
+    # Support 'scatter <y>' shorthand
+    if not y:
+        y = _shorthand_arg(raw, "scatter")
+    if not x:
+        x = "timestamp"
+    # Parse smooth mode: supports true/false/loess
+    smooth = _find_param(p, ["smooth"])  # optional, may be bool or string
+    # Optional LOWESS fraction (0-1), e.g., frac=0.1 or lowess_frac=0.2
+    lowess_frac = _find_param(p, ["frac", "lowess_frac"])  # optional
+    show = _find_bool(p, ["show"])      # optional
+    save = _find_bool(p, ["save"])      # optional
+    out = _find_param(p, ["out", "file", "path"])  # optional
+    base: Dict[str, Any] = {
+        "task": "scatter_plot",
+        "y": y,
+        "x": x,
+        "interval": interval,
+        "smooth": smooth,
+        "lowess_frac": lowess_frac,
+        "show": show,
+        "save": save,
+        "out": out,
+    }
+    # Add date/transform params
+    _extract_common_params(raw, s, base)
+    return base
+
+
+def _parse_set(raw: str, s: str) -> Dict[str, Any]:
+    # set key=value
+    return {"task": "set", "params": {m.group(1).lower(): m.group(2) for m in _RE_KV.finditer(raw)}}
+
+
+def _parse_alias(raw: str, s: str) -> Dict[str, Any]:
+    return {"task": "alias", "aliases": {m.group(1).lower(): m.group(2) for m in _RE_KV.finditer(raw)}}
+
+
+def _parse_load(raw: str, s: str) -> Dict[str, Any]:
+    params = {m.group(1): _orig(raw, m, 2) for m in _RE_LOAD.finditer(s)}
+    return {"task": "load", "params": params}
+
+
+def _parse_analysis(raw: str, s: str) -> Dict[str, Any]:
+    key = _find_param(_collect_params(raw), ["key", "param", "name"])
+    if not key:
+        remainder = raw[len("analysis"):].strip()
+        key = remainder if remainder else None
+    return {"task": "analysis_params", "key": key}
+
+
+def _parse_plot(raw: str, s: str) -> Dict[str, Any]:
+    p = _collect_params(raw)
+    interval = _find_interval(s)
+    y = _find_param(p, ["y", "column", "value", "backscatter"]) or "backscatter"
+    x = _find_param(p, ["x"])
+    # Support 'scatter y vs x' syntax
+    if not x and "scatter" in s:
+        vs_match = _RE_SCATTER_VS.search(s)
+        if vs_match:
+            y = _orig(raw, vs_match, 1)
+            x = _orig(raw, vs_match, 2)
+    if not x:
+        x = "timestamp"
+    # Allow shorthand 'plot <column>' when no y=... parameter is given
+    if y == "backscatter":
+        y = _shorthand_arg(raw, "plot", whole_token=True) or y
+    # Parse smooth mode as bool or string
+    smooth = _find_param(p, ["smooth"])  # optional
+    # Optional LOWESS fraction (0-1)
+    lowess_frac = _find_param(p, ["frac", "lowess_frac"])  # optional
+    show = _find_bool(p, ["show"])      # optional
+    save = _find_bool(p, ["save"])      # optional
+    out = _find_param(p, ["out", "file", "path"])  # optional
+    task = "scatter_plot" if "scatter" in s else "time_series_plot"
+    base: Dict[str, Any] = {"task": task, "y": y, "x": x, "interval": interval, "smooth": smooth, "lowess_frac": lowess_frac, "show": show, "save": save, "out": out}
+    _extract_common_params(raw, s, base)
+    return base
+
+
+def _parse_aggregate(raw: str, s: str) -> Dict[str, Any] | None:
+    # Only 'aggregate ... time' or 'aggregate ... <interval>' is an aggregation command
+    interval = _find_interval(s)
+    if interval is None and "time" not in s:
         return None
+    interval = interval or "5min"
+    y = _find_param(_collect_params(raw), ["y", "column", "value"])  # optional
+    cmd: Dict[str, Any] = {"task": "aggregate_time", "interval": interval}
+    if y:
+        cmd["y"] = y
+    return cmd
 
-    def _extract_date_params(self, input_string: str) -> Dict[str, str]:
-        params: Dict[str, str] = {}
-        # start_date=... (support quoted or unquoted)
-        m = re.search(r"start_date=[\"']?([0-9\-\s:T+]+)[\"']?", input_string, flags=re.IGNORECASE)
-        if m:
-            params["start_date"] = m.group(1).strip("\"'")
-        m2 = re.search(r"end_date=[\"']?([0-9\-\s:T+]+)[\"']?", input_string, flags=re.IGNORECASE)
-        if m2:
-            params["end_date"] = m2.group(1).strip("\"'")
-        return params
-
-    def _extract_transform_params(self, input_string: str) -> Dict[str, Any]:
-        params: Dict[str, Any] = {}
-        m = re.search(r"log=(true|false|yes|no|1|0)", input_string, flags=re.IGNORECASE)
+
+def _parse_map(raw: str, s: str) -> Dict[str, Any]:
+    p = _collect_params(raw)
+    y = _find_param(p, ["y", "value", "column", "backscatter"]) or "backscatter"
+    res = _find_int(s, _RE_RES) or 8
+    backend = None
+    if "matplotlib" in s or "mpl" in s:
+        backend = "matplotlib"
+    elif "folium" in s or "html" in s:
+        backend = "folium"
+    coastline_path = _find_param(p, ["coastline", "coast", "shapefile", "geojson"])
+    east_lim = _find_range(s, ["east_lim", "xlim"])  # optional
+    north_lim = _find_range(s, ["north_lim", "ylim"])  # optional
+    base: Dict[str, Any] = {"task": "hex_map", "y": y, "resolution": res, "backend": backend, "coastline_path": coastline_path, "east_lim": east_lim, "north_lim": north_lim}
+    if _find_bool(p, ["stream"]):
+        # Out-of-core variant: aggregates the files chunk by chunk without a prior 'load'
+        base["task"] = "hex_map_stream"
+    _extract_common_params(raw, s, base)
+    return base
+
+
+def _parse_create(raw: str, s: str) -> Dict[str, Any] | None:
+    # Pattern 1: "create var <name>=<expression>" or "calc <name>=<expression>"
+    m = _RE_CREATE_VAR.search(s)
+    if m:
+        name = _orig(raw, m, 1).strip()
+        expression = _orig(raw, m, 2).strip()
+        return {"task": "create_variable", "name": name, "expression": expression}
+    
+    # Pattern 2: "create hour from timestamp" (temporal extraction shorthand)
+    m2 = _RE_CREATE_FROM.search(s)
+    if m2:
+        attr_name = m2.group(1).strip()
+        col_name = _orig(raw, m2, 2).strip()
+        # Map common temporal attributes
+        temporal_attrs = {
+            "hour": "hour", "day": "day", "month": "month", "year": "year",
+            "dayofweek": "dayofweek", "weekday": "dayofweek",
+            "dayofyear": "dayofyear", "week": "isocalendar().week",
+            "quarter": "quarter", "date": "date"
+        }
+        if attr_name in temporal_attrs:
+            expression = f"{col_name}.dt.{temporal_attrs[attr_name]}"
+            return {"task": "create_variable", "name": attr_name, "expression": expression}
+    return None
+
+
+def _parse_stats(raw: str, s: str) -> Dict[str, Any]:
+    # Check for "by time" or time interval pattern
+    interval = _find_interval(s)
+    if interval or " by time" in s or "by_time" in s:
+        # Time-aggregated stats
+        cols = _find_list(raw, s, _RE_COLUMNS) or ["backscatter"]
+        base: Dict[str, Any] = {"task": "compute_stats_by_time", "columns": cols, "interval": interval or "5min"}
+        _extract_common_params(raw, s, base)
+        return base
+    else:
+        # Regular stats (no time aggregation)
+        cols = _find_list(raw, s, _RE_COLUMNS) or ["backscatter"]
+        return {"task": "compute_stats", "columns": cols}
+
+
+# Leading verb -> (handler, keyword pattern that sends the command back to the cascade
+# because an earlier branch there would claim it). Handlers returning None also fall back.
+_HEAD_DISPATCH: Dict[str, Tuple[Callable[[str, str], Dict[str, Any] | None], re.Pattern[str] | None]] = {
+    "boxplot": (_parse_boxplot, None),
+    "scatter": (_parse_scatter, _RE_KW_BOXPLOT),
+    "set": (_parse_set, _RE_KW_BOXPLOT),
+    "alias": (_parse_alias, _RE_KW_BOXPLOT),
+    "define": (_parse_alias, _RE_KW_BOXPLOT),
+    "load": (_parse_load, _RE_KW_BOXPLOT),
+    "analysis": (_parse_analysis, _RE_KW_BOXPLOT),
+    "plot": (_parse_plot, _RE_KW_BOXPLOT),
+    "aggregate": (_parse_aggregate, _RE_KW_PLOT),
+    "map": (_parse_map, _RE_KW_PLOT_AGG),
+    "hex": (_parse_map, _RE_KW_PLOT_AGG),
+    "create": (_parse_create, _RE_KW_PLOT_AGG_MAP),
+    "calc": (_parse_create, _RE_KW_PLOT_AGG_MAP),
+    "stats": (_parse_stats, _RE_KW_PLOT_AGG_MAP),
+    "statistics": (_parse_stats, _RE_KW_PLOT_AGG_MAP),
+}
+
+
+# Verbs the cascade only recognises when followed by arguments ("set ", "alias ", "define ")
+_VERBS_WITH_ARGS = frozenset({"set", "alias", "define"})
+
+
+def _find_interval(s: str) -> str | None:
+    m = _RE_INTERVAL.search(s)
+    return m.group(1) if m else None
+
+
+def _collect_params(raw: str) -> Dict[Tuple[str, str], str]:
+    """Tokenize a command once into ``(key, separator) -> value`` pairs.
+
+    Keys are lowercased; the first occurrence of each key/separator wins.
+    """
+    params: Dict[Tuple[str, str], str] = {}
+    for tok in raw.split():
+        m = _RE_PARAM_TOKEN.match(tok)
         if m:
-            val = m.group(1).lower()
-            params["log"] = val in {"true", "yes", "1"}
-        # Also support colon syntax for log
-        m_colon = re.search(r"log:([^\s]+)", input_string, flags=re.IGNORECASE)
-        if m_colon and "log" not in params:
-            val = m_colon.group(1).lower()
-            params["log"] = val in {"true", "yes", "1"}
-        # Support 'logy' alias to avoid y being treated as columns in plot commands
-        m_logy = re.search(r"logy=(true|false|yes|no|1|0)", input_string, flags=re.IGNORECASE)
-        if m_logy and "log" not in params:
-            val = m_logy.group(1).lower()
-            params["log"] = val in {"true", "yes", "1"}
-        m_logy_colon = re.search(r"logy:([^\s]+)", input_string, flags=re.IGNORECASE)
-        if m_logy_colon and "log" not in params:
-            val = m_logy_colon.group(1).lower()
-            params["log"] = val in {"true", "yes", "1"}
-        # Negative transform (alias: neg)
-        m_neg = re.search(r"(negative|neg)=(true|false|yes|no|1|0)", input_string, flags=re.IGNORECASE)
-        if m_neg:
-            val = m_neg.group(2).lower()
-            params["negative"] = val in {"true", "yes", "1"}
-        m_neg_colon = re.search(r"(negative|neg):([^\s]+)", input_string, flags=re.IGNORECASE)
-        if m_neg_colon and "negative" not in params:
-            val = m_neg_colon.group(2).lower()
-            params["negative"] = val in {"true", "yes", "1"}
-        m2 = re.search(r"min=([0-9.+-]+)", input_string, flags=re.IGNORECASE)
-        if m2:
-            try:
-                params["min"] = float(m2.group(1))
-            except Exception:
-                pass
-        # Colon syntax for min
-        m2c = re.search(r"min:([0-9.+-]+)", input_string, flags=re.IGNORECASE)
-        if m2c and "min" not in params:
-            try:
-                params["min"] = float(m2c.group(1))
-            except Exception:
-                pass
-        m3 = re.search(r"max=([0-9.+-]+)", input_string, flags=re.IGNORECASE)
-        if m3:
-            try:
-                params["max"] = float(m3.group(1))
-            except Exception:
-                pass
-        # Colon syntax for max
-        m3c = re.search(r"max:([0-9.+-]+)", input_string, flags=re.IGNORECASE)
-        if m3c and "max" not in params:
-            try:
-                params["max"] = float(m3c.group(1))
-            except Exception:
-                pass
-
-        # X-axis specific transforms: xlog/xmin/xmax (also accept logx)
-        mx = re.search(r"(xlog|logx)=(true|false|yes|no|1|0)", input_string, flags=re.IGNORECASE)
-        if mx:
-            val = mx.group(2).lower()
-            params["xlog"] = val in {"true", "yes", "1"}
-        mx_colon = re.search(r"(xlog|logx):([^\s]+)", input_string, flags=re.IGNORECASE)
-        if mx_colon and "xlog" not in params:
-            val = mx_colon.group(2).lower()
-            params["xlog"] = val in {"true", "yes", "1"}
-        xmin = re.search(r"xmin=([0-9.+-]+)", input_string, flags=re.IGNORECASE)
-        if xmin:
-            try:
-                params["xmin"] = float(xmin.group(1))
-            except Exception:
-                pass
-        xmin_c = re.search(r"xmin:([0-9.+-]+)", input_string, flags=re.IGNORECASE)
-        if xmin_c and "xmin" not in params:
-            try:
-                params["xmin"] = float(xmin_c.group(1))
-            except Exception:
-                pass
-        xmax = re.search(r"xmax=([0-9.+-]+)", input_string, flags=re.IGNORECASE)
-        if xmax:
-            try:
-                params["xmax"] = float(xmax.group(1))
-            except Exception:
-                pass
-        xmax_c = re.search(r"xmax:([0-9.+-]+)", input_string, flags=re.IGNORECASE)
-        if xmax_c and "xmax" not in params:
-            try:
-                params["xmax"] = float(xmax_c.group(1))
-            except Exception:
-                pass
-        
-        # Outlier filtering parameters
-        # outlier_method or outliers: zscore/iqr/percentile/modified_zscore
-        m_outlier = re.search(
-            r"(outlier_method|outliers|outlier)=(zscore|iqr|percentile|modified[_-]?zscore|mzscore)",
-            input_string,
-            flags=re.IGNORECASE,
-        )
-        if m_outlier:
-            params["outlier_method"] = m_outlier.group(2).lower()
-        m_outlier_colon = re.search(r"(outlier_method|outliers|outlier):([^\s]+)", input_string, flags=re.IGNORECASE)
-        if m_outlier_colon and "outlier_method" not in params:
-            val = m_outlier_colon.group(2).lower()
-            if val in {"zscore", "iqr", "percentile", "modified_zscore", "modified-zscore", "mzscore"}:
-                params["outlier_method"] = val
-        
-        # z_thresh: threshold for zscore method (default 3.0)
-        m_zthresh = re.search(r"z_thresh=([0-9.+-]+)", input_string, flags=re.IGNORECASE)
-        if m_zthresh:
-            try:
-                params["z_thresh"] = float(m_zthresh.group(1))
-            except Exception:
-                pass
-        m_zthresh_c = re.search(r"z_thresh:([0-9.+-]+)", input_string, flags=re.IGNORECASE)
-        if m_zthresh_c and "z_thresh" not in params:
-            try:
-                params["z_thresh"] = float(m_zthresh_c.group(1))
-            except Exception:
-                pass
-        
-        return params
+            params.setdefault((m.group(1).lower(), m.group(2)), m.group(3))
+    return params
+
+
+def _find_param(params: Dict[Tuple[str, str], str], keys: list[str]) -> str | None:
+    """Find a parameter value for any of the given keys.
+
+    Supports both "key=value" and "key:value" syntaxes commonly used in the CLI.
+    Returns the first match found, case-insensitive.
+    """
+    for k in keys:
+        val = params.get((k, "=")) or params.get((k, ":"))
+        if val is not None:
+            return val
+    return None
+
+
+def _find_int(s: str, pattern: re.Pattern[str]) -> int | None:
+    m = pattern.search(s)
+    return int(m.group(1)) if m else None
+
+
+def _find_list(raw: str, s: str, pattern: re.Pattern[str]) -> list[str] | None:
+    m = pattern.search(s)
+    if not m:
+        return None
+    return [t.strip() for t in _orig(raw, m).split(",") if t.strip()]
+
+
+def _find_bool(params: Dict[Tuple[str, str], str], keys: list[str]) -> bool | None:
+    for k in keys:
+        val = params.get((k, "="))
+        if val is not None:
+            val = val.lower()
+            if val in _TRUE:
+                return True
+            if val in _FALSE:
+                return False
+    return None
+
+
+def _find_range(s: str, keys: list[str]) -> list[float] | None:
+    """Parse a numeric range of two values, e.g., east_lim=[12,20] or east_lim=12,20."""
+    # float() does not care about case, so the lowercased command will do
+    for k in keys:
+        m = _RANGE_RES[k].search(s)
+        if not m:
+            continue
+        text = m.group(1) if m.group(1) is not None else m.group(2)
+        vals = [_to_float(p.strip()) for p in text.split(",") if p.strip()]
+        if len(vals) == 2 and None not in vals:
+            return vals
+    return None
+
+
+def _extract_common_params(raw: str, s: str, params: Dict[str, Any]) -> None:
+    """Add date (start_date/end_date) and transform (log/negative/min/max/xlog/xmin/xmax/
+    outlier_method/z_thresh) parameters to ``params`` in place."""
+    if "=" not in s and ":" not in s:
+        return
+    # Single scan over whitespace tokens; '=' takes precedence over ':' for the same key
+    dates: Dict[str, str] = {}
+    found: Dict[Tuple[str, str], str] = {}
+    for tok in _RE_TOKEN.finditer(s):
+        m = _RE_PARAM_TOKEN.match(tok.group())
+        if not m:
+            continue
+        key, sep, val = m.groups()
+        if key in _DATE_KEYS:
+            if sep == "=" and key not in dates:
+                d = _RE_DATE_VALUE.match(s, tok.start() + len(key) + 1)
+                if d:
+                    dates[key] = _orig(raw, d).strip("\"'")
+            continue
+        slot = (_TRANSFORM_ALIASES.get(key, key), sep)
+        accept = _TRANSFORM_SLOTS.get(slot)
+        if accept is None or slot in found:
+            continue
+        v = accept.match(val)
+        if v:
+            found[slot] = v.group(0)
+    params.update(dates)
+    if not found:
+        return
+
+    for name, slots in _TRANSFORM_BOOLS:
+        for slot in slots:
+            if slot in found:
+                params[name] = found[slot] in _TRANSFORM_TRUE
+                break
+    for name in _TRANSFORM_FLOATS:
+        for sep in ("=", ":"):
+            val = _to_float(found.get((name, sep), ""))
+            if val is not None:
+                params[name] = val
+                break
+
+    # Outlier filtering parameters
+    # outlier_method or outliers: zscore/iqr/percentile/modified_zscore
+    if ("outlier_method", "=") in found:
+        params["outlier_method"] = found[("outlier_method", "=")]
+    elif found.get(("outlier_method", ":")) in _OUTLIER_METHODS:
+        params["outlier_method"] = found[("outlier_method", ":")]
@@ -1,13 +1,20 @@
 from __future__ import annotations
 
+import hashlib
+import io
+import json
 import logging
+from collections import OrderedDict
+from concurrent.futures import Future, wait
 from dataclasses import dataclass
 from pathlib import Path
 from types import SimpleNamespace
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 import os
 import sys
 import matplotlib
@@ -16,16 +23,24 @@ import matplotlib.pyplot as plt
 from aggregation.spatial_aggregator import SpatialAggregator
 from aggregation.temporal_aggregator import TemporalAggregator
 from analysis.statistics import StatisticsCalculator
+from data_loader.cache_manager import CacheManager
 from data_loader.csv_loader import AcousticsDataLoader
 from data_loader.position_merger import PositionMerger
 from visualization.map_generator import HexagonalMapGenerator
 from visualization.time_series_plots import TimeSeriesPlotter
-from utils.io_helpers import read_config, setup_logging
+from utils.io_helpers import read_config, setup_logging, write_artifact
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _first_present(candidates: tuple[str, ...], names: set[str]) -> str | None:
+    for name in candidates:
+        if name in names:
+            return name
+    return None
+
+
+@dataclass(slots=True)
 class ExecutionResult:
     ok: bool
     message: str
@@ -34,6 +49,48 @@ class ExecutionResult:
 
 
 class TaskExecutor:
+    __slots__ = (
+        "config",
+        "data",
+        "positions",
+        "merged",
+        "temporal",
+        "spatial",
+        "stats",
+        "plotter",
+        "mapgen",
+        "state",
+        "last_stats_dataset",
+        "analysis_params",
+        "analysis_context",
+        "aliases",
+        "pending_writes",
+        "_file_list_cache",
+        "_data_version",
+        "_row_cache",
+        "_load_params",
+    )
+
+    # Memoized row selections kept by _memo_rows
+    _ROW_CACHE_SIZE = 32
+    # Acoustic source columns renamed on load: 'time' -> 'timestamp'
+    _ACOUSTIC_COLUMN_MAP = {"time": "timestamp"}
+
+    # Tasks that operate on the merged frame; checked once in execute() rather than in every handler
+    _REQUIRES_DATA = frozenset(
+        {
+            "aggregate_time",
+            "time_series_plot",
+            "scatter_plot",
+            "plot_boxplot",
+            "hex_map",
+            "compute_stats",
+            "compute_stats_by_time",
+            "create_variable",
+            "list_columns",
+        }
+    )
+
     def __init__(self, config_path: Path = Path("config/settings.yaml"), analysis_params_path: Path | None = None):
         self.config = read_config(config_path)
         setup_logging(self.config.get("logging", {}).get("level", "INFO"))
@@ -62,141 +119,185 @@ class TaskExecutor:
             logger.debug("Analysis params file not found at %s", analysis_file)
         # User-defined CLI variable aliases, e.g., {"bs": "backscatter"}
         self.aliases: Dict[str, str] = {}
+        # Artifact writes still running on the background writer pool (see visualization.background_writes)
+        self.pending_writes: list[Future] = []
+        # (data_dir, pattern) -> (directory mtime_ns, matching files)
+        self._file_list_cache: Dict[tuple[str, str], tuple[int, list[Path]]] = {}
+        # Bumped whenever the merged frame changes; keys the memoized date/filter row selections
+        self._data_version = 0
+        self._row_cache: OrderedDict[tuple, np.ndarray | slice] = OrderedDict()
+        # dir/pattern/positions of the last successful 'load'; streamed maps read the same inputs
+        self._load_params: Dict[str, Any] = {}
 
     def execute(self, command: Dict[str, Any]) -> ExecutionResult:
         task = command.get("task")
         try:
-            if task == "coords_info":
-                return self._coords_info()
-                def _coords_info(self) -> ExecutionResult:
-                    coords_cfg = self.config.get("coordinates", {})
-                    columns = coords_cfg.get("columns", {})
-                    crs_info = f"Input CRS: {coords_cfg.get('input_crs', 'EPSG:4326')}\nOutput CRS: {coords_cfg.get('output_crs', 'EPSG:3006')}\nTransform on load: {coords_cfg.get('transform_on_load', True)}"
-                    col_info = "Columns:\n  " + ", ".join(f"{k}: {v}" for k, v in columns.items())
-                    active_crs = coords_cfg.get('active_crs', coords_cfg.get('output_crs', 'EPSG:3006'))
-                    msg = f"Active CRS: {active_crs}\n{crs_info}\n{col_info}"
-                    return ExecutionResult(True, msg)
-            if task == "set":
-                self.state.update(command.get("params", {}))
-                return ExecutionResult(True, f"Updated settings: {command.get('params', {})}")
-
-            if task == "alias":
-                new_aliases = command.get("aliases", {})
-                self.aliases.update(new_aliases)
-                return ExecutionResult(True, f"Added aliases: {new_aliases}")
-
-            if task == "load":
-                return self._load_data(command.get("params", {}))
-
-            if task == "aggregate_time":
-                return self._aggregate_time(command["interval"], command.get("y"))
-
-            if task == "time_series_plot":
-                # Build per-command options (do not persist across commands)
-                opts = {
-                    "start_date": command.get("start_date"),
-                    "end_date": command.get("end_date"),
-                    "log": command.get("log", False),
-                    "negative": command.get("negative", False),
-                    "min": command.get("min"),
-                    "max": command.get("max"),
-                    "lowess_frac": command.get("lowess_frac"),
-                    "outlier_method": command.get("outlier_method"),
-                    "z_thresh": command.get("z_thresh", 3.0),
-                }
-                return self._plot_time_series(
-                    self._resolve_column(command["y"]),
-                    command.get("interval"),
-                    command.get("smooth"),
-                    command.get("show"),
-                    command.get("save"),
-                    command.get("out"),
-                    opts,
-                )
-
-            if task == "scatter_plot":
-                opts = {
-                    "start_date": command.get("start_date"),
-                    "end_date": command.get("end_date"),
-                    "log": command.get("log", False),
-                    "negative": command.get("negative", False),
-                    "min": command.get("min"),
-                    "max": command.get("max"),
-                    "xlog": command.get("xlog", False),
-                    "xmin": command.get("xmin"),
-                    "xmax": command.get("xmax"),
-                    "lowess_frac": command.get("lowess_frac"),
-                    "outlier_method": command.get("outlier_method"),
-                    "z_thresh": command.get("z_thresh", 3.0),
-                }
-                return self._plot_scatter(
-                    command.get("x"),
-                    command.get("y"),
-                    command.get("interval"),
-                    command.get("smooth"),
-                    command.get("show"),
-                    command.get("save"),
-                    command.get("out"),
-                    opts,
-                )
-
-            if task == "plot_boxplot":
-                return self._plot_boxplot(command)
-
-            if task == "hex_map":
-                opts = {
-                    "start_date": command.get("start_date"),
-                    "end_date": command.get("end_date"),
-                    "min": command.get("min"),
-                    "max": command.get("max"),
-                    "negative": command.get("negative", False),
-                    "outlier_method": command.get("outlier_method"),
-                    "z_thresh": command.get("z_thresh", 3.0),
-                }
-                return self._hex_map(
-                    self._resolve_column(command["y"]),
-                    command.get("resolution", 8),
-                    command.get("backend"),
-                    show=True,
-                    coastline_path=command.get("coastline_path"),
-                    east_lim=command.get("east_lim"),
-                    north_lim=command.get("north_lim"),
-                    opts=opts,
-                )
-
-            if task == "compute_stats":
-                cols = [self._resolve_column(c) for c in command["columns"]]
-                return self._compute_stats(cols)
-
-            if task == "compute_stats_by_time":
-                cols = [self._resolve_column(c) for c in command["columns"]]
-                opts = {
-                    "start_date": command.get("start_date"),
-                    "end_date": command.get("end_date"),
-                    "outlier_method": command.get("outlier_method"),
-                    "z_thresh": command.get("z_thresh", 3.0),
-                }
-                return self._compute_stats_by_time(cols, command["interval"], opts)
-
-            if task == "create_variable":
-                return self._create_variable(command.get("name"), command.get("expression"))
-
-            if task == "analysis_params":
-                return self._analysis_params(command.get("key"))
+            # One dict lookup per command instead of a chain of string comparisons
+            handler = self._DISPATCH.get(task) if isinstance(task, str) else None
+            if handler is None:
+                return ExecutionResult(False, f"Unknown task: {task}")
+            if task in self._REQUIRES_DATA and self.merged is None:
+                return ExecutionResult(False, "No data loaded. Use 'load' command.")
+            return handler(self, command)
+        except Exception as e:  # noqa: BLE001
+            logger.exception("Error executing task")
+            return ExecutionResult(False, f"Error: {e}")
 
-            if task == "list_columns":
-                return self._list_columns()
+    def _task_coords_info(self, command: Dict[str, Any]) -> ExecutionResult:
+        return self._coords_info()
+
+    def _task_set(self, command: Dict[str, Any]) -> ExecutionResult:
+        self.state.update(command.get("params", {}))
+        return ExecutionResult(True, f"Updated settings: {command.get('params', {})}")
+
+    def _task_alias(self, command: Dict[str, Any]) -> ExecutionResult:
+        new_aliases = command.get("aliases", {})
+        self.aliases.update(new_aliases)
+        return ExecutionResult(True, f"Added aliases: {new_aliases}")
+
+    def _task_load(self, command: Dict[str, Any]) -> ExecutionResult:
+        return self._load_data(command.get("params", {}))
+
+    def _task_aggregate_time(self, command: Dict[str, Any]) -> ExecutionResult:
+        return self._aggregate_time(command["interval"], command.get("y"))
+
+    def _task_time_series_plot(self, command: Dict[str, Any]) -> ExecutionResult:
+        # Build per-command options (do not persist across commands)
+        opts = {
+            "start_date": command.get("start_date"),
+            "end_date": command.get("end_date"),
+            "log": command.get("log", False),
+            "negative": command.get("negative", False),
+            "min": command.get("min"),
+            "max": command.get("max"),
+            "lowess_frac": command.get("lowess_frac"),
+            "outlier_method": command.get("outlier_method"),
+            "z_thresh": command.get("z_thresh", 3.0),
+        }
+        return self._plot_time_series(
+            self._resolve_column(command["y"]),
+            command.get("interval"),
+            command.get("smooth"),
+            command.get("show"),
+            command.get("save"),
+            command.get("out"),
+            opts,
+        )
 
-            if task == "help":
-                return ExecutionResult(True, self.help_text())
+    def _task_scatter_plot(self, command: Dict[str, Any]) -> ExecutionResult:
+        opts = {
+            "start_date": command.get("start_date"),
+            "end_date": command.get("end_date"),
+            "log": command.get("log", False),
+            "negative": command.get("negative", False),
+            "min": command.get("min"),
+            "max": command.get("max"),
+            "xlog": command.get("xlog", False),
+            "xmin": command.get("xmin"),
+            "xmax": command.get("xmax"),
+            "lowess_frac": command.get("lowess_frac"),
+            "outlier_method": command.get("outlier_method"),
+            "z_thresh": command.get("z_thresh", 3.0),
+        }
+        return self._plot_scatter(
+            command.get("x"),
+            command.get("y"),
+            command.get("interval"),
+            command.get("smooth"),
+            command.get("show"),
+            command.get("save"),
+            command.get("out"),
+            opts,
+        )
 
-            if task == "exit":
-                return ExecutionResult(True, "exit")
+    def _task_plot_boxplot(self, command: Dict[str, Any]) -> ExecutionResult:
+        return self._plot_boxplot(command)
+
+    def _task_hex_map(self, command: Dict[str, Any]) -> ExecutionResult:
+        # 'hex_map_stream' reads the files chunk by chunk instead of using the loaded frame
+        opts = {
+            "start_date": command.get("start_date"),
+            "end_date": command.get("end_date"),
+            "min": command.get("min"),
+            "max": command.get("max"),
+            "negative": command.get("negative", False),
+            "outlier_method": command.get("outlier_method"),
+            "z_thresh": command.get("z_thresh", 3.0),
+        }
+        hex_map = self._hex_map_streaming if command.get("task") == "hex_map_stream" else self._hex_map
+        return hex_map(
+            self._resolve_column(command["y"]),
+            command.get("resolution", 8),
+            command.get("backend"),
+            show=True,
+            coastline_path=command.get("coastline_path"),
+            east_lim=command.get("east_lim"),
+            north_lim=command.get("north_lim"),
+            opts=opts,
+        )
 
-            return ExecutionResult(False, f"Unknown task: {task}")
-        except Exception as e:  # noqa: BLE001
-            logger.exception("Error executing task")
-            return ExecutionResult(False, f"Error: {e}")
+    def _task_compute_stats(self, command: Dict[str, Any]) -> ExecutionResult:
+        cols = [self._resolve_column(c) for c in command["columns"]]
+        return self._compute_stats(cols)
+
+    def _task_compute_stats_by_time(self, command: Dict[str, Any]) -> ExecutionResult:
+        cols = [self._resolve_column(c) for c in command["columns"]]
+        opts = {
+            "start_date": command.get("start_date"),
+            "end_date": command.get("end_date"),
+            "outlier_method": command.get("outlier_method"),
+            "z_thresh": command.get("z_thresh", 3.0),
+        }
+        return self._compute_stats_by_time(cols, command["interval"], opts)
+
+    def _task_create_variable(self, command: Dict[str, Any]) -> ExecutionResult:
+        return self._create_variable(command.get("name"), command.get("expression"))
+
+    def _task_analysis_params(self, command: Dict[str, Any]) -> ExecutionResult:
+        return self._analysis_params(command.get("key"))
+
+    def _task_list_columns(self, command: Dict[str, Any]) -> ExecutionResult:
+        return self._list_columns()
+
+    def _task_clear_cache(self, command: Dict[str, Any]) -> ExecutionResult:
+        return self._clear_cache()
+
+    def _task_sync(self, command: Dict[str, Any]) -> ExecutionResult:
+        return self._sync_writes()
+
+    def _task_help(self, command: Dict[str, Any]) -> ExecutionResult:
+        return ExecutionResult(True, self.help_text())
+
+    def _task_exit(self, command: Dict[str, Any]) -> ExecutionResult:
+        # Do not leave artifacts half-written behind; report failed writes instead of exiting.
+        # The pending list is cleared either way, so a second 'exit' quits.
+        synced = self._sync_writes()
+        if not synced.ok:
+            return ExecutionResult(False, f"{synced.message}. Type 'exit' again to quit.")
+        return ExecutionResult(True, "exit")
+
+    # Task name -> handler, built once with the class
+    _DISPATCH: Dict[str, Callable[["TaskExecutor", Dict[str, Any]], ExecutionResult]] = {
+        "coords_info": _task_coords_info,
+        "set": _task_set,
+        "alias": _task_alias,
+        "load": _task_load,
+        "aggregate_time": _task_aggregate_time,
+        "time_series_plot": _task_time_series_plot,
+        "scatter_plot": _task_scatter_plot,
+        "plot_boxplot": _task_plot_boxplot,
+        "hex_map": _task_hex_map,
+        "hex_map_stream": _task_hex_map,
+        "compute_stats": _task_compute_stats,
+        "compute_stats_by_time": _task_compute_stats_by_time,
+        "create_variable": _task_create_variable,
+        "analysis_params": _task_analysis_params,
+        "list_columns": _task_list_columns,
+        "clear_cache": _task_clear_cache,
+        "sync": _task_sync,
+        "help": _task_help,
+        "exit": _task_exit,
+    }
 
     def dry_run(self, command: Dict[str, Any]) -> str:
         return f"Would execute: {command}"
@@ -209,13 +310,10 @@ class TaskExecutor:
         """
         # Prefer an explicit column present in current data over an alias
         alias = self.aliases.get(name)
-        cols = set()
-        if self.merged is not None:
-            cols = set(self.merged.columns)
-        elif self.data is not None:
-            cols = set(self.data.columns)
-        # If the literal name exists as a column, use it (avoid alias shadowing)
-        if name in cols:
+        frame = self.merged if self.merged is not None else self.data
+        # If the literal name exists as a column, use it (avoid alias shadowing).
+        # Index membership reuses the column index's own hash table, so no set is built per call
+        if frame is not None and name in frame.columns:
             return name
         # Otherwise, fall back to alias if defined
         if alias is not None:
@@ -223,15 +321,82 @@ class TaskExecutor:
         return name
 
     def _load_data(self, params: Dict[str, Any]) -> ExecutionResult:
+        """Load acoustic CSVs and positions and merge them into ``self.merged``.
+
+        The raw acoustic and position tables are not retained (``self.data``/``self.positions``
+        stay None) unless ``processing.retain_raw`` is set. The cached merged frame holds no raw
+        tables, so with ``retain_raw`` the cache is not read: every load re-parses the CSVs and
+        ``self.data``/``self.positions`` are always set. The cache is still refreshed.
+        """
+        try:
+            files, pos_file = self._input_files(params)
+        except FileNotFoundError as e:
+            return ExecutionResult(False, str(e))
+
+        # A previous load of the same, unmodified inputs is read back from Parquet instead of re-parsing the CSVs
+        retain_raw = bool(self.config.get("processing", {}).get("retain_raw", False))
+        cache = CacheManager(self._cache_dir())
+        cache_key = self._merged_cache_key(files, pos_file)
+        merged = None
+        if not retain_raw:
+            try:
+                merged = cache.load_from_cache(cache_key)
+            except Exception as e:  # noqa: BLE001
+                logger.warning("Ignoring unreadable cache entry %s (%s)", cache_key, e)
+        if merged is not None:
+            self.data = None
+            self.positions = None
+            self.merged = self._with_arrow_floats(merged)
+            self._data_changed()
+            self._load_params = dict(params)
+            return ExecutionResult(True, f"Loaded {len(merged)} merged rows from cache ({cache_key})")
+
+        # Load acoustic data: source column is 'time' -> normalize to 'timestamp'
+        loader = AcousticsDataLoader(column_map=dict(self._ACOUSTIC_COLUMN_MAP), timestamp_col="time")
+        data_cfg = self.config.get("data", {})
+        df = loader.load_csv_files(
+            files,
+            lazy=False,
+            engine=data_cfg.get("csv_engine", "pyarrow"),
+            parallel=bool(data_cfg.get("parallel_csv", True)),
+        )
+        positions = self._read_positions(pos_file)
+
+        merger = PositionMerger(acoustic_time_col="timestamp", position_time_col="timestamp", lat_col="latitude", lon_col="longitude")
+        # Use interpolation-based assignment to handle non-matching timestamps robustly
+        merged = merger.merge_positions_interpolated(df, positions)
+        if self.config.get("processing", {}).get("compact_dtypes", False):
+            self._compact_dtypes(merged)
+        try:
+            cache.save_to_cache(merged, cache_key)
+        except Exception as e:  # noqa: BLE001
+            logger.warning("Could not write cache entry %s (%s)", cache_key, e)
+        merged = self._with_arrow_floats(merged)
+
+        n_rows = len(df)
+        if retain_raw:
+            self.data = df
+            self.positions = positions
+        else:
+            # Tasks only read the merged frame; dropping the raw tables frees their memory
+            self.data = None
+            self.positions = None
+            del df, positions
+        self.merged = merged
+        self._data_changed()
+        self._load_params = dict(params)
+        return ExecutionResult(True, f"Loaded {n_rows} rows; merged with positions ({len(merged)} rows)")
+
+    def _input_files(self, params: Dict[str, Any]) -> tuple[list[Path], Path]:
+        """Acoustic files and positions file selected by ``params`` and the session state."""
         data_dir = Path(params.get("dir", self.state["data_dir"]))
         pattern = params.get("pattern", self.state["pattern"])
         pos_file = Path(params.get("positions", self.state["positions"]))
 
-        # Load acoustic data: source column is 'time' -> normalize to 'timestamp'
-        loader = AcousticsDataLoader(column_map={"time": "timestamp"}, timestamp_col="time")
-        files = loader.get_file_list(data_dir, pattern)
+        loader = AcousticsDataLoader(column_map=dict(self._ACOUSTIC_COLUMN_MAP), timestamp_col="time")
+        files = self._list_files(loader, data_dir, pattern)
         if not files:
-            return ExecutionResult(False, f"No files found in {data_dir} with pattern {pattern}")
+            raise FileNotFoundError(f"No files found in {data_dir} with pattern {pattern}")
 
         # Exclude the positions file from the acoustic file list if the pattern matches it
         # This prevents accidentally loading the positions file as acoustic data when using patterns like '*.txt'.
@@ -245,9 +410,7 @@ class TaskExecutor:
             )
         files = filtered
         if not files:
-            return ExecutionResult(False, f"After excluding positions file, no acoustic files remain in {data_dir} for pattern {pattern}")
-
-        df = loader.load_csv_files(files, lazy=False)
+            raise FileNotFoundError(f"After excluding positions file, no acoustic files remain in {data_dir} for pattern {pattern}")
 
         # Resolve positions path: accept absolute, relative, or relative to data_dir
         if not pos_file.exists():
@@ -258,58 +421,166 @@ class TaskExecutor:
             elif alt2.exists():
                 pos_file = alt2
             else:
-                return ExecutionResult(False, f"Position file not found: {pos_file}")
+                raise FileNotFoundError(f"Position file not found: {pos_file}")
+        return files, pos_file
+
+    def _read_positions(self, pos_file: Path) -> pd.DataFrame:
+        """Read the positions file into 'timestamp', 'latitude' and 'longitude' columns."""
         # Load positions with robust, case-insensitive column handling
         # Accept variants like 'Time'/'time', 'Lat'/'lat'/'latitude', 'Long'/'lon'/'longitude'
         sep = "\t" if pos_file.suffix.lower() in {".tsv", ".txt"} else ","
-        positions = pd.read_csv(pos_file, sep=sep)
-        col_lut = {c.lower().strip(): c for c in positions.columns}
-        # Identify canonical columns
-        time_key = next((k for k in ("time", "timestamp", "datetime", "date") if k in col_lut), None)
-        lat_key = next((k for k in ("lat", "latitude", "y") if k in col_lut), None)
-        lon_key = next((k for k in ("long", "lon", "longitude", "x") if k in col_lut), None)
+        try:
+            # Arrow's reader is multi-threaded and parses the timestamps itself, straight to
+            # nanoseconds, so the to_datetime pass below has nothing left to convert
+            table = pa_csv.read_csv(
+                pos_file,
+                parse_options=pa_csv.ParseOptions(delimiter=sep),
+                convert_options=pa_csv.ConvertOptions(timestamp_parsers=["%Y-%m-%d %H:%M:%S", pa_csv.ISO8601]),
+            )
+            positions = table.to_pandas(coerce_temporal_nanoseconds=True)
+        except pa.ArrowInvalid as e:
+            # It is stricter than the C parser (e.g. ragged rows); fall back rather than fail the load
+            logger.warning("PyArrow read of %s failed (%s); falling back to the C parser", pos_file, e)
+            positions = pd.read_csv(pos_file, sep=sep)
+        # Normalize the header once; the canonical columns are then looked up by name directly
+        positions.columns = [c.strip().lower() for c in positions.columns]
+        # Identify canonical columns (first candidate present wins)
+        present = set(positions.columns)
+        time_key = _first_present(("time", "timestamp", "datetime", "date"), present)
+        lat_key = _first_present(("lat", "latitude", "y"), present)
+        lon_key = _first_present(("long", "lon", "longitude", "x"), present)
         if not time_key:
             raise ValueError(f"Positions file missing time column (looked for one of time/timestamp/datetime/date). Columns: {list(positions.columns)}")
         if not lat_key or not lon_key:
             raise ValueError(f"Positions file missing latitude/longitude columns. Columns: {list(positions.columns)}")
-        positions = positions.rename(
-            columns={
-                col_lut[time_key]: "timestamp",
-                col_lut[lat_key]: "latitude",
-                col_lut[lon_key]: "longitude",
-            }
-        )
+        positions.rename(columns={time_key: "timestamp", lat_key: "latitude", lon_key: "longitude"}, inplace=True)
         # Ensure timestamp is datetime
         positions["timestamp"] = pd.to_datetime(positions["timestamp"], errors="coerce")
+        # Arrow keeps the inferred unit (often seconds); store nanoseconds like the acoustic frame
+        ts_dtype = positions["timestamp"].dtype
+        if pd.api.types.is_datetime64_dtype(ts_dtype) and ts_dtype != np.dtype("datetime64[ns]"):
+            positions["timestamp"] = positions["timestamp"].astype("datetime64[ns]")
         # Drop rows where timestamp failed to parse to avoid merge issues
         positions = positions.dropna(subset=["timestamp"]).reset_index(drop=True)
+        return positions
 
-        merger = PositionMerger(acoustic_time_col="timestamp", position_time_col="timestamp", lat_col="latitude", lon_col="longitude")
-        # Use interpolation-based assignment to handle non-matching timestamps robustly
-        merged = merger.merge_positions_interpolated(df, positions)
+    def _list_files(self, loader: AcousticsDataLoader, data_dir: Path, pattern: str) -> list[Path]:
+        """Glob ``pattern`` in ``data_dir``, reusing the last listing while the directory is unchanged.
 
-        self.data = df
-        self.positions = positions
-        self.merged = merged
-        return ExecutionResult(True, f"Loaded {len(df)} rows; merged with positions ({len(merged)} rows)")
+        Adding, removing or renaming an entry updates the directory mtime; recursive patterns
+        are always re-globbed since changes in subdirectories do not.
+        """
+        if "/" in pattern or "**" in pattern:
+            return loader.get_file_list(data_dir, pattern)
+        try:
+            mtime = os.stat(data_dir).st_mtime_ns
+        except OSError:
+            return loader.get_file_list(data_dir, pattern)
+        key = (str(data_dir), pattern)
+        cached = self._file_list_cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            return list(cached[1])
+        files = loader.get_file_list(data_dir, pattern)
+        self._file_list_cache[key] = (mtime, list(files))
+        return files
 
-    def _ensure_data(self) -> None:
-        if self.merged is None:
-            raise RuntimeError("No data loaded. Use 'load' command.")
+    def _background_writes(self) -> bool:
+        return bool(self.config.get("visualization", {}).get("background_writes", False))
+
+    def _track_write(self, future: Optional[Future]) -> None:
+        if future is None:
+            return
+        self.pending_writes = [f for f in self.pending_writes if not f.done() or f.exception() is not None]
+        self.pending_writes.append(future)
+
+    def _sync_writes(self) -> ExecutionResult:
+        """Wait for background artifact writes and report any that failed."""
+        pending, self.pending_writes = self.pending_writes, []
+        wait(pending)
+        errors = [f.exception() for f in pending if f.exception() is not None]
+        if errors:
+            return ExecutionResult(False, f"{len(errors)} artifact write(s) failed: " + "; ".join(map(str, errors)))
+        return ExecutionResult(True, "All artifact writes completed.")
+
+    def _compact_dtypes(self, df: pd.DataFrame) -> None:
+        """Downcast measurement floats to float32 and repetitive strings to categoricals, in place.
+
+        Coordinate columns keep float64: float32 resolves only ~0.5 m in degrees and
+        would shift interpolated positions and hex assignment. Measurements keep ~7
+        significant digits, so stats reports can differ in the last printed decimal.
+        """
+        columns = self.config.get("coordinates", {}).get("columns", {})
+        coord_prefixes = tuple(
+            columns.get(key, default)
+            for key, default in (
+                ("input_lat", "latitude"),
+                ("input_lon", "longitude"),
+                ("output_easting", "easting"),
+                ("output_northing", "northing"),
+            )
+        )
+        for c in df.select_dtypes(include="float64").columns:
+            if not str(c).startswith(coord_prefixes):
+                df[c] = df[c].astype(np.float32)
+        for c in df.select_dtypes(include="object").columns:
+            if df[c].nunique() < len(df) // 2:
+                df[c] = df[c].astype("category")
+
+    def _with_arrow_floats(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Back float columns with Arrow buffers when processing.arrow_dtypes is enabled.
+
+        Polars and pyarrow consumers then take the columns without a copy. Timestamps and
+        other columns stay NumPy-backed, which seaborn and the smoothers expect.
+        """
+        if not self.config.get("processing", {}).get("arrow_dtypes", False):
+            return df
+        floats = df.select_dtypes(include="floating").columns
+        return df.astype({c: pd.ArrowDtype(pa.from_numpy_dtype(df[c].dtype)) for c in floats})
+
+    def _cache_dir(self) -> Path:
+        return Path(self.config.get("data", {}).get("cache_directory", "./cache"))
+
+    def _merged_cache_key(self, files: list[Path], pos_file: Path) -> str:
+        """Cache key derived from the input files, their modification times and the merge settings."""
+        inputs = sorted((str(f.resolve()), f.stat().st_mtime_ns) for f in [*files, pos_file])
+        processing = self.config.get("processing", {})
+        # Settings that change the cached frame's columns, values or dtypes, so changing any of
+        # them never serves a stale frame: the merge tolerance, the whole coordinates section
+        # (CRSs, transform switch, projected column names/suffixes), the load column map,
+        # dtype compaction and the CSV engine
+        settings = {
+            "time_merge_tolerance": processing.get("time_merge_tolerance"),
+            "compact_dtypes": processing.get("compact_dtypes", False),
+            "csv_engine": self.config.get("data", {}).get("csv_engine", "pyarrow"),
+            "coordinates": self.config.get("coordinates", {}),
+            "column_map": self._ACOUSTIC_COLUMN_MAP,
+        }
+        payload = json.dumps([inputs, settings], sort_keys=True, default=str)
+        key = hashlib.blake2b(payload.encode(), digest_size=8).hexdigest()
+        return f"merged_{key}"
+
+    def _clear_cache(self) -> ExecutionResult:
+        CacheManager(self._cache_dir()).clear_cache()
+        return ExecutionResult(True, f"Cleared cached datasets in {self._cache_dir()}")
 
     def _aggregate_time(self, interval: str, y: Optional[str]) -> ExecutionResult:
-        self._ensure_data()
         target_col = self._resolve_column(y) if y else "backscatter"
         if target_col not in self.merged.columns:
             return ExecutionResult(False, self._unknown_column_message(target_col))
+        # Repeating the previous aggregation would return the same frame; skip the pass
+        if list(self.merged.columns) == ["timestamp", target_col] and self.temporal.is_aggregated(self.merged, interval):
+            return ExecutionResult(True, f"{target_col} is already aggregated by {interval}; rows: {len(self.merged)}")
         agg = self.temporal.aggregate_by_time(self.merged, interval, {target_col: "mean"})
         self.merged = agg
+        self._data_changed()
         return ExecutionResult(True, f"Aggregated {target_col} by {interval}; rows: {len(agg)}")
 
     def _plot_time_series(self, y: str, interval: Optional[str], smooth: Optional[bool], show: Optional[bool], save: Optional[bool], out: Optional[str], opts: Optional[Dict[str, Any]] = None) -> ExecutionResult:
-        self._ensure_data()
-        df = self.merged.copy()
         opts = opts or {}
+        # Select a sensible numeric column if requested one is missing; the choice only
+        # depends on column names and dtypes, so it is made before narrowing the frame
+        y, note = self._choose_plot_column(y, self.merged)
+        df = self._plot_frame(y)
         # Apply optional date filtering
         try:
             df = self._filter_by_date_range(
@@ -320,8 +591,6 @@ class TaskExecutor:
         except Exception:
             # If no date params present or parse failed silently in state, continue
             pass
-        # Select a sensible numeric column if requested one is missing
-        y, note = self._choose_plot_column(y, df)
         # Apply transformations if present in state (used by CLI params)
         try:
             df, y = self._apply_transformations(
@@ -333,6 +602,7 @@ class TaskExecutor:
                 max_val=self._coerce_float(opts.get("max")),
                 outlier_method=opts.get("outlier_method"),
                 z_thresh=float(opts.get("z_thresh", 3.0)),
+                rows_key=(opts.get("start_date"), opts.get("end_date")),
             )
         except Exception:
             pass
@@ -360,16 +630,18 @@ class TaskExecutor:
                 smooth_method = "rolling"
         elif isinstance(smooth_input, bool):
             smooth_enabled = bool(smooth_input)
-        fig = self.plotter.plot_line_series(df, x="timestamp", y=y, smooth=smooth_enabled, smooth_method=smooth_method, lowess_frac=lowess_frac)
+        max_points = self.config.get("visualization", {}).get("max_line_points", 4000)
+        fig = self.plotter.plot_line_series(df, x="timestamp", y=y, smooth=smooth_enabled, smooth_method=smooth_method, lowess_frac=lowess_frac, max_points=max_points)
         result = self._finalize_plot(fig, default_name="timeseries.png", show=show, save=save, out=out)
         if note and result.ok:
             result.message += note
         return result
 
     def _plot_scatter(self, x: str, y: str, interval: Optional[str], smooth: Optional[bool], show: Optional[bool], save: Optional[bool], out: Optional[str], opts: Optional[Dict[str, Any]] = None) -> ExecutionResult:
-        self._ensure_data()
-        df = self.merged.copy()
         opts = opts or {}
+        y, note = self._choose_plot_column(y, self.merged)
+        x, _ = self._choose_plot_column(x, self.merged)
+        df = self._plot_frame(x, y)
         # Apply optional date filtering
         try:
             df = self._filter_by_date_range(
@@ -379,8 +651,6 @@ class TaskExecutor:
             )
         except Exception:
             pass
-        y, note = self._choose_plot_column(y, df)
-        x, _ = self._choose_plot_column(x, df)
         # Apply transformations to y
         try:
             df, y = self._apply_transformations(
@@ -392,6 +662,7 @@ class TaskExecutor:
                 max_val=self._coerce_float(opts.get("max")),
                 outlier_method=opts.get("outlier_method"),
                 z_thresh=float(opts.get("z_thresh", 3.0)),
+                rows_key=(opts.get("start_date"), opts.get("end_date")),
             )
         except Exception:
             pass
@@ -443,8 +714,15 @@ class TaskExecutor:
 
         Expected params keys: 'y' (required), optional 'x'/'group', 'interval', and date/transform keys.
         """
-        self._ensure_data()
-        df = self.merged.copy()
+        # Resolve columns
+        y_col_in = params.get("y")
+        x_col_in = params.get("x") or params.get("group")
+        if not y_col_in:
+            return ExecutionResult(False, "Parameter 'y' is required for boxplot")
+        y = self._resolve_column(y_col_in)
+        x = self._resolve_column(x_col_in) if x_col_in else None
+        df = self._plot_frame(x, y)
+
         # Date filtering
         start_date = params.get("start_date")
         end_date = params.get("end_date")
@@ -454,14 +732,6 @@ class TaskExecutor:
             except Exception as e:
                 return ExecutionResult(False, f"Date filtering failed: {e}")
 
-        # Resolve columns
-        y_col_in = params.get("y")
-        x_col_in = params.get("x") or params.get("group")
-        if not y_col_in:
-            return ExecutionResult(False, "Parameter 'y' is required for boxplot")
-        y = self._resolve_column(y_col_in)
-        x = self._resolve_column(x_col_in) if x_col_in else None
-
         # Apply temporal aggregation if interval is provided
         interval = params.get("interval")
         if interval:
@@ -492,8 +762,9 @@ class TaskExecutor:
                     # Quantile bins (may drop duplicate edges if data has ties)
                     binned = pd.qcut(x_series, q=int(xqbins_val), duplicates="drop")
                 new_x = f"{x}_binned"
-                # Convert intervals to readable labels for categorical axis
-                df[new_x] = binned.astype(str)
+                # Readable interval labels, kept categorical: one small label per bin rather than a
+                # Python string per row, and boxes are drawn in bin order
+                df[new_x] = binned.cat.remove_unused_categories().cat.rename_categories(str)
                 x = new_x
             except Exception as e:
                 return ExecutionResult(False, f"Binning x failed: {e}")
@@ -557,7 +828,7 @@ class TaskExecutor:
         if effective_save:
             out_path = Path(out) if out else Path("outputs/plots") / default_name
             # If also showing, don't close here
-            self.plotter.save_plot(fig, out_path, close=not effective_show)
+            self._track_write(self.plotter.save_plot(fig, out_path, close=not effective_show, background=self._background_writes()))
 
         if effective_show:
             try:
@@ -573,7 +844,6 @@ class TaskExecutor:
         return ExecutionResult(True, "Displayed plot.")
 
     def _hex_map(self, y: str, resolution: int, backend: str = None, show: bool = True, coastline_path: str = None, east_lim: list[float] | None = None, north_lim: list[float] | None = None, opts: Optional[Dict[str, Any]] = None) -> ExecutionResult:
-        self._ensure_data()
         opts = opts or {}
         # Optional date filtering before spatial aggregation
         try:
@@ -597,11 +867,75 @@ class TaskExecutor:
                 max_val=self._coerce_float(opts.get("max")),
                 outlier_method=opts.get("outlier_method"),
                 z_thresh=float(opts.get("z_thresh", 3.0)),
+                rows_key=(opts.get("start_date"), opts.get("end_date")),
             )
         except Exception:
             y_used = y
-        df = self.spatial.assign_hex_ids(df_src, resolution)
-        agg = self.spatial.aggregate_by_hex(df, {y_used: "mean", "timestamp": "count"}).rename(columns={"timestamp": "count"})
+        agg_backend = self.config.get("analysis", {}).get("hex_backend", "pandas")
+        agg = self.spatial.aggregate_to_hex(df_src, resolution, {y_used: "mean", "timestamp": "count"}, backend=agg_backend)
+        agg = agg.rename(columns={"timestamp": "count"})
+        return self._render_hex_map(agg, y_used, backend, show, coastline_path, east_lim, north_lim, opts)
+
+    def _hex_map_streaming(self, y: str, resolution: int, backend: str = None, show: bool = True, coastline_path: str = None, east_lim: list[float] | None = None, north_lim: list[float] | None = None, opts: Optional[Dict[str, Any]] = None) -> ExecutionResult:
+        """Hex map computed from the acoustic files chunk by chunk, without loading them.
+
+        Streams the inputs of the last 'load' (its dir/pattern/positions), or the configured
+        defaults when nothing has been loaded yet.
+
+        Only one chunk is held in memory; per-hex sums and counts are accumulated and turned
+        into means at the end. Date range, min/max and negative are applied per chunk; outlier
+        filtering needs whole-column statistics and is not available here.
+        """
+        opts = opts or {}
+        if opts.get("outlier_method"):
+            return ExecutionResult(False, "Outlier filtering is not supported for streamed maps; load the data and use 'map' instead")
+        try:
+            files, pos_file = self._input_files(self._load_params)
+        except FileNotFoundError as e:
+            return ExecutionResult(False, str(e))
+        positions = self._read_positions(pos_file)
+        merger = PositionMerger(acoustic_time_col="timestamp", position_time_col="timestamp", lat_col="latitude", lon_col="longitude")
+        loader = AcousticsDataLoader(column_map=dict(self._ACOUSTIC_COLUMN_MAP), timestamp_col="time")
+        chunksize = int(self.config.get("data", {}).get("stream_chunksize", 1_000_000))
+        y_used = y
+        totals: Optional[pd.DataFrame] = None
+        for chunk in loader.iter_csv_chunks(files, columns=["timestamp", y], chunksize=chunksize):
+            if y not in chunk.columns:
+                return ExecutionResult(False, f"Column not found: {y}")
+            try:
+                chunk = self._filter_by_date_range(chunk, opts.get("start_date"), opts.get("end_date"))
+            except Exception:
+                pass
+            if chunk.empty:
+                continue
+            chunk = merger.merge_positions_interpolated(chunk, positions)
+            chunk, y_used = self._apply_transformations(
+                chunk,
+                y,
+                negative=bool(opts.get("negative", False)),
+                min_val=self._coerce_float(opts.get("min")),
+                max_val=self._coerce_float(opts.get("max")),
+            )
+            hexed = self.spatial.assign_hex_ids(chunk, resolution)
+            part = hexed.groupby("h3_hex", observed=True).agg(
+                total=(y_used, "sum"), valid=(y_used, "count"), count=("timestamp", "count")
+            )
+            part.index = part.index.astype(object)
+            totals = part if totals is None else totals.add(part, fill_value=0)
+        if totals is None or totals.empty:
+            return ExecutionResult(False, "No rows to map")
+        totals = totals.sort_index()
+        agg = pd.DataFrame(
+            {
+                "h3_hex": totals.index.to_numpy(),
+                y_used: (totals["total"] / totals["valid"].where(totals["valid"] > 0)).to_numpy(),
+                "count": totals["count"].to_numpy(dtype=np.int64),
+            }
+        )
+        return self._render_hex_map(agg, y_used, backend, show, coastline_path, east_lim, north_lim, opts)
+
+    def _render_hex_map(self, agg: pd.DataFrame, y_used: str, backend: str = None, show: bool = True, coastline_path: str = None, east_lim: list[float] | None = None, north_lim: list[float] | None = None, opts: Optional[Dict[str, Any]] = None) -> ExecutionResult:
+        opts = opts or {}
         backend = backend or self.config.get("visualization", {}).get("map", {}).get("default_backend", "matplotlib")
         coords_cfg = self.config.get("coordinates", {})
         columns = coords_cfg.get("columns", {})
@@ -655,8 +989,9 @@ class TaskExecutor:
                 vmax=vmax,
             )
             out = Path("outputs/maps/hex_map.png")
-            out.parent.mkdir(parents=True, exist_ok=True)
-            fig.savefig(out, dpi=300, bbox_inches='tight')
+            buf = io.BytesIO()
+            fig.savefig(buf, format="png", dpi=300, bbox_inches='tight')
+            write_artifact(out, buf.getvalue())
             # Show window is handled in create_matplotlib_hex_map
             return ExecutionResult(True, f"Matplotlib map created and shown. Saved to {out}", artifact=out)
         else:
@@ -678,21 +1013,20 @@ class TaskExecutor:
             except Exception as e:
                 print(f"Warning: Could not apply folium bounds: {e}")
             out = Path("outputs/maps/hex_map.html")
-            self.mapgen.save_map(m, out)
+            self._track_write(self.mapgen.save_map(m, out, background=self._background_writes()))
             if show:
                 self.mapgen.show_map(m)
             return ExecutionResult(True, f"Folium map created and shown. Saved to {out}", artifact=out)
 
     def _compute_stats(self, columns: list[str]) -> ExecutionResult:
-        self._ensure_data()
-        stats = self.stats.calculate_descriptive_stats(self.merged, columns)
+        backend = self.config.get("analysis", {}).get("stats_backend", "pandas")
+        stats = self.stats.calculate_descriptive_stats(self.merged, columns, backend=backend)
         out = Path("outputs/reports/descriptive_stats.txt")
         self.stats.save_stats_to_file(stats, out)
-        return ExecutionResult(True, f"Saved stats to {out}", artifact=out)
+        return ExecutionResult(True, f"Saved stats to {out} and {out.with_suffix('.parquet')}", artifact=out, data=stats)
 
     def _compute_stats_by_time(self, columns: list[str], interval: str, opts: Optional[Dict[str, Any]] = None) -> ExecutionResult:
         """Compute descriptive statistics aggregated by time intervals."""
-        self._ensure_data()
         opts = opts or {}
         df = self.merged.copy()
         
@@ -730,7 +1064,8 @@ class TaskExecutor:
                         pass
         
         # Calculate stats by time
-        stats = self.stats.calculate_stats_by_time(df, interval, columns)
+        backend = self.config.get("analysis", {}).get("stats_backend", "pandas")
+        stats = self.stats.calculate_stats_by_time(df, interval, columns, backend=backend)
         
         # Save to file
         out = Path(f"outputs/reports/stats_by_time_{interval.replace(' ', '_')}.txt")
@@ -752,7 +1087,6 @@ class TaskExecutor:
         - Arithmetic: backscatter*2, depth+10, etc.
         - pandas eval expressions
         """
-        self._ensure_data()
         if not name or not expression:
             return ExecutionResult(False, "Both 'name' and 'expression' are required")
 
@@ -789,8 +1123,16 @@ class TaskExecutor:
         except Exception as e:
             return ExecutionResult(False, f"Error creating variable: {e}")
 
+    def _coords_info(self) -> ExecutionResult:
+        coords_cfg = self.config.get("coordinates", {})
+        columns = coords_cfg.get("columns", {})
+        crs_info = f"Input CRS: {coords_cfg.get('input_crs', 'EPSG:4326')}\nOutput CRS: {coords_cfg.get('output_crs', 'EPSG:3006')}\nTransform on load: {coords_cfg.get('transform_on_load', True)}"
+        col_info = "Columns:\n  " + ", ".join(f"{k}: {v}" for k, v in columns.items())
+        active_crs = coords_cfg.get('active_crs', coords_cfg.get('output_crs', 'EPSG:3006'))
+        msg = f"Active CRS: {active_crs}\n{crs_info}\n{col_info}"
+        return ExecutionResult(True, msg)
+
     def _list_columns(self) -> ExecutionResult:
-        self._ensure_data()
         df = self.merged
         ignore = {"timestamp", "latitude", "longitude", "position_matched"}
         num_cols = [c for c in df.select_dtypes(include=["number"]).columns if c not in ignore]
@@ -938,10 +1280,13 @@ class TaskExecutor:
             "    - If 'x' is continuous, you can bin it with 'xbins:<n>' (equal-width) or 'xqbins:<n>' (quantiles)\n"
             "    - Applies the same Y transforms (log/min/max), outlier filtering, and date filtering\n"
             "  columns                               # list plottable numeric columns and aliases\n"
+            "  clear cache                           # delete cached merged datasets (next load re-reads the CSVs)\n"
+            "  sync                                  # wait for background plot/map writes to finish\n"
             "  map <variable> [resolution:<n>] [agg:<func>] [backend:matplotlib|folium] [east_lim=[x1,x2]] [north_lim=[y1,y2]]  # spatial map\n"
             "    - Applies date filters, outlier filtering, and min/max thresholds before hex aggregation\n"
             "    - Supports 'negative=true' prior to aggregation (e.g., map depth negative=true)\n"
             "    - Transforms/limits are per-command and do not persist; omit them to use defaults (no transform, full range).\n"
+            "    - 'stream=true' builds the map straight from the files in chunks (no 'load' needed, no outlier filtering)\n"
             "  stats columns=<alias|column>[,<alias|column>...]  # descriptive statistics\n"
             "  stats by time <interval> columns=<col>[,<col>...] [outliers=zscore|modified_zscore] [start_date=...] [end_date=...]  # stats by time aggregation\n"
             "    - Computes statistics for each time bin (long-format output)\n"
@@ -967,6 +1312,7 @@ class TaskExecutor:
             "  map depth backend:folium outliers=zscore\n"
             "  map depth resolution:9 agg:max\n"
             "  map depth negative:true min:5 max:50\n"
+            "  map depth stream=true\n"
             "  stats columns=bs,temp\n"
             "  stats by time 10min columns=backscatter,depth outliers=zscore\n"
             "  create var hour=timestamp.dt.hour\n"
@@ -1007,6 +1353,36 @@ class TaskExecutor:
         return requested, None
 
     # === Helpers: date filtering and transformations ===
+    def _plot_frame(self, *columns: Optional[str]) -> pd.DataFrame:
+        """The merged frame narrowed to the given columns plus the timestamp columns.
+
+        Plot commands only touch these, so date filters and transforms copy a few
+        columns instead of the whole session frame.
+        """
+        wanted = ("timestamp", "time", "datetime", "date", *columns)
+        keep = [c for c in dict.fromkeys(wanted) if c is not None and c in self.merged.columns]
+        return self.merged[keep]
+
+    def _data_changed(self) -> None:
+        # Row selections memoized for the previous session frame no longer apply
+        self._data_version += 1
+        self._row_cache.clear()
+
+    def _memo_rows(self, key: tuple, select: Callable[[], np.ndarray | slice]) -> np.ndarray | slice:
+        """Row positions for ``key``, computed by ``select`` once per data version (small LRU)."""
+        key = (self._data_version, *key)
+        rows = self._row_cache.get(key)
+        if rows is None:
+            rows = select()
+            if isinstance(rows, np.ndarray):
+                rows.setflags(write=False)
+            self._row_cache[key] = rows
+            if len(self._row_cache) > self._ROW_CACHE_SIZE:
+                self._row_cache.popitem(last=False)
+        else:
+            self._row_cache.move_to_end(key)
+        return rows
+
     def _filter_by_date_range(self, data: pd.DataFrame, start_date: str | None = None, end_date: str | None = None) -> pd.DataFrame:
         """Filter dataframe by date range on a timestamp-like column."""
         if not start_date and not end_date:
@@ -1019,19 +1395,34 @@ class TaskExecutor:
                 break
         if ts_col is None:
             raise ValueError("No timestamp column found for date filtering")
-        df = data.copy()
+        # Shallow copy: only the timestamp column may be replaced below
+        df = data.copy(deep=False)
         # Ensure datetime
         if not pd.api.types.is_datetime64_any_dtype(df[ts_col]):
             df[ts_col] = pd.to_datetime(df[ts_col], errors="coerce")
-        # Parse bounds
-        start_dt = pd.to_datetime(start_date) if start_date else df[ts_col].min()
-        end_dt = pd.to_datetime(end_date) if end_date else df[ts_col].max()
-        if isinstance(end_date, str) and len(end_date) == 10:
-            end_dt = end_dt + pd.Timedelta(days=1) - pd.Timedelta(seconds=1)
-        if start_dt > end_dt:
-            raise ValueError("start_date is after end_date")
-        mask = (df[ts_col] >= start_dt) & (df[ts_col] <= end_dt)
-        return df.loc[mask].copy()
+
+        def select() -> np.ndarray | slice:
+            # Parse bounds
+            start_dt = pd.to_datetime(start_date) if start_date else df[ts_col].min()
+            end_dt = pd.to_datetime(end_date) if end_date else df[ts_col].max()
+            if isinstance(end_date, str) and len(end_date) == 10:
+                end_dt = end_dt + pd.Timedelta(days=1) - pd.Timedelta(seconds=1)
+            if start_dt > end_dt:
+                raise ValueError("start_date is after end_date")
+            ts = df[ts_col]
+            if ts.is_monotonic_increasing:
+                # The merged frame is time-sorted: binary-search the window and take it as a slice
+                return slice(ts.searchsorted(start_dt, side="left"), ts.searchsorted(end_dt, side="right"))
+            mask = (ts >= start_dt) & (ts <= end_dt)
+            return np.flatnonzero(mask.to_numpy(dtype=bool, na_value=False))
+
+        # Frames sharing the session frame's index hold its rows, so their selection can be reused
+        if self.merged is not None and data.index is self.merged.index:
+            rows = self._memo_rows(("dates", ts_col, start_date, end_date), select)
+        else:
+            rows = select()
+        # Shallow copy: callers only replace or add columns on the result
+        return df.iloc[rows].copy(deep=False)
 
     def _apply_transformations(
         self,
@@ -1043,15 +1434,19 @@ class TaskExecutor:
         max_val: float | None = None,
         outlier_method: str | None = None,
         z_thresh: float = 3.0,
+        rows_key: tuple | None = None,
     ) -> tuple[pd.DataFrame, str]:
         """Apply outlier filtering, min/max filtering and optional natural log transform on a column.
 
         Returns the (possibly filtered) dataframe and the column name to use (new name if log).
         Order: outlier filter → date filter → thresholds → negative → log
+        ``rows_key`` identifies the input rows (e.g. the date range applied to the session
+        frame); when given, the rows kept by the outlier/threshold filters are memoized.
         """
         if column not in data.columns:
             raise ValueError(f"Column '{column}' not in data")
-        df = data.copy()
+        # Columns are only replaced or added below, never modified in place
+        df = data.copy(deep=False)
         # Ensure numeric
         if not pd.api.types.is_numeric_dtype(df[column]):
             df[column] = pd.to_numeric(df[column], errors="coerce")
@@ -1060,18 +1455,29 @@ class TaskExecutor:
         if isinstance(outlier_method, str):
             outlier_method = outlier_method.lower()
         normalized_method = outlier_method.replace("-", "_") if isinstance(outlier_method, str) else outlier_method
-        if normalized_method in {"zscore", "modified_zscore", "mzscore"}:
-            method = "modified_zscore" if normalized_method in {"modified_zscore", "mzscore"} else "zscore"
-            result_df = self.stats.detect_outliers(df, column, method=method, z_thresh=z_thresh)
-            if "outlier" in result_df.columns:
-                df = result_df.loc[~result_df["outlier"]].copy()
-                df = df.drop(columns=["outlier"], errors="ignore")
-        
-        # Threshold filters
-        if min_val is not None:
-            df = df.loc[df[column] >= float(min_val)].copy()
-        if max_val is not None:
-            df = df.loc[df[column] <= float(max_val)].copy()
+        use_outliers = normalized_method in {"zscore", "modified_zscore", "mzscore"}
+
+        def select() -> np.ndarray:
+            keep = np.ones(len(df), dtype=bool)
+            if use_outliers:
+                method = "modified_zscore" if normalized_method in {"modified_zscore", "mzscore"} else "zscore"
+                result_df = self.stats.detect_outliers(df, column, method=method, z_thresh=z_thresh)
+                if "outlier" in result_df.columns:
+                    keep &= ~result_df["outlier"].to_numpy(dtype=bool, na_value=False)
+            # Threshold filters; missing values never pass (Arrow-backed columns compare to NA, not False)
+            if min_val is not None:
+                keep &= (df[column] >= float(min_val)).to_numpy(dtype=bool, na_value=False)
+            if max_val is not None:
+                keep &= (df[column] <= float(max_val)).to_numpy(dtype=bool, na_value=False)
+            return np.flatnonzero(keep)
+
+        if use_outliers or min_val is not None or max_val is not None:
+            if rows_key is not None:
+                key = ("transform", *rows_key, column, normalized_method, z_thresh, min_val, max_val)
+                rows = self._memo_rows(key, select)
+            else:
+                rows = select()
+            df = df.iloc[rows].copy(deep=False)
         if df.empty:
             return df, column
         # Negative transform (x / -1)
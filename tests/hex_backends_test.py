@@ -0,0 +1,70 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Ensure workspace root is on sys.path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+from aggregation.spatial_aggregator import SpatialAggregator, _POLARS_AGGS, pl
+
+# The polars hex aggregation must give the same table as the pandas groupby, including
+# how missing values are skipped by first/last/nunique
+if pl is None:
+    print("polars not installed, nothing to compare")
+    sys.exit(0)
+
+spatial = SpatialAggregator(lat_col="latitude", lon_col="longitude")
+rng = np.random.default_rng(0)
+cases = 0
+
+
+def compare(got: pd.DataFrame, expected: pd.DataFrame) -> None:
+    pd.testing.assert_frame_equal(
+        got.reset_index(drop=True), expected.reset_index(drop=True), check_dtype=False, check_exact=False, rtol=1e-9
+    )
+
+
+for k in range(30):
+    n = int(rng.integers(1, 400))
+    hexes = rng.choice(["8a1f", "8a2e", "8a3d", "8a4c"], n).astype(object)
+    hexes[rng.random(n) < 0.05] = None
+    df = pd.DataFrame(
+        {
+            "h3_hex": hexes,
+            "value": rng.normal(size=n),
+            "fish": rng.integers(0, 5, n).astype(np.float64),
+        }
+    )
+    df.loc[rng.random(n) < 0.3, "value"] = np.nan
+    # One hex where every value is missing
+    df.loc[df["h3_hex"] == "8a4c", "fish"] = np.nan
+    for func in _POLARS_AGGS:
+        agg = {"value": func, "fish": func}
+        expected = spatial.aggregate_by_hex(df, agg)
+        compare(spatial.aggregate_by_hex(df, agg, backend="polars"), expected)
+        cases += 1
+
+# Reported case: the leading/trailing missing values must be skipped
+df = pd.DataFrame({"h3_hex": ["a", "a", "b", "b", "c"], "v": [np.nan, 1.0, 2.0, np.nan, np.nan]})
+for func in ("first", "last", "nunique"):
+    compare(spatial.aggregate_by_hex(df, {"v": func}, backend="polars"), spatial.aggregate_by_hex(df, {"v": func}))
+    cases += 1
+
+# aggregate_to_hex, as used by 'map', from positions
+n = 2000
+df = pd.DataFrame(
+    {
+        "timestamp": pd.date_range("2024-10-06", periods=n, freq="s"),
+        "latitude": 57 + rng.normal(0, 0.05, n),
+        "longitude": 11 + rng.normal(0, 0.05, n),
+        "depth": rng.normal(30, 5, n),
+    }
+)
+df.loc[rng.random(n) < 0.05, "latitude"] = np.nan
+df.loc[rng.random(n) < 0.1, "depth"] = np.nan
+agg = {"depth": "mean", "timestamp": "count"}
+compare(spatial.aggregate_to_hex(df, 7, agg, backend="polars"), spatial.aggregate_to_hex(df, 7, agg))
+cases += 1
+
+print(f"polars hex aggregation matches pandas in {cases} cases")
@@ -0,0 +1,44 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+# Ensure workspace root is on sys.path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+from visualization.time_series_plots import TimeSeriesPlotter, _downsample_line
+
+# Long lines are drawn from an LTTB subset; the subset must not depend on how the
+# timestamp column is stored (naive, tz-aware as read from "Z" times, Arrow-backed)
+rng = np.random.default_rng(0)
+n = 20_000
+df = pd.DataFrame(
+    {
+        "timestamp": pd.date_range("2024-10-06", periods=n, freq="s"),
+        "depth": rng.normal(30, 5, n).cumsum(),
+    }
+)
+df.loc[rng.random(n) < 0.01, "depth"] = np.nan
+df.loc[rng.random(n) < 0.01, "timestamp"] = pd.NaT
+df = df.sample(frac=1, random_state=1)
+
+expected = _downsample_line(df, "timestamp", "depth", 4000).index
+assert len(expected) == 4000
+variants = {
+    "tz-aware": df["timestamp"].dt.tz_localize("UTC"),
+    "arrow": df["timestamp"].astype(pd.ArrowDtype(pa.timestamp("ns"))),
+    "arrow tz-aware": df["timestamp"].dt.tz_localize("UTC").astype(pd.ArrowDtype(pa.timestamp("ns", tz="UTC"))),
+}
+plotter = TimeSeriesPlotter()
+for name, ts in variants.items():
+    variant = df.assign(timestamp=ts)
+    got = _downsample_line(variant, "timestamp", "depth", 4000).index
+    assert got.equals(expected), name
+    if not isinstance(ts.dtype, pd.ArrowDtype):
+        # The whole plot path, with more rows than max_points (timestamps as the loaders return them)
+        fig = plotter.plot_line_series(variant, "timestamp", "depth", smooth=False, max_points=4000)
+        assert fig is not None, name
+    print("OK", name)
+
+print("line downsampling is independent of the timestamp storage")
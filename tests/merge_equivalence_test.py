@@ -0,0 +1,97 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Ensure workspace root is on sys.path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+from data_loader.position_merger import PositionMerger, _asof_indexer
+
+# The merger replaces merge_asof and a pandas union-timeline interpolation with NumPy
+# searchsorted/interp code; both must give the same positions as the pandas formulations.
+rng = np.random.default_rng(0)
+
+# 1) _asof_indexer against merge_asof on raw sorted int64 keys
+for k in range(300):
+    a_ts = np.sort(rng.integers(0, 10_000, int(rng.integers(0, 200))))
+    p_ts = np.sort(rng.integers(0, 10_000, int(rng.integers(0, 60))))
+    if k % 3 == 0:
+        p_ts = np.unique(p_ts)
+    left = pd.DataFrame({"t": a_ts})
+    right = pd.DataFrame({"t": p_ts, "pos": np.arange(len(p_ts))})
+    for direction in ("backward", "forward", "nearest"):
+        for tol in (0, 25, 500):
+            expected = pd.merge_asof(left, right, on="t", direction=direction, tolerance=tol)["pos"]
+            got = _asof_indexer(a_ts.astype(np.int64), p_ts.astype(np.int64), tol, direction)
+            np.testing.assert_array_equal(got, expected.fillna(-1).to_numpy(dtype=np.int64))
+
+
+def make(n_a: int, n_p: int, shuffle: bool) -> tuple[pd.DataFrame, pd.DataFrame]:
+    t0 = pd.Timestamp("2024-10-06")
+    at = (t0 + pd.to_timedelta(np.sort(rng.uniform(-100, 4000, n_a)), unit="s")).floor("s")
+    acoustic = pd.DataFrame({"timestamp": at, "depth": rng.normal(30, 5, n_a)})
+    # Unique position times
+    pt = t0 + pd.to_timedelta(np.sort(rng.choice(3600, n_p, replace=False)), unit="s")
+    positions = pd.DataFrame(
+        {
+            "timestamp": pt,
+            "latitude": 57 + rng.normal(0, 0.01, n_p).cumsum(),
+            "longitude": 11 + rng.normal(0, 0.01, n_p).cumsum(),
+        }
+    )
+    if shuffle:
+        acoustic = acoustic.sample(frac=1, random_state=1)
+        positions = positions.sample(frac=1, random_state=2)
+    return acoustic, positions
+
+
+def reference_interpolated(acoustic: pd.DataFrame, positions: pd.DataFrame) -> pd.DataFrame:
+    """Union timeline, time interpolation, nearest fix outside the track."""
+    a = acoustic.sort_values("timestamp", kind="stable")
+    pos = positions.set_index("timestamp")[["latitude", "longitude"]].sort_index()
+    base = pd.Index(a["timestamp"].unique())
+    timeline = pd.DataFrame(index=base.union(pos.index)).join(pos, how="left")
+    timeline = timeline.interpolate(method="time").loc[base]
+    gaps = timeline["latitude"].isna().to_numpy()
+    nearest = pos.index.get_indexer(base[gaps], method="nearest")
+    timeline.loc[gaps, ["latitude", "longitude"]] = pos.iloc[nearest].to_numpy()
+    return a.merge(timeline.rename_axis("timestamp").reset_index(), on="timestamp", how="left")
+
+
+merger = PositionMerger(enable_transform=False)
+cases = 0
+for k in range(40):
+    acoustic, positions = make(int(rng.integers(1, 600)), int(rng.integers(2, 80)), shuffle=bool(k % 2))
+    acoustic_before, positions_before = acoustic.copy(), positions.copy()
+
+    # 2) merge_positions against merge_asof on the time-sorted frames
+    a_sorted = acoustic.sort_values("timestamp", kind="stable")
+    p_sorted = positions.sort_values("timestamp", kind="stable")
+    for direction in ("backward", "forward", "nearest"):
+        for tol in ("5s", "120s"):
+            got = merger.merge_positions(acoustic, positions, tolerance=tol, direction=direction)
+            expected = pd.merge_asof(a_sorted, p_sorted, on="timestamp", direction=direction, tolerance=pd.Timedelta(tol))
+            pd.testing.assert_frame_equal(
+                got[["timestamp", "depth", "latitude", "longitude"]].reset_index(drop=True),
+                expected[["timestamp", "depth", "latitude", "longitude"]].reset_index(drop=True),
+            )
+            assert (got["position_matched"] == got["latitude"].notna()).all()
+            cases += 1
+
+    # 3) interpolated merge against the pandas union-timeline formulation
+    got = merger.merge_positions_interpolated(acoustic, positions)
+    expected = reference_interpolated(acoustic, positions)
+    pd.testing.assert_frame_equal(
+        got[["timestamp", "depth", "latitude", "longitude"]].reset_index(drop=True),
+        expected[["timestamp", "depth", "latitude", "longitude"]].reset_index(drop=True),
+        check_exact=False,
+        rtol=1e-12,
+    )
+    cases += 1
+
+    # Inputs are never modified
+    pd.testing.assert_frame_equal(acoustic, acoustic_before)
+    pd.testing.assert_frame_equal(positions, positions_before)
+
+print(f"position merges match the pandas formulations in {cases} cases")
@@ -0,0 +1,109 @@
+import os
+import random
+import re
+import subprocess
+import sys
+import types
+
+# Ensure workspace root is on sys.path
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+from interface.nlp_interpreter import CommandInterpreter
+
+# The interpreter was rewritten around precompiled patterns and a one-pass token scan. It must
+# parse every command like the original regex cascade, apart from two documented changes:
+# - options only match whole tokens, so xmin=/xlog= no longer leak into min/log
+# - "map ... stream=true" selects the out-of-core hex_map_stream task
+ci = CommandInterpreter()
+
+# Pinned parses for the documented changes
+cmd = ci.parse_command("plot depth xmin=1 xlog=true")
+assert cmd["xmin"] == 1.0 and cmd["xlog"] is True and "min" not in cmd and "log" not in cmd, cmd
+cmd = ci.parse_command("plot depth min=5 xmin=1 log=no logx=yes")
+assert cmd["min"] == 5.0 and cmd["xmin"] == 1.0 and cmd["log"] is False and cmd["xlog"] is True, cmd
+assert ci.parse_command("map depth stream=true")["task"] == "hex_map_stream"
+assert ci.parse_command("map depth stream=false")["task"] == "hex_map"
+assert ci.parse_command("map depth")["task"] == "hex_map"
+
+
+def baseline_interpreter():
+    """Original interpreter from the root commit, with the whole-token option fix applied."""
+    try:
+        first = subprocess.run(["git", "rev-list", "--max-parents=0", "HEAD"], cwd=root, capture_output=True, text=True, check=True)
+        source = subprocess.run(
+            ["git", "show", f"{first.stdout.split()[0]}:interface/nlp_interpreter.py"],
+            cwd=root, capture_output=True, text=True, check=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError, IndexError):
+        return None
+    head, sep, rest = source.partition("    def _extract_transform_params(")
+    body, sep2, tail = rest.partition("\n    def ")
+    body = re.sub(r'(re\.search\(\s*r")', r"\1(?<!\\S)", body)
+    module = types.ModuleType("baseline_nlp_interpreter")
+    # dataclasses look their module up in sys.modules while the class body runs
+    sys.modules[module.__name__] = module
+    exec(compile(head + sep + body + sep2 + tail, "baseline_nlp_interpreter", "exec"), module.__dict__)
+    return module.CommandInterpreter()
+
+
+commands = [
+    "load dir=./data/ pattern=SLU-*.csv positions=./data/positions.txt", "LOAD Dir=./D Pattern=*.CSV",
+    "scatter depth save=true show=false out=outputs/plots/a.png", "Scatter Depth VS Temp", "boxplot depth vs hour 10min",
+    "boxplot y=depth x=hour xbins=5 show=no", "boxplot depth xqbins:4 save:yes out:file.png", "make a boxplot depth",
+    "plot depth log=true min=1 max=1e3 xlog:yes xmin=-2 xmax=+3.5", "plot y:depth logy=1 neg=true outlier=iqr z_thresh:2",
+    "plot depth start_date='2024-10-06 12:00' end_date=2024-10-07", "plot depth start_date=\"2024-10-06 12:00:00\" smooth=loess frac=0.2",
+    "aggregate 10min", "aggregate time", "map hex y=bs res=9 backend mpl east_lim=[12,20] north_lim=6500000,6600000",
+    "hex depth folium xlim=[a,b] ylim=1,2,3", "create var h=timestamp.dt.hour", "calc d2=depth*2", "create week from timestamp",
+    "columns", "show columns", " LIST  columns ", "stats columns=a,b,,c", "stats by time 10min columns=depth,nasc0 min=0",
+    "exit", "quit", "help", "?", "", "   ", "garbage", "analysis key=depth", "set a=1 B=2", "alias boxplot=x",
+]
+verbs = ["plot", "scatter", "boxplot", "map", "hex", "stats", "stats by time", "aggregate", "set", "alias", "load",
+         "create", "calc", "analysis", "columns", "statistics", "list", "show", "exit", "help", "foo", ""]
+params = [
+    "y=depth", "x=temp", "y:Depth", "x:Sal", "5min", "10min", "1h", "2d", "log=true", "log:yes", "logy=1", "logy:no",
+    "neg=1", "negative:false", "min=1", "min:2.5", "max=10", "max:x", "xmin=-1", "xmax:3", "xlog=yes", "logx:0",
+    "outliers=iqr", "outlier:zscore", "outlier_method=percentile", "outliers:bogus", "z_thresh=2", "z_thresh:x",
+    "start_date=2024-01-01", "end_date='2024-01-02 10:00'", "show=true", "save=no", "show:y", "save:n", "out=a.png",
+    "file:b.png", "path=c", "smooth=loess", "frac=0.3", "lowess_frac:0.1", "res=9", "resolution:7", "east_lim=[1,2]",
+    "north_lim=3,4", "xlim=[a,b]", "ylim=5,6", "coastline=c.geojson", "matplotlib", "mpl", "folium", "html",
+    "columns=a,b", "vs", "depth", "Temp", "xbins=5", "xqbins:3", "group=hour", "time", "by time", "by_time", "key=k",
+    "pattern=*.csv", "dir=./d", "positions=p.txt", "value=v", "column=c", "plot", "scatter", "boxplot", "hex", "map",
+    "=", ":", "A=B", "LOG=TRUE", "Min=3", "var", "from", "timestamp", "h=timestamp.dt.hour",
+]
+rng = random.Random(0)
+for _ in range(30000):
+    tokens = [rng.choice(verbs)] + rng.sample(params, rng.randint(0, 6))
+    if rng.random() < 0.2:
+        rng.shuffle(tokens)
+    command = " ".join(tokens)
+    if rng.random() < 0.2:
+        command = command.upper() if rng.random() < 0.5 else command.title()
+    commands.append(command)
+
+
+def parse(interpreter, command):
+    try:
+        return interpreter.parse_command(command)
+    except Exception as exc:  # noqa: BLE001
+        return ("error", type(exc).__name__)
+
+
+baseline = baseline_interpreter()
+if baseline is None:
+    print("baseline interpreter not available (no git history), checking invariants only")
+diffs = []
+for command in commands:
+    result = parse(ci, command)
+    # Parses are memoized; callers get their own copy, so mutating one must not leak
+    if isinstance(result, dict):
+        result["mutated"] = True
+        for value in result.values():
+            if isinstance(value, dict):
+                value["mutated"] = True
+        result = parse(ci, command)
+        assert "mutated" not in result, command
+    if baseline is not None and parse(baseline, command) != result:
+        diffs.append(command)
+
+assert not diffs, f"{len(diffs)} commands parse differently, e.g. {diffs[:5]}"
+print(f"parser matches the original interpreter on {len(commands)} commands")
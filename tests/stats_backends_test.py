@@ -0,0 +1,107 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Ensure workspace root is on sys.path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+from analysis.statistics import StatisticsCalculator, _STATS_BY_TIME_COLUMNS, pl
+
+# Descriptive and time-binned stats have a vectorized pandas path and a polars path;
+# both must match a plain per-column / per-bin NumPy computation.
+calc = StatisticsCalculator()
+rng = np.random.default_rng(0)
+backends = ["pandas"] + (["polars"] if pl is not None else [])
+if pl is None:
+    print("polars not installed, checking the pandas backend only")
+
+
+def describe(values: pd.Series, raw: pd.Series) -> dict:
+    a = values.dropna().to_numpy(dtype=np.float64)
+    p05, p25, p50, p75, p95 = np.percentile(a, [5, 25, 50, 75, 95])
+    return {
+        "count": a.size, "mean": a.mean(), "std": a.std(ddof=1) if a.size > 1 else np.nan,
+        "min": a.min(), "p05": p05, "p25": p25, "median": p50, "p75": p75, "p95": p95,
+        "max": a.max(), "missing": int(raw.isna().sum()),
+    }
+
+
+def make(n: int) -> pd.DataFrame:
+    df = pd.DataFrame(
+        {
+            "timestamp": pd.Timestamp("2024-10-05 03:00") + pd.to_timedelta(np.sort(rng.integers(0, 3 * 86400, n)), unit="s"),
+            "depth": rng.normal(30, 5, n),
+            "nasc": rng.lognormal(2, 1, n),
+            "count_fish": rng.integers(0, 50, n),
+            "label": rng.choice(["a", "b", "3.5"], n),
+        }
+    )
+    df.loc[rng.random(n) < 0.1, "depth"] = np.nan
+    return df
+
+
+def reference_by_time(df: pd.DataFrame, interval: str, columns: list) -> pd.DataFrame:
+    rows = []
+    for col in columns:
+        for ts, group in df.groupby(pd.Grouper(key="timestamp", freq=interval)):
+            values = pd.to_numeric(group[col], errors="coerce")
+            if values.notna().sum() == 0:
+                continue
+            rows.append({"timestamp": ts, "variable": col, **describe(values, group[col])})
+    return pd.DataFrame(rows, columns=_STATS_BY_TIME_COLUMNS)
+
+
+def normalized(stats: pd.DataFrame) -> pd.DataFrame:
+    out = stats.reset_index(drop=True).copy()
+    if "timestamp" in out:
+        out["timestamp"] = pd.to_datetime(out["timestamp"]).astype("datetime64[ns]")
+    for col in _STATS_BY_TIME_COLUMNS[2:]:
+        out[col] = out[col].astype(np.float64)
+    return out
+
+
+cases = 0
+for k in range(20):
+    df = make(int(rng.integers(2, 2000)))
+    columns = ["depth", "nasc", "count_fish", "label"]
+
+    # 1) descriptive stats
+    expected = pd.DataFrame(
+        [{"variable": c, **describe(pd.to_numeric(df[c], errors="coerce"), df[c])} for c in columns
+         if pd.to_numeric(df[c], errors="coerce").notna().any()]
+    )
+    for backend in backends:
+        got = calc.calculate_descriptive_stats(df, columns, backend=backend)
+        pd.testing.assert_frame_equal(normalized(got), normalized(expected), check_exact=False, rtol=1e-9)
+        cases += 1
+
+    # 2) stats by time
+    # Calendar offsets have no fixed width; the polars backend hands them to pandas
+    for interval in ["1h", "6h", "1D", "45min", "MS", "W-SUN"]:
+        expected = reference_by_time(df, interval, columns)
+        for backend in backends:
+            got = calc.calculate_stats_by_time(df, interval, columns, backend=backend)
+            pd.testing.assert_frame_equal(normalized(got), normalized(expected), check_exact=False, rtol=1e-9)
+            cases += 1
+
+# 3) no column with numeric values: both reports are written with the header only
+empty = pd.DataFrame({"timestamp": pd.date_range("2024-01-01", periods=3, freq="h"), "site": ["x", "y", "z"]})
+with tempfile.TemporaryDirectory() as tmp:
+    for backend in backends:
+        stats = calc.calculate_descriptive_stats(empty, ["site"], backend=backend)
+        assert stats.empty
+        path = Path(tmp) / backend / "stats.txt"
+        calc.save_stats_to_file(stats, path)
+        assert path.read_text(encoding="utf-8") == "Descriptive Statistics\n======================\n"
+
+        by_time = calc.calculate_stats_by_time(empty, "1h", ["site"], backend=backend)
+        assert by_time.empty
+        path = Path(tmp) / backend / "stats_by_time.txt"
+        calc.save_stats_by_time_to_file(by_time, path)
+        assert path.read_text(encoding="utf-8") == "Descriptive Statistics by Time\n==============================\n"
+        cases += 1
+
+print(f"statistics backends match the reference in {cases} cases")
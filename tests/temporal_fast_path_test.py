@@ -0,0 +1,46 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Ensure workspace root is on sys.path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+from aggregation.temporal_aggregator import TemporalAggregator
+
+# aggregate_by_time takes a NumPy bin path for fixed-width mean aggregations; it must match
+# pandas' own resampling on randomized frames (sorted/unsorted, duplicate and missing times, NaNs)
+ta = TemporalAggregator()
+rng = np.random.default_rng(0)
+
+
+def reference(df: pd.DataFrame, interval: str, agg: dict) -> pd.DataFrame:
+    return df.groupby(pd.Grouper(key="timestamp", freq=interval)).agg(agg).reset_index()
+
+
+cases = 0
+for k in range(100):
+    n = int(rng.integers(1, 500))
+    offsets = np.sort(rng.integers(-10**13, 10**13, n)) if k % 2 else rng.integers(0, 10**14, n)
+    if k % 7 == 0:
+        # Repeated timestamps
+        offsets = np.repeat(offsets[: max(1, n // 3)], 3)[:n]
+        n = len(offsets)
+    ts = pd.Timestamp("2024-10-05 13:17:03.123") + pd.to_timedelta(offsets, unit="ns")
+    df = pd.DataFrame({"timestamp": ts, "a": rng.normal(size=n), "b": rng.integers(0, 100, n)})
+    df.loc[rng.random(n) < 0.1, "a"] = np.nan
+    if k % 5 == 0:
+        df.loc[rng.random(n) < 0.1, "timestamp"] = pd.NaT
+    for interval in ["5min", "7min", "1h", "90s", "1D", "2D", "13s"]:
+        for agg in [{"a": "mean"}, {"b": "mean", "a": "mean"}, {"b": "mean"}]:
+            result = ta.aggregate_by_time(df, interval, agg)
+            pd.testing.assert_frame_equal(result, reference(df, interval, agg), check_exact=False, rtol=1e-9, check_freq=False)
+            cases += 1
+
+# Non-mean aggregations and non-fixed offsets go through pandas and must agree as well
+df = pd.DataFrame({"timestamp": pd.date_range("2024-01-30", periods=500, freq="37min"), "a": rng.normal(size=500)})
+for interval, agg in [("10min", {"a": "max"}), ("1h", {"a": "sum"}), ("MS", {"a": "mean"})]:
+    pd.testing.assert_frame_equal(ta.aggregate_by_time(df, interval, agg), reference(df, interval, agg), check_freq=False)
+    cases += 1
+
+print(f"temporal fast path matches pandas resampling in {cases} cases")
@@ -1,16 +1,30 @@
 from __future__ import annotations
 
+import copy
 import hashlib
 import logging
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
 import yaml
 from rich.logging import RichHandler
 
+# Shared pool for artifact writes handed off by write_artifact_async
+_WRITE_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="artifact-writer")
+
 
 def read_config(config_path: Path) -> Dict[str, Any]:
+    # Parsed YAML is cached per (file, mtime), so editing the file still takes effect;
+    # callers get their own copy and may modify it freely
+    path = Path(config_path)
+    return copy.deepcopy(_read_config_cached(str(path.resolve()), path.stat().st_mtime_ns))
+
+
+@lru_cache(maxsize=8)
+def _read_config_cached(config_path: str, mtime_ns: int) -> Dict[str, Any]:
     with open(config_path, "r", encoding="utf-8") as f:
         return yaml.safe_load(f)
 
@@ -19,6 +33,18 @@ def ensure_directory(path: Path) -> None:
     Path(path).mkdir(parents=True, exist_ok=True)
 
 
+def write_artifact(path: Path, data: bytes) -> None:
+    """Write a fully rendered artifact with one write call instead of many small encoder writes."""
+    path = Path(path)
+    ensure_directory(path.parent)
+    path.write_bytes(data)
+
+
+def write_artifact_async(path: Path, data: bytes) -> Future:
+    """Write an already rendered artifact on a background thread; the future resolves once it is on disk."""
+    return _WRITE_POOL.submit(write_artifact, path, data)
+
+
 def setup_logging(level: str = "INFO", log_file: Path | None = None) -> None:
     log_level = getattr(logging, level.upper(), logging.INFO)
     handlers = [RichHandler(rich_tracebacks=True)]
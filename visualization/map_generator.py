@@ -9,7 +9,7 @@ import pandas as pd
 from aggregation.spatial_aggregator import SpatialAggregator
 
 
-from utils.io_helpers import read_config
+from utils.io_helpers import read_config, write_artifact, write_artifact_async
 from pathlib import Path
 
 class HexagonalMapGenerator:
@@ -67,6 +67,9 @@ class HexagonalMapGenerator:
             map_obj.save(f.name)
             webbrowser.open(f.name)
 
-    def save_map(self, map_obj: folium.Map, output_path: Path) -> None:
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        map_obj.save(str(output_path.with_suffix(".html")))
+    def save_map(self, map_obj: folium.Map, output_path: Path, background: bool = False):
+        html = map_obj.get_root().render()
+        if background:
+            return write_artifact_async(output_path.with_suffix(".html"), html.encode("utf8"))
+        write_artifact(output_path.with_suffix(".html"), html.encode("utf8"))
+        return None
@@ -5,6 +5,7 @@ from matplotlib.colors import Normalize
 from matplotlib.cm import ScalarMappable
 import numpy as np
 import h3
+from functools import lru_cache
 
 # Optional: contextily for basemap
 try:
@@ -19,6 +20,29 @@ import geopandas as gpd
 import os
 from pyproj import Transformer
 
+
+@lru_cache(maxsize=1)
+def _sweref_transformer():
+    # Transform from WGS84 (lon, lat) to SWEREF99 TM (easting, northing)
+    return Transformer.from_crs("EPSG:4326", "EPSG:3006", always_xy=True)
+
+
+@lru_cache(maxsize=65536)
+def _hex_vertices(hex_id, sweref):
+    """Boundary vertices of one H3 cell in plot coordinates, cached across map calls.
+
+    A cell's geometry depends only on its id, so repeated maps at the same
+    resolution reuse the reprojected rings instead of rebuilding them.
+    """
+    # h3 returns (lat, lon); convert to (lon, lat)
+    coords = np.asarray(h3.cell_to_boundary(hex_id), dtype=np.float64)[:, ::-1]
+    if sweref:
+        # Reproject to EPSG:3006 for consistent axes and basemap; one call per ring
+        coords = np.column_stack(_sweref_transformer().transform(coords[:, 0], coords[:, 1]))
+    coords.setflags(write=False)
+    return coords
+
+
 def create_matplotlib_hex_map(hex_data, value_column, cmap="viridis", show_colorbar=True, use_basemap=True, title=None, figsize=(12, 10), config_path="config/settings.yaml", show=True, coastline_path=None, east_lim=None, north_lim=None, vmin=None, vmax=None):
     grouped = hex_data.copy()
     if grouped.empty:
@@ -36,24 +60,9 @@ def create_matplotlib_hex_map(hex_data, value_column, cmap="viridis", show_color
     fig, ax = plt.subplots(figsize=figsize)
     patches = []
     values = []
-    # Prepare transformer for SWEREF99 if needed
-    transformer = None
-    if sweref_mode:
-        # Transform from WGS84 (lon, lat) to SWEREF99 TM (easting, northing)
-        transformer = Transformer.from_crs("EPSG:4326", "EPSG:3006", always_xy=True)
-
-    for _, row in grouped.iterrows():
-        hex_id = row.get("h3_hex") or row.get("hex_id")
-        value = row[value_column]
-        boundary = h3.cell_to_boundary(hex_id)
-        # h3 returns list of (lat, lon); convert to (lon, lat)
-        lonlat_coords = [(lon, lat) for lat, lon in boundary]
-        if sweref_mode and transformer is not None:
-            # Reproject to EPSG:3006 for consistent axes and basemap
-            coords = [transformer.transform(lon, lat) for lon, lat in lonlat_coords]
-        else:
-            coords = lonlat_coords
-        polygon = mpatches.Polygon(coords, closed=True)
+    hex_col = "h3_hex" if "h3_hex" in grouped.columns else "hex_id"
+    for hex_id, value in zip(grouped[hex_col], grouped[value_column]):
+        polygon = mpatches.Polygon(_hex_vertices(hex_id, bool(sweref_mode)), closed=True)
         patches.append(polygon)
         values.append(value)
     # Use provided vmin/vmax if available; otherwise compute from data
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import io
 from pathlib import Path
 from typing import List, Union
 
@@ -14,13 +15,59 @@ if sys.platform.startswith("linux") and not os.environ.get("DISPLAY"):
     except Exception:
         pass
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 import seaborn as sns
 
 from analysis.smoothing import DataSmoother
+from utils.io_helpers import write_artifact, write_artifact_async
 from pandas.api import types as ptypes
 
 
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets: positions of ``n_out`` points that keep the line's shape.
+
+    ``x`` must be sorted. The first and last points are always kept; from each bucket in
+    between, the point forming the largest triangle with the previously kept point and
+    the mean of the next bucket is chosen.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    bounds = (np.arange(n_out - 1) * ((n - 2) / (n_out - 2))).astype(np.int64) + 1
+    bounds[-1] = n - 1
+    sizes = np.diff(bounds)
+    # Bucket means, with the last point standing in as the bucket after the final one
+    avg_x = np.append(np.add.reduceat(x[: n - 1], bounds[:-1]) / sizes, x[-1])
+    avg_y = np.append(np.add.reduceat(y[: n - 1], bounds[:-1]) / sizes, y[-1])
+    out = np.empty(n_out, dtype=np.int64)
+    out[0], out[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = bounds[i], bounds[i + 1]
+        area = np.abs((x[a] - avg_x[i + 1]) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y[i + 1] - y[a]))
+        a = lo + int(np.argmax(area))
+        out[i + 1] = a
+    return out
+
+
+def _downsample_line(data: pd.DataFrame, x: str, y: str, max_points: int) -> pd.DataFrame:
+    """Rows of ``data`` chosen by LTTB on (x, y), sorted by x; rows with missing x or y are dropped."""
+    yv = pd.to_numeric(data[y], errors="coerce").to_numpy(dtype=np.float64)
+    # kind "M" covers naive, tz-aware and Arrow-backed timestamps; to_numpy() of the
+    # latter two is an object array, so the int64 values are read from a DatetimeIndex
+    if data[x].dtype.kind == "M":
+        xs = pd.DatetimeIndex(data[x])
+        xv = np.where(xs.isna(), np.nan, xs.asi8).astype(np.float64)
+    else:
+        xv = pd.to_numeric(data[x], errors="coerce").to_numpy(dtype=np.float64)
+    pos = np.flatnonzero(~(np.isnan(xv) | np.isnan(yv)))
+    pos = pos[np.argsort(xv[pos], kind="stable")]
+    # Offset x so nanosecond timestamps keep their precision in the area products
+    xf = xv[pos] - xv[pos[0]] if len(pos) else xv[pos]
+    return data.iloc[pos[_lttb_indices(xf, yv[pos], max_points)]]
+
+
 class TimeSeriesPlotter:
     def __init__(self):
         sns.set(style="whitegrid")
@@ -35,11 +82,20 @@ class TimeSeriesPlotter:
         smooth_method: str = "lowess",
         lowess_frac: float = 0.1,
         figsize: tuple[int, int] = (12, 5),
+        max_points: int | None = 4000,
     ):
+        """Plot one or more columns against ``x``; ``data`` is only read, never modified.
+
+        Lines longer than ``max_points`` are drawn from an LTTB-downsampled subset (points
+        beyond that collapse to sub-pixel width); smoothing still uses every row.
+        """
         y_cols = [y] if isinstance(y, str) else y
         fig, ax = plt.subplots(figsize=figsize)
         for col in y_cols:
-            sns.lineplot(data=data, x=x, y=col, ax=ax, label=col)
+            line_data = data
+            if max_points and len(data) > max_points:
+                line_data = _downsample_line(data, x, col, max_points)
+            sns.lineplot(data=line_data, x=x, y=col, ax=ax, label=col)
             if smooth:
                 s = pd.to_numeric(data[col], errors="coerce")
                 s.index = pd.to_datetime(data[x])
@@ -67,6 +123,7 @@ class TimeSeriesPlotter:
         lowess_frac: float = 0.1,
         figsize: tuple[int, int] = (12, 5),
     ):
+        """Scatter ``y`` against ``x`` with an optional LOWESS overlay; ``data`` is only read, never modified."""
         fig, ax = plt.subplots(figsize=figsize)
         # Make scatter points clearly visible and distinct from any overlay line
         sns.scatterplot(
@@ -147,6 +204,7 @@ class TimeSeriesPlotter:
 
         If `x_column` is provided, produces grouped boxplots of `y_column` by `x_column`.
         If `x_column` is None, produces a single boxplot of `y_column`.
+        `data` is only read, never modified.
         """
         if y_column not in data.columns:
             raise ValueError(f"Column '{y_column}' not found")
@@ -195,8 +253,18 @@ class TimeSeriesPlotter:
         fig.tight_layout()
         return fig
 
-    def save_plot(self, fig, output_path: Path, format: str = "png", close: bool = True) -> None:
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        fig.savefig(output_path.with_suffix(f".{format}"), dpi=300)
+    def save_plot(self, fig, output_path: Path, format: str = "png", close: bool = True, background: bool = False):
+        """Save ``fig``; with ``background=True`` only the file write is deferred and its Future returned.
+
+        Rendering always happens on the calling thread, as matplotlib is not thread-safe.
+        """
+        # Render in memory first; the encoder's many small writes never reach (network) storage
+        buf = io.BytesIO()
+        fig.savefig(buf, format=format, dpi=300)
         if close:
             plt.close(fig)
+        path = output_path.with_suffix(f".{format}")
+        if background:
+            return write_artifact_async(path, buf.getvalue())
+        write_artifact(path, buf.getvalue())
+        return None